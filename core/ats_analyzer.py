@@ -16,8 +16,13 @@ LÓGICA DE FUNCIONAMENTO DETALHADA:
    - Converte .docx usando python-docx (docx2txt)
    - Converte .pdf usando pdfplumber
    - Salva versões .txt para processamento consistente
+   - Conversão e tokenização em paralelo com --workers N (core.ingestao)
+   - Cada arquivo é carregado uma única vez por execução (core.corpus)
+   - Reaproveita texto e tokens do cache de extração quando o arquivo não mudou
 
 2. PRÉ-PROCESSAMENTO DE TEXTO:
+   - Tokenizador compilado: tabelas de tradução em uma única passada,
+     com caminho rápido para texto ASCII (mesmo resultado do pipeline original)
    - Normalização: remove acentos, caracteres especiais
    - Conversão para minúsculas
    - Tokenização: separa em palavras individuais
@@ -32,6 +37,9 @@ LÓGICA DE FUNCIONAMENTO DETALHADA:
 
 4. CÁLCULO DE SIMILARIDADE:
    - Método: presença de palavras-chave da vaga no currículo
+   - Em lote: ats_matriz.score_matrix calcula todos os pares de uma vez
+   - Currículos e vagas quase idênticos (core.deduplicacao) são pontuados
+     uma vez por grupo, reaproveitando o resultado do representante
    - Fórmula: (palavras_presentes / total_palavras_vaga) * 100
    - Threshold: 70% para aprovação
    - Peso adicional para termos técnicos vs comportamentais
@@ -43,9 +51,9 @@ LÓGICA DE FUNCIONAMENTO DETALHADA:
    - Salva versão otimizada quando necessário
 
 DEPENDÊNCIAS:
-- python-docx: para conversão .docx → .txt
-- pdfplumber: para conversão .pdf → .txt
-- nltk: para processamento de linguagem natural
+- python-docx: para conversão .docx → .txt (importado só ao converter .docx)
+- pdfplumber: para conversão .pdf → .txt (importado só ao converter .pdf)
+- core.ats_matriz (numpy): pontuação em lote (importado só ao processar arquivos)
 - os, re, unicodedata: para manipulação de arquivos e texto
 
 EXEMPLO DE FLUXO:
@@ -65,10 +73,10 @@ import os
 import re
 import unicodedata
 from collections import Counter
-import nltk
-from nltk.corpus import stopwords
-import docx
-import pdfplumber
+from functools import lru_cache
+from importlib import metadata
+from core import cache_extracao
+from core import corpus as corpus_ats
 
 # Configurações globais
 STOPWORDS_PORTUGUES = set([
@@ -101,6 +109,43 @@ STOPWORDS_PORTUGUES = set([
     'teremos', 'terão', 'teria', 'teríamos', 'teriam'
 ])
 
+# Versão do tokenizador gravada junto aos tokens no cache de extração
+VERSAO_TOKENIZADOR = '1'
+
+# Cache de extração (desativado com --no-cache)
+_cache_habilitado = True
+_cache_pasta = cache_extracao.PASTA_CACHE_PADRAO
+_cache_tamanho_maximo_mb = cache_extracao.TAMANHO_MAXIMO_MB_PADRAO
+_cache_extracao = None
+
+def configurar_cache(habilitado=True, pasta=cache_extracao.PASTA_CACHE_PADRAO,
+                     tamanho_maximo_mb=cache_extracao.TAMANHO_MAXIMO_MB_PADRAO):
+    """Configura o cache de extração usado por carregar_arquivo."""
+    global _cache_habilitado, _cache_pasta, _cache_tamanho_maximo_mb, _cache_extracao
+    _cache_habilitado = habilitado
+    _cache_pasta = pasta
+    _cache_tamanho_maximo_mb = tamanho_maximo_mb
+    _cache_extracao = cache_extracao.CacheExtracao(pasta, tamanho_maximo_mb) if habilitado else None
+
+def configuracao_cache():
+    """Retorna (habilitado, pasta, tamanho_maximo_mb) do cache de extração."""
+    return _cache_habilitado, _cache_pasta, _cache_tamanho_maximo_mb
+
+def obter_cache():
+    """Retorna o cache de extração ativo ou None se desativado."""
+    global _cache_extracao
+    if _cache_habilitado and _cache_extracao is None:
+        _cache_extracao = cache_extracao.CacheExtracao(_cache_pasta, _cache_tamanho_maximo_mb)
+    return _cache_extracao
+
+@lru_cache(maxsize=None)
+def versao_extrator(pacote):
+    """Retorna a versão instalada do pacote extrator."""
+    try:
+        return metadata.version(pacote)
+    except metadata.PackageNotFoundError:
+        return 'desconhecida'
+
 def remover_acentos(texto):
     """Remove acentos e caracteres especiais do texto."""
     return ''.join(c for c in unicodedata.normalize('NFD', texto)
@@ -117,8 +162,8 @@ def limpar_texto(texto):
     texto = re.sub(r'\d+', '', texto)
     return texto.strip()
 
-def tokenizar(texto):
-    """Tokeniza o texto em palavras relevantes."""
+def tokenizar_legado(texto):
+    """Tokeniza o texto pelo pipeline original (referência do tokenizador compilado)."""
     # Limpa o texto
     texto_limpo = limpar_texto(texto)
     # Divide em palavras
@@ -127,6 +172,77 @@ def tokenizar(texto):
     tokens_filtrados = [token for token in tokens if token not in STOPWORDS_PORTUGUES and len(token) > 2]
     return tokens_filtrados
 
+# Tokenizador compilado: tabelas de tradução pré-calculadas a partir do
+# pipeline original (remover_acentos → lower → remove pontuação e números),
+# aplicadas em uma única passada sobre o texto.
+
+class _TextoSensivelAContexto(Exception):
+    """Caractere cuja normalização depende dos vizinhos (usa o pipeline original)."""
+
+def _limpar_caractere(caractere):
+    """Aplica o pipeline original a um único caractere."""
+    texto = remover_acentos(caractere).lower()
+    texto = re.sub(r'[^\w\s]', '', texto)
+    return re.sub(r'\d+', '', texto)
+
+def _sensivel_a_contexto(caractere):
+    """Indica se o caractere não pode ser normalizado isoladamente."""
+    # 'Σ' minúsculo depende da posição na palavra (sigma final)
+    if caractere == '\u03a3':
+        return True
+    # Marcas combinantes que não são removidas podem ser reordenadas pela NFD
+    return any(unicodedata.combining(c) and unicodedata.category(c) != 'Mn'
+               for c in unicodedata.normalize('NFD', caractere))
+
+class _TabelaUnicode(dict):
+    """Tabela de tradução preenchida sob demanda para caracteres não ASCII."""
+
+    def __missing__(self, codigo):
+        caractere = chr(codigo)
+        if _sensivel_a_contexto(caractere):
+            raise _TextoSensivelAContexto(caractere)
+        resultado = _limpar_caractere(caractere)
+        self[codigo] = resultado
+        return resultado
+
+def _montar_tabelas_ascii():
+    """Monta a tabela de bytes e os bytes removidos para texto ASCII puro."""
+    tabela = bytearray(range(256))
+    remover = bytearray()
+    for codigo in range(128):
+        resultado = _limpar_caractere(chr(codigo))
+        if resultado:
+            tabela[codigo] = ord(resultado)
+        else:
+            remover.append(codigo)
+    return bytes(tabela), bytes(remover)
+
+_TABELA_ASCII, _REMOVER_ASCII = _montar_tabelas_ascii()
+_TABELA_UNICODE = _TabelaUnicode((codigo, _limpar_caractere(chr(codigo))) for codigo in range(128))
+_PADRAO_TOKEN = re.compile(r'\S{3,}')
+
+def normalizar_texto(texto):
+    """Normaliza o texto como limpar_texto, em uma única passada de tradução."""
+    # Caminho rápido: texto ASCII puro dispensa normalização Unicode
+    if texto.isascii():
+        return texto.encode('ascii').translate(_TABELA_ASCII, _REMOVER_ASCII).decode('ascii')
+    try:
+        return texto.translate(_TABELA_UNICODE)
+    except _TextoSensivelAContexto:
+        return limpar_texto(texto)
+
+def iterar_tokens(texto):
+    """Gera os tokens relevantes do texto sob demanda."""
+    for correspondencia in _PADRAO_TOKEN.finditer(normalizar_texto(texto)):
+        token = correspondencia.group()
+        if token not in STOPWORDS_PORTUGUES:
+            yield token
+
+def tokenizar(texto):
+    """Tokeniza o texto em palavras relevantes."""
+    return [token for token in normalizar_texto(texto).split()
+            if len(token) > 2 and token not in STOPWORDS_PORTUGUES]
+
 def calcular_frequencia(tokens):
     """Calcula frequência relativa dos tokens."""
     if not tokens:
@@ -139,6 +255,7 @@ def calcular_frequencia(tokens):
 def converter_docx_para_txt(caminho_docx):
     """Converte arquivo .docx para .txt usando python-docx."""
     try:
+        import docx
         doc = docx.Document(caminho_docx)
         texto = []
         for paragrafo in doc.paragraphs:
@@ -151,6 +268,7 @@ def converter_docx_para_txt(caminho_docx):
 def converter_pdf_para_txt(caminho_pdf):
     """Converte arquivo .pdf para .txt usando pdfplumber."""
     try:
+        import pdfplumber
         with pdfplumber.open(caminho_pdf) as pdf:
             texto = []
             for pagina in pdf.pages:
@@ -170,6 +288,52 @@ def salvar_arquivo_txt(caminho_origem, texto, extensao_origem):
     except Exception as e:
         print(f"Erro ao salvar {caminho_txt}: {e}")
 
+# Extratores por extensão: (pacote usado na chave do cache, função de conversão)
+EXTRATORES = {
+    '.docx': ('python-docx', converter_docx_para_txt),
+    '.pdf': ('pdfplumber', converter_pdf_para_txt)
+}
+
+def extrair_documento(caminho, extensao):
+    """Converte .docx/.pdf em (texto, tokens), usando o cache de extração."""
+    pacote, conversor = EXTRATORES[extensao]
+    cache = obter_cache()
+    chave = None
+
+    if cache is not None:
+        try:
+            chave = cache.gerar_chave(cache_extracao.hash_arquivo(caminho),
+                                      pacote, versao_extrator(pacote))
+        except OSError as e:
+            print(f"Erro ao calcular hash de {caminho}: {e}")
+
+    if chave is not None:
+        entrada = cache.obter(chave)
+        if entrada is not None:
+            texto = entrada['texto']
+            if entrada.get('versao_tokenizador') == VERSAO_TOKENIZADOR:
+                tokens = entrada['tokens']
+            else:
+                tokens = tokenizar(texto)
+                cache.salvar(chave, texto, tokens, VERSAO_TOKENIZADOR)
+
+            # Documento inalterado: só recria o .txt se ele tiver sido apagado
+            if not os.path.exists(caminho.replace(extensao, '.txt')):
+                salvar_arquivo_txt(caminho, texto, extensao)
+            return texto, tokens
+
+    texto = conversor(caminho)
+    if not texto:
+        return "", []
+
+    salvar_arquivo_txt(caminho, texto, extensao)
+    tokens = tokenizar(texto)
+
+    if chave is not None:
+        cache.salvar(chave, texto, tokens, VERSAO_TOKENIZADOR)
+
+    return texto, tokens
+
 def carregar_arquivo(caminho):
     """Carrega arquivo de qualquer formato suportado."""
     if not os.path.exists(caminho):
@@ -186,22 +350,26 @@ def carregar_arquivo(caminho):
             print(f"Erro ao ler {caminho}: {e}")
             return ""
 
-    elif extensao == '.docx':
-        texto = converter_docx_para_txt(caminho)
-        if texto:
-            salvar_arquivo_txt(caminho, texto, '.docx')
-        return texto
-
-    elif extensao == '.pdf':
-        texto = converter_pdf_para_txt(caminho)
-        if texto:
-            salvar_arquivo_txt(caminho, texto, '.pdf')
+    elif extensao in EXTRATORES:
+        texto, _ = extrair_documento(caminho, extensao)
         return texto
 
     else:
         print(f"Formato não suportado: {extensao}")
         return ""
 
+def carregar_documento(caminho):
+    """Carrega arquivo e retorna (texto, tokens), reaproveitando o cache."""
+    extensao = os.path.splitext(caminho)[1].lower()
+
+    if extensao in EXTRATORES and os.path.exists(caminho):
+        return extrair_documento(caminho, extensao)
+
+    texto = carregar_arquivo(caminho)
+    if not texto:
+        return "", []
+    return texto, tokenizar(texto)
+
 def analisar_compatibilidade(tokens_curriculo, tokens_vaga):
     """Calcula pontuação de compatibilidade entre currículo e vaga."""
     if not tokens_vaga:
@@ -249,7 +417,7 @@ def gerar_recomendacoes(palavras_faltantes, pontuacao):
 
     return recomendacoes
 
-def processar_arquivos(pasta_curriculos, pasta_vagas):
+def processar_arquivos(pasta_curriculos, pasta_vagas, workers=1, corpus=None, deduplicador=None):
     """Processa todos os arquivos nas pastas especificadas."""
     if not os.path.exists(pasta_curriculos):
         print(f"Pasta de currículos não encontrada: {pasta_curriculos}")
@@ -279,35 +447,53 @@ def processar_arquivos(pasta_curriculos, pasta_vagas):
     print(f"Encontrados {len(arquivos_curriculo)} arquivo(s) de curriculo")
     print()
 
-    # Processa cada combinação vaga-currículo
-    for vaga_file in arquivos_vaga:
-        caminho_vaga = os.path.join(pasta_vagas, vaga_file)
-        print(f"Analisando vaga: {vaga_file}")
-
-        # Carrega e processa vaga
-        texto_vaga = carregar_arquivo(caminho_vaga)
-        if not texto_vaga:
-            continue
-
-        tokens_vaga = tokenizar(texto_vaga)
-        print(f"   Palavras-chave na vaga: {len(tokens_vaga)}")
-
-        # Processa cada currículo
-        for curriculo_file in arquivos_curriculo:
-            caminho_curriculo = os.path.join(pasta_curriculos, curriculo_file)
-            print(f"   Analisando curriculo: {curriculo_file}")
-
-            # Carrega e processa currículo
-            texto_curriculo = carregar_arquivo(caminho_curriculo)
-            if not texto_curriculo:
-                continue
-
-            tokens_curriculo = tokenizar(texto_curriculo)
-            print(f"      Palavras no curriculo: {len(tokens_curriculo)}")
-
-            # Calcula compatibilidade
-            pontuacao, palavras_faltantes = analisar_compatibilidade(tokens_curriculo, tokens_vaga)
-
+    # Carrega vagas e currículos uma única vez (em paralelo com --workers)
+    if corpus is None:
+        corpus = corpus_ats.Corpus(workers)
+
+    documentos_vaga = corpus.documentos([os.path.join(pasta_vagas, f) for f in arquivos_vaga])
+    documentos_curriculo = corpus.documentos([os.path.join(pasta_curriculos, f) for f in arquivos_curriculo])
+
+    for documento in documentos_vaga + documentos_curriculo:
+        if documento.erro:
+            print(f"Erro ao processar {documento.arquivo}: {documento.erro}")
+
+    vagas = [d for d in documentos_vaga if d.valido]
+    curriculos = [d for d in documentos_curriculo if d.valido]
+
+    # Documentos quase idênticos são pontuados uma vez, pelo representante do grupo
+    grupo_curriculos = list(range(len(curriculos)))
+    grupo_vagas = list(range(len(vagas)))
+    if deduplicador is not None:
+        agrupamento_curriculos = deduplicador.agrupar(curriculos)
+        agrupamento_vagas = deduplicador.agrupar(vagas)
+        grupo_curriculos = agrupamento_curriculos.representante
+        grupo_vagas = agrupamento_vagas.representante
+    linha = {i: k for k, i in enumerate(sorted(set(grupo_curriculos)))}
+    coluna = {j: k for k, j in enumerate(sorted(set(grupo_vagas)))}
+
+    # Calcula todas as pontuações de uma vez (numpy só é carregado aqui)
+    from core import ats_matriz
+    matriz = ats_matriz.score_matrix([curriculos[i] for i in linha], [vagas[j] for j in coluna])
+
+    # Exibe cada combinação vaga-currículo
+    for j, vaga in enumerate(vagas):
+        print(f"Analisando vaga: {vaga.arquivo}")
+        print(f"   Palavras-chave na vaga: {vaga.total_tokens}")
+        if grupo_vagas[j] != j:
+            print(f"   Quase identica a {vagas[grupo_vagas[j]].arquivo} (pontuacoes reaproveitadas)")
+
+        for i, curriculo in enumerate(curriculos):
+            print(f"   Analisando curriculo: {curriculo.arquivo}")
+            print(f"      Palavras no curriculo: {curriculo.total_tokens}")
+
+            # Pontuação já calculada; palavras faltantes montadas sob demanda
+            k, m = linha[grupo_curriculos[i]], coluna[grupo_vagas[j]]
+            pontuacao = matriz.pontuacao(k, m)
+            palavras_faltantes = matriz.palavras_faltantes(k, m)
+
+            if grupo_curriculos[i] != i:
+                print(f"      Quase identico a {curriculos[grupo_curriculos[i]].arquivo} (pontuacao reaproveitada)")
             print(f"      Pontuacao ATS: {pontuacao}%")
 
             # Gera recomendações
@@ -320,7 +506,16 @@ def processar_arquivos(pasta_curriculos, pasta_vagas):
 
             print()
 
-def main():
+    if deduplicador is not None:
+        total_pares = len(curriculos) * len(vagas)
+        pares_calculados = len(linha) * len(coluna)
+        agrupamento_curriculos.imprimir_resumo('curriculo(s)')
+        agrupamento_vagas.imprimir_resumo('vaga(s)')
+        if total_pares:
+            print(f"Deduplicacao: {pares_calculados} de {total_pares} pares pontuados "
+                  f"({1 - pares_calculados / total_pares:.1%} evitados)")
+
+def main(workers=1, corpus=None, deduplicador=None):
     """Funcao principal do modulo ATS Analyzer."""
     print("ATS Analyzer - Iniciando analise...")
     print("=" * 60)
@@ -334,7 +529,7 @@ def main():
     os.makedirs(pasta_vagas, exist_ok=True)
 
     # Processa arquivos
-    processar_arquivos(pasta_curriculos, pasta_vagas)
+    processar_arquivos(pasta_curriculos, pasta_vagas, workers, corpus, deduplicador)
 
     print("=" * 60)
     print("Analise ATS concluida!")
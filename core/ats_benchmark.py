@@ -0,0 +1,461 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ATS Benchmark - Medições de Desempenho do Pipeline ATS
+======================================================
+
+DESCRIÇÃO:
+Este módulo reúne medições repetíveis de desempenho das etapas do pipeline
+ATS: a suíte de benchmarks por etapa (python main.py bench) e o
+micro-benchmark do tokenizador.
+
+SUÍTE DE BENCHMARKS (python main.py bench):
+
+1. ETAPAS MEDIDAS:
+   - tokenizar: tokenização de um texto de currículo
+   - analisar_compatibilidade: pontuação de um currículo contra uma vaga
+   - converter_pdf_para_txt / converter_docx_para_txt: extração de texto
+   - organizado: execução completa do ATSOrganizer (análise + CSV)
+
+2. DOCUMENTOS SINTÉTICOS:
+   - Vagas e currículos gerados com semente fixa por core.gerador_corpus,
+     então duas execuções medem exatamente o mesmo trabalho
+   - Tamanhos padrão: 10, 1.000 e 100.000 documentos
+   - Conversões usam um conjunto pequeno de arquivos PDF/DOCX gerados,
+     reutilizados em ciclo, e por padrão vão até 1.000 documentos
+     (--sem-limite mede todos os tamanhos)
+
+3. MÉTRICAS:
+   - throughput (documentos/s) e latência p50/p95 por documento
+   - organizado: latência de cada execução completa e memória por documento
+     em ids (core.vocabulario) comparada à representação em lista de tokens
+   - pico de memória medido com tracemalloc em uma passada separada,
+     para não distorcer os tempos; nas etapas por documento (que não
+     acumulam resultados) a passada usa uma amostra de 20 documentos
+
+4. COMPARAÇÃO COM BASELINE:
+   - Resultados gravados em JSON (padrão log/benchmark.json)
+   - Com --baseline, cada etapa/tamanho é comparado com a execução salva
+   - Queda de throughput acima de 10% é reportada como regressão
+
+MICRO-BENCHMARK DO TOKENIZADOR (--tokenizador):
+   - Compara tokenizar (tokenizador compilado) com tokenizar_legado
+     (pipeline original: remover_acentos → lower → re.sub → split → filtro)
+   - Usa os textos de curriculos/ e vagas/, em versão acentuada e em versão
+     ASCII pura, para medir também o caminho rápido ASCII
+   - Confere se os dois produzem exatamente os mesmos tokens
+   - Reporta o melhor tempo de N repetições e o ganho (speedup)
+
+DEPENDÊNCIAS:
+- core.ats_analyzer: etapas medidas
+- core.ats_organizer: execução completa do sistema organizado
+- core.gerador_corpus: documentos sintéticos (.txt, .docx, .pdf)
+- time, tracemalloc: medição de tempo e memória
+
+EXEMPLO DE USO:
+python main.py bench --tamanhos 10,1000 --baseline log/benchmark_base.json
+python core/ats_benchmark.py --tokenizador
+
+Autor: Cara Core Informática
+Data: 2025
+Licença: MIT
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import platform
+import argparse
+import itertools
+import tempfile
+import tracemalloc
+import contextlib
+from datetime import datetime
+from importlib import metadata
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import ats_analyzer
+from core import ats_organizer
+from core import corpus as corpus_ats
+from core import gerador_corpus
+from core import vocabulario
+
+VERSAO_RESULTADO = 1
+
+# Tamanhos padrão (quantidade de documentos por etapa)
+TAMANHOS_PADRAO = (10, 1000, 100000)
+
+ETAPAS = ('tokenizar', 'analisar_compatibilidade', 'converter_pdf_para_txt',
+          'converter_docx_para_txt', 'organizado')
+
+# Tamanho máximo padrão das etapas de conversão (lentas por natureza)
+LIMITES_ETAPA = {
+    'converter_pdf_para_txt': 1000,
+    'converter_docx_para_txt': 1000
+}
+
+ARQUIVO_SAIDA_PADRAO = 'log/benchmark.json'
+
+# Queda de throughput tolerada antes de apontar regressão
+TOLERANCIA_REGRESSAO = 0.10
+
+SEMENTE_PADRAO = 42
+
+# Quantidade de arquivos PDF/DOCX gerados e reutilizados em ciclo
+TAMANHO_POOL_ARQUIVOS = 20
+
+# Documentos da passada de memória nas etapas por documento
+AMOSTRA_MEMORIA = 20
+
+# Quantidade de vagas usadas nas etapas de pontuação
+QUANTIDADE_VAGAS = 10
+
+PACOTES_REGISTRADOS = ('numpy', 'pandas', 'pdfplumber', 'python-docx', 'nltk')
+
+def carregar_textos_exemplo(pastas=('curriculos', 'vagas')):
+    """Carrega os textos .txt das pastas de exemplo (inclui subpastas)."""
+    textos = []
+    for pasta in pastas:
+        for raiz, _, arquivos in os.walk(pasta):
+            for arquivo in sorted(arquivos):
+                if arquivo.lower().endswith('.txt'):
+                    with open(os.path.join(raiz, arquivo), 'r', encoding='utf-8') as f:
+                        textos.append(f.read())
+    return textos
+
+def medir(funcao, textos, repeticoes):
+    """Retorna o melhor tempo (s) de processar todos os textos."""
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        for texto in textos:
+            funcao(texto)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+def comparar_tokenizadores(textos, repeticoes=5):
+    """Compara o tokenizador compilado com o pipeline original."""
+    identicos = all(ats_analyzer.tokenizar(t) == ats_analyzer.tokenizar_legado(t) for t in textos)
+    tempo_legado = medir(ats_analyzer.tokenizar_legado, textos, repeticoes)
+    tempo_compilado = medir(ats_analyzer.tokenizar, textos, repeticoes)
+    total_caracteres = sum(len(t) for t in textos)
+
+    return {
+        'documentos': len(textos),
+        'caracteres': total_caracteres,
+        'identicos': identicos,
+        'tempo_legado_s': tempo_legado,
+        'tempo_compilado_s': tempo_compilado,
+        'speedup': tempo_legado / tempo_compilado if tempo_compilado else float('inf')
+    }
+
+def imprimir_comparacao(titulo, resultado):
+    """Exibe o resultado de uma comparação de tokenizadores."""
+    print(f"\n{titulo}")
+    print(f"   Documentos: {resultado['documentos']} ({resultado['caracteres']} caracteres)")
+    print(f"   Tokens idênticos: {'Sim' if resultado['identicos'] else 'NÃO'}")
+    print(f"   Pipeline original: {resultado['tempo_legado_s'] * 1000:.2f} ms")
+    print(f"   Tokenizador compilado: {resultado['tempo_compilado_s'] * 1000:.2f} ms")
+    print(f"   Ganho: {resultado['speedup']:.1f}x")
+
+def benchmark_tokenizador(repeticoes=5, fator=20):
+    """Executa o micro-benchmark do tokenizador com textos acentuados e ASCII."""
+    textos = [texto * fator for texto in carregar_textos_exemplo()]
+    if not textos:
+        print("Nenhum texto encontrado em curriculos/ ou vagas/")
+        return {}
+
+    textos_ascii = [ats_analyzer.remover_acentos(texto).encode('ascii', 'ignore').decode('ascii')
+                    for texto in textos]
+
+    resultados = {
+        'acentuado': comparar_tokenizadores(textos, repeticoes),
+        'ascii': comparar_tokenizadores(textos_ascii, repeticoes)
+    }
+
+    print("MICRO-BENCHMARK DO TOKENIZADOR")
+    print("=" * 60)
+    imprimir_comparacao("Textos com acentuação:", resultados['acentuado'])
+    imprimir_comparacao("Textos ASCII puros:", resultados['ascii'])
+    return resultados
+
+def percentil(valores_ordenados, p):
+    """Percentil p (0-100) por posição mais próxima em uma lista ordenada."""
+    if not valores_ordenados:
+        return 0.0
+    indice = round(p / 100 * (len(valores_ordenados) - 1))
+    return valores_ordenados[indice]
+
+def medir_memoria(funcao):
+    """Executa a função sob tracemalloc e retorna o pico de memória em MB."""
+    tracemalloc.start()
+    try:
+        funcao()
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return pico / (1024 * 1024)
+
+def resumir(etapa, tamanho, latencias, tempo_total, memoria_pico_mb, unidade='documento'):
+    """Monta o registro de resultado de uma etapa/tamanho."""
+    latencias = sorted(latencias)
+    return {
+        'etapa': etapa,
+        'tamanho': tamanho,
+        'tempo_total_s': round(tempo_total, 6),
+        'throughput_docs_s': round(tamanho / tempo_total, 3) if tempo_total else None,
+        'latencia_unidade': unidade,
+        'latencia_p50_ms': round(percentil(latencias, 50) * 1000, 4),
+        'latencia_p95_ms': round(percentil(latencias, 95) * 1000, 4),
+        'memoria_pico_mb': round(memoria_pico_mb, 3)
+    }
+
+def medir_por_documento(funcao, argumentos):
+    """Mede a latência de cada chamada; argumentos é um iterável (gerado sob demanda)."""
+    latencias = []
+    relogio = time.perf_counter
+    for argumento in argumentos:
+        inicio = relogio()
+        funcao(*argumento)
+        latencias.append(relogio() - inicio)
+    return latencias
+
+class SuiteBenchmark:
+    """Benchmarks repetíveis de cada etapa do pipeline ATS."""
+
+    def __init__(self, semente=SEMENTE_PADRAO, sem_limite=False, workers=1):
+        """Inicializa a suíte com semente fixa e pasta temporária de trabalho."""
+        self.semente = semente
+        self.sem_limite = sem_limite
+        self.workers = workers
+        self.gerador = gerador_corpus.GeradorCorpus(semente)
+        self.pasta_temp = None
+        self.resultados = []
+
+    def textos(self, quantidade):
+        """Textos de currículos sintéticos (mesma semente → mesmos textos)."""
+        for i in range(quantidade):
+            yield self.gerador.curriculo_da_vaga(i, QUANTIDADE_VAGAS)[1]['texto']
+
+    def tokens_vagas(self):
+        """Tokens das vagas sintéticas usadas na pontuação."""
+        return [ats_analyzer.tokenizar(self.gerador.vaga(j)['texto']) for j in range(QUANTIDADE_VAGAS)]
+
+    def argumentos_etapa(self, etapa, tamanho):
+        """Retorna uma função que gera os argumentos de cada chamada da etapa."""
+        if etapa == 'tokenizar':
+            return lambda: ((texto,) for texto in self.textos(tamanho))
+
+        if etapa == 'analisar_compatibilidade':
+            vagas = self.tokens_vagas()
+            return lambda: ((ats_analyzer.tokenizar(texto), vagas[i % len(vagas)])
+                            for i, texto in enumerate(self.textos(tamanho)))
+
+        formato = 'pdf' if etapa == 'converter_pdf_para_txt' else 'docx'
+        pool = [gerador_corpus.escrever_documento(os.path.join(self.pasta_temp, f"documento_{i}"), texto, formato)
+                for i, texto in enumerate(self.textos(TAMANHO_POOL_ARQUIVOS))]
+        return lambda: ((pool[i % len(pool)],) for i in range(tamanho))
+
+    def medir_etapa(self, etapa, tamanho):
+        """Mede uma etapa por documento: tempos sem tracemalloc, memória em outra passada."""
+        funcao = getattr(ats_analyzer, etapa)
+        gerar_argumentos = self.argumentos_etapa(etapa, tamanho)
+
+        latencias = medir_por_documento(funcao, gerar_argumentos())
+        amostra = lambda: itertools.islice(gerar_argumentos(), AMOSTRA_MEMORIA)
+        memoria = medir_memoria(lambda: medir_por_documento(funcao, amostra()))
+        return resumir(etapa, tamanho, latencias, sum(latencias), memoria)
+
+    def montar_estrutura_organizada(self, tamanho):
+        """Gera vagas/<vaga>/curriculos com os currículos sintéticos em .txt."""
+        pasta_destino = os.path.join(self.pasta_temp, f"corpus_{tamanho}")
+        gerador_corpus.gerar_corpus(pasta_destino, min(QUANTIDADE_VAGAS, tamanho), tamanho,
+                                    semente=self.semente, pesos_formatos={'txt': 1})
+        return os.path.join(pasta_destino, 'vagas')
+
+    def executar_organizado(self, pasta_base):
+        """Executa o sistema organizado completo, sem saída no console; retorna o corpus."""
+        organizer = ats_organizer.ATSOrganizer(
+            pasta_base=pasta_base, workers=self.workers,
+            arquivo_resultados=os.path.join(self.pasta_temp, 'resultados.csv'),
+            corpus=corpus_ats.Corpus(self.workers, vocabulario.Vocabulario())
+        )
+        with open(os.devnull, 'w', encoding='utf-8') as nulo, contextlib.redirect_stdout(nulo):
+            organizer.executar_analise_organizada()
+            organizer.exportar_resultados()
+        return organizer.corpus
+
+    def medir_organizado(self, tamanho):
+        """Mede execuções completas do ATSOrganizer (latência por execução)."""
+        pasta_base = self.montar_estrutura_organizada(tamanho)
+        repeticoes = 3 if tamanho <= 1000 else 1
+
+        latencias = []
+        for _ in range(repeticoes):
+            inicio = time.perf_counter()
+            corpus = self.executar_organizado(pasta_base)
+            latencias.append(time.perf_counter() - inicio)
+        memoria_documentos = corpus.memoria()
+
+        memoria = medir_memoria(lambda: self.executar_organizado(pasta_base))
+        shutil.rmtree(os.path.dirname(pasta_base), ignore_errors=True)
+        resultado = resumir('organizado', tamanho, latencias, min(latencias), memoria, unidade='execucao')
+        resultado['repeticoes'] = repeticoes
+        resultado['bytes_por_documento'] = memoria_documentos['bytes_por_documento']
+        resultado['bytes_por_documento_lista_tokens'] = memoria_documentos['bytes_por_documento_lista_tokens']
+        resultado['bytes_vocabulario'] = memoria_documentos['bytes_vocabulario']
+        return resultado
+
+    def executar(self, tamanhos=TAMANHOS_PADRAO, etapas=ETAPAS):
+        """Executa as etapas em cada tamanho e retorna o relatório completo."""
+        self.pasta_temp = tempfile.mkdtemp(prefix='ats_bench_')
+        try:
+            for etapa in etapas:
+                for tamanho in tamanhos:
+                    limite = LIMITES_ETAPA.get(etapa)
+                    if limite and tamanho > limite and not self.sem_limite:
+                        print(f"   {etapa} [{tamanho}]: ignorado (acima de {limite}; use --sem-limite)")
+                        continue
+
+                    print(f"   {etapa} [{tamanho}]: medindo...", flush=True)
+                    if etapa == 'organizado':
+                        resultado = self.medir_organizado(tamanho)
+                    else:
+                        resultado = self.medir_etapa(etapa, tamanho)
+                    self.resultados.append(resultado)
+        finally:
+            shutil.rmtree(self.pasta_temp, ignore_errors=True)
+
+        return self.relatorio()
+
+    def relatorio(self):
+        """Relatório em formato JSON, com o ambiente da execução."""
+        pacotes = {}
+        for pacote in PACOTES_REGISTRADOS:
+            try:
+                pacotes[pacote] = metadata.version(pacote)
+            except metadata.PackageNotFoundError:
+                pacotes[pacote] = None
+
+        return {
+            'versao': VERSAO_RESULTADO,
+            'data': datetime.now().isoformat(timespec='seconds'),
+            'semente': self.semente,
+            'ambiente': {
+                'python': platform.python_version(),
+                'plataforma': platform.platform(),
+                'processadores': os.cpu_count(),
+                'pacotes': pacotes
+            },
+            'resultados': self.resultados
+        }
+
+def imprimir_resultados(relatorio):
+    """Exibe a tabela de resultados da suíte."""
+    print(f"\n{'Etapa':<26}{'Docs':>8}{'Docs/s':>12}{'p50 ms':>10}{'p95 ms':>10}{'Mem MB':>9}")
+    print("-" * 75)
+    for r in relatorio['resultados']:
+        print(f"{r['etapa']:<26}{r['tamanho']:>8}{r['throughput_docs_s']:>12.1f}"
+              f"{r['latencia_p50_ms']:>10.3f}{r['latencia_p95_ms']:>10.3f}{r['memoria_pico_mb']:>9.2f}")
+
+    for r in relatorio['resultados']:
+        if 'bytes_por_documento' in r:
+            print(f"organizado [{r['tamanho']}]: {r['bytes_por_documento']:.0f} bytes/documento em ids "
+                  f"(lista de tokens: {r['bytes_por_documento_lista_tokens']:.0f})")
+
+def salvar_relatorio(relatorio, arquivo_saida):
+    """Grava o relatório em JSON."""
+    pasta = os.path.dirname(arquivo_saida)
+    if pasta:
+        os.makedirs(pasta, exist_ok=True)
+    with open(arquivo_saida, 'w', encoding='utf-8') as f:
+        json.dump(relatorio, f, ensure_ascii=False, indent=2)
+
+def comparar_baseline(relatorio, baseline, tolerancia=TOLERANCIA_REGRESSAO):
+    """Compara throughput com o baseline; retorna as regressões encontradas."""
+    anteriores = {(r['etapa'], r['tamanho']): r for r in baseline.get('resultados', [])}
+    regressoes = []
+
+    print(f"\nComparação com baseline de {baseline.get('data', '?')}:")
+    for r in relatorio['resultados']:
+        anterior = anteriores.get((r['etapa'], r['tamanho']))
+        if not anterior or not anterior.get('throughput_docs_s') or not r['throughput_docs_s']:
+            print(f"   {r['etapa']} [{r['tamanho']}]: sem baseline")
+            continue
+
+        variacao = r['throughput_docs_s'] / anterior['throughput_docs_s'] - 1
+        regressao = variacao < -tolerancia
+        marcador = "REGRESSÃO" if regressao else "ok"
+        print(f"   {r['etapa']} [{r['tamanho']}]: {variacao * 100:+.1f}% throughput, "
+              f"p95 {anterior['latencia_p95_ms']:.3f} → {r['latencia_p95_ms']:.3f} ms ({marcador})")
+        if regressao:
+            regressoes.append({'etapa': r['etapa'], 'tamanho': r['tamanho'], 'variacao': variacao})
+
+    return regressoes
+
+def executar_benchmark(tamanhos=TAMANHOS_PADRAO, etapas=ETAPAS, arquivo_saida=ARQUIVO_SAIDA_PADRAO,
+                       arquivo_baseline=None, sem_limite=False, workers=1, semente=SEMENTE_PADRAO):
+    """Executa a suíte, grava o JSON e compara com o baseline; retorna as regressões."""
+    print("BENCHMARK DO PIPELINE ATS")
+    print("=" * 60)
+
+    suite = SuiteBenchmark(semente=semente, sem_limite=sem_limite, workers=workers)
+    relatorio = suite.executar(tamanhos, etapas)
+    imprimir_resultados(relatorio)
+
+    salvar_relatorio(relatorio, arquivo_saida)
+    print(f"\nResultados gravados em {arquivo_saida}")
+
+    if not arquivo_baseline:
+        return []
+
+    with open(arquivo_baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressoes = comparar_baseline(relatorio, baseline)
+    if regressoes:
+        print(f"\n{len(regressoes)} regressão(ões) acima de {TOLERANCIA_REGRESSAO * 100:.0f}%")
+    return regressoes
+
+def ler_tamanhos(valor):
+    """Converte '10,1000,100000' em uma tupla de inteiros."""
+    return tuple(int(parte) for parte in valor.split(',') if parte.strip())
+
+def ler_etapas(valor):
+    """Converte 'tokenizar,organizado' em uma tupla de etapas válidas."""
+    etapas = tuple(parte.strip() for parte in valor.split(',') if parte.strip())
+    invalidas = [etapa for etapa in etapas if etapa not in ETAPAS]
+    if invalidas:
+        raise argparse.ArgumentTypeError(f"etapa(s) desconhecida(s): {', '.join(invalidas)}")
+    return etapas
+
+def criar_parser():
+    """Cria o parser de argumentos do benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmarks do pipeline ATS")
+    parser.add_argument('--tamanhos', type=ler_tamanhos, default=TAMANHOS_PADRAO,
+                        help="quantidades de documentos, ex.: 10,1000,100000")
+    parser.add_argument('--etapas', type=ler_etapas, default=ETAPAS,
+                        help=f"etapas medidas ({','.join(ETAPAS)})")
+    parser.add_argument('--saida', default=ARQUIVO_SAIDA_PADRAO, help="arquivo JSON de resultados")
+    parser.add_argument('--baseline', default=None, help="JSON de uma execução anterior para comparação")
+    parser.add_argument('--sem-limite', action='store_true',
+                        help="mede as conversões também acima de 1000 documentos")
+    parser.add_argument('--tokenizador', action='store_true',
+                        help="executa apenas o micro-benchmark do tokenizador")
+    return parser
+
+def main(argv=None):
+    """Função principal do benchmark."""
+    args = criar_parser().parse_args(argv)
+    if args.tokenizador:
+        benchmark_tokenizador()
+        return 0
+
+    regressoes = executar_benchmark(args.tamanhos, args.etapas, args.saida,
+                                    args.baseline, args.sem_limite)
+    return 1 if regressoes else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,7 +14,8 @@ LÓGICA DE FUNCIONAMENTO:
    - Carrega currículos da pasta curriculos/
    - Converte PDF/DOCX para TXT se necessário
    - Executa análise ATS contra todas as vagas disponíveis
-   - Calcula pontuação para cada combinação currículo-vaga
+   - Usa índice invertido persistente: cada currículo consulta apenas as
+     vagas que compartilham termos com ele (top-k por pontuação)
 
 2. FILTRAGEM INTELIGENTE:
    - Seleciona a melhor combinação currículo-vaga baseada na pontuação
@@ -24,7 +25,17 @@ LÓGICA DE FUNCIONAMENTO:
 3. ENVIO CONDICIONAL:
    - Envia email apenas para combinações aprovadas
    - Anexa currículo convertido (TXT) para compatibilidade ATS
-   - Registra status e pontuação no log
+   - Aprovadas entram na fila persistente (fila_envio.py), que libera os
+     envios conforme max_envios_por_dia, horario_funcionamento e o ritmo do
+     balde de tokens, em ordem de pontuação ATS
+   - O que não foi liberado fica para a próxima execução: o processo informa
+     o horário do próximo envio e termina, em vez de dormir
+   - Mensagens montadas e enfileiradas em uma caixa de saída assíncrona
+     (envio_assincrono.py): conexão SMTP reaproveitada e delay_entre_emails
+     por conta, sem bloquear o processo principal
+   - Registra status e pontuação no log a cada envio concluído: uma inserção
+     no registro SQLite (registro_envios.py); log_respostas.xlsx é exportado
+     ao final da execução
 
 4. RELATÓRIOS E MONITORAMENTO:
    - Gera relatório de análise pré-envio
@@ -33,13 +44,24 @@ LÓGICA DE FUNCIONAMENTO:
 
 INTEGRAÇÃO COM SISTEMA EXISTENTE:
 - Utiliza ats_analyzer.py para análise técnica
+- Utiliza indice_vagas.py para consultar só as vagas com termos em comum
+- Utiliza corpus.py para carregar cada currículo e vaga uma única vez
+- Utiliza cache_planilhas.py para ler empresas.xlsx (snapshot colunar)
+- Utiliza casador_empresas.py para achar as empresas de cada vaga aprovada
+- Utiliza fila_envio.py para a fila persistente de envios
+- Utiliza envio_assincrono.py para enviar os emails
+- Utiliza registro_envios.py como log oficial dos envios
 - Mantém compatibilidade com sistema de email atual
 - Adiciona coluna 'Pontuacao_ATS' na planilha de log
 
 DEPENDÊNCIAS:
 - pandas: manipulação de planilhas
 - core.ats_analyzer: análise ATS
-- yagmail: envio de emails
+- core.cache_planilhas: snapshot de empresas.xlsx
+- core.casador_empresas: planilha de empresas indexada (Aho-Corasick)
+- core.fila_envio: fila de envio em SQLite
+- core.envio_assincrono: caixa de saída SMTP (asyncio + smtplib)
+- core.registro_envios: log de envios em SQLite (WAL)
 - datetime: timestamps
 
 EXEMPLO DE FLUXO:
@@ -55,22 +77,29 @@ Licença: MIT
 """
 
 import os
-import pandas as pd
 from datetime import datetime
-import time
-import yagmail
 import yaml
 from core import ats_analyzer
+from core import indice_vagas
+from core import corpus as corpus_ats
+from core import envio_assincrono
+from core import cache_planilhas
+from core import casador_empresas
+from core import fila_envio
+from core import registro_envios
 
 class ATSEmailIntegration:
     """Classe principal para integração ATS + Email."""
 
-    def __init__(self, config_path='config.yaml'):
+    def __init__(self, config_path='config.yaml', corpus=None):
         """Inicializa a integração com configurações."""
         self.config = self.carregar_config(config_path)
+        self.corpus = corpus if corpus is not None else corpus_ats.Corpus()
         self.df_empresas = None
-        self.df_log = None
+        self.casador_empresas = None
+        self.registro = None
         self.resultados_ats = {}
+        self.fila = None
 
     def carregar_config(self, config_path):
         """Carrega configurações do arquivo YAML."""
@@ -82,11 +111,17 @@ class ATSEmailIntegration:
             return {}
 
     def carregar_dados(self):
-        """Carrega dados das planilhas."""
+        """Carrega a planilha de empresas e abre o registro de envios."""
+        arquivos = self.config.get('arquivos', {})
         try:
-            self.df_empresas = pd.read_excel('empresas.xlsx')
-            self.df_log = pd.read_excel('log/log_respostas.xlsx')
-            print(f"✅ Dados carregados: {len(self.df_empresas)} empresas, {len(self.df_log)} registros de log")
+            self.df_empresas = cache_planilhas.ler_excel(arquivos.get('empresas', 'empresas.xlsx'))
+            self.casador_empresas = casador_empresas.CasadorEmpresas.de_dataframe(self.df_empresas)
+            self.registro = registro_envios.RegistroEnvios(
+                arquivos.get('registro_envios', registro_envios.ARQUIVO_REGISTRO_PADRAO),
+                arquivos.get('log_respostas', registro_envios.ARQUIVO_EXCEL_PADRAO),
+                filtro_bloom=self.config.get('envio', {}).get('filtro_bloom')
+            )
+            print(f"✅ Dados carregados: {len(self.df_empresas)} empresas, {len(self.registro)} registros de log")
         except Exception as e:
             print(f"Erro ao carregar dados: {e}")
             return False
@@ -136,63 +171,54 @@ class ATSEmailIntegration:
         arquivos_curriculos = [f for f in os.listdir(pasta_curriculos)
                               if f.lower().endswith(('.txt', '.docx', '.pdf'))]
 
-        # Lista arquivos de vagas
-        arquivos_vagas = [f for f in os.listdir(pasta_vagas)
-                         if f.lower().endswith(('.txt', '.docx', '.pdf'))] if os.path.exists(pasta_vagas) else []
+        # Atualiza o índice invertido: só vagas novas ou alteradas são carregadas
+        indice = indice_vagas.IndiceInvertido()
+        if os.path.exists(pasta_vagas):
+            indice.atualizar(pasta_vagas, self.corpus)
 
-        if not arquivos_vagas:
+        if indice.total_vagas == 0:
             print("⚠️  Nenhuma vaga encontrada para análise")
             return resultados
 
-        print(f"🎯 Analisando {len(arquivos_curriculos)} currículo(s) contra {len(arquivos_vagas)} vaga(s)")
+        top_vagas = max(1, self.config.get('ats', {}).get('top_vagas', 3))
 
-        for curriculo_file in arquivos_curriculos:
-            caminho_curriculo = os.path.join(pasta_curriculos, curriculo_file)
+        print(f"🎯 Analisando {len(arquivos_curriculos)} currículo(s) contra {indice.total_vagas} vaga(s)")
+
+        # Carrega e converte os currículos uma única vez (em lote)
+        documentos = self.corpus.documentos([os.path.join(pasta_curriculos, f) for f in arquivos_curriculos])
+
+        for documento in documentos:
+            curriculo_file = documento.arquivo
+            caminho_curriculo = documento.caminho
             nome_base = os.path.splitext(curriculo_file)[0]
 
             print(f"\n👤 Analisando currículo: {curriculo_file}")
 
-            # Carrega e converte currículo se necessário
-            texto_curriculo = ats_analyzer.carregar_arquivo(caminho_curriculo)
-            if not texto_curriculo:
+            if documento.erro:
+                print(f"   ❌ Erro ao processar currículo: {documento.erro}")
                 continue
 
-            tokens_curriculo = ats_analyzer.tokenizar(texto_curriculo)
-            melhores_resultados = []
-
-            # Analisa contra cada vaga
-            for vaga_file in arquivos_vagas:
-                caminho_vaga = os.path.join(pasta_vagas, vaga_file)
-                nome_vaga = os.path.splitext(vaga_file)[0]
-
-                # Carrega vaga
-                texto_vaga = ats_analyzer.carregar_arquivo(caminho_vaga)
-                if not texto_vaga:
-                    continue
-
-                tokens_vaga = ats_analyzer.tokenizar(texto_vaga)
-
-                # Calcula pontuação
-                pontuacao, palavras_faltantes = ats_analyzer.analisar_compatibilidade(
-                    tokens_curriculo, tokens_vaga
-                )
+            if not documento.valido:
+                continue
 
-                melhores_resultados.append({
-                    'vaga': nome_vaga,
-                    'pontuacao': pontuacao,
-                    'palavras_faltantes': palavras_faltantes,
-                    'caminho_curriculo': caminho_curriculo
-                })
+            # Termos distintos bastam para a busca e para as palavras faltantes
+            tokens_curriculo = documento.termos
 
+            # Consulta apenas as vagas que compartilham termos com o currículo
+            melhores = indice.buscar(tokens_curriculo, k=top_vagas)
+            for _, nome_vaga, pontuacao in melhores:
                 print(f"   🎯 Vaga '{nome_vaga}': {pontuacao}%")
 
-            # Ordena por pontuação e pega o melhor resultado
-            if melhores_resultados:
-                melhores_resultados.sort(key=lambda x: x['pontuacao'], reverse=True)
-                melhor = melhores_resultados[0]
-                resultados[nome_base] = melhor
+            id_melhor, nome_melhor, pontuacao_melhor = melhores[0]
+            melhor = {
+                'vaga': nome_melhor,
+                'pontuacao': pontuacao_melhor,
+                'palavras_faltantes': indice.palavras_faltantes(id_melhor, tokens_curriculo),
+                'caminho_curriculo': caminho_curriculo
+            }
+            resultados[nome_base] = melhor
 
-                print(f"   ✅ Melhor compatibilidade: {melhor['vaga']} ({melhor['pontuacao']}%)")
+            print(f"   ✅ Melhor compatibilidade: {melhor['vaga']} ({melhor['pontuacao']}%)")
 
         return resultados
 
@@ -241,42 +267,100 @@ class ATSEmailIntegration:
 
         return mensagem
 
-    def enviar_emails_aprovados(self, candidaturas_aprovadas):
-        """Envia emails apenas para candidaturas aprovadas."""
-        if not candidaturas_aprovadas:
-            print("⚠️  Nenhuma candidatura aprovada para envio")
+    def registrar_resultado_envio(self, item, erro):
+        """Registra na fila e no log o resultado de um envio da caixa de saída."""
+        self.fila.registrar_envio(item['id'], erro)
+        if erro is not None:
+            print(f"   ❌ Erro ao enviar para {item['empresa']} ({item['email']}): {erro}")
             return
 
-        print(f"\n📧 Enviando emails para {len(candidaturas_aprovadas)} candidatura(s) aprovada(s)...")
+        self.registrar_envio_log(item['empresa'], item['vaga'], item['email'], item['pontuacao'],
+                                 "Enviado com análise ATS")
+        print(f"   ✅ Email enviado para {item['empresa']} ({item['email']})")
 
-        # Configuração do email
-        email_config = self.config.get('email', {})
-        yag = yagmail.SMTP(email_config.get('usuario'), email_config.get('senha_app'))
+    def abrir_fila_envio(self):
+        """Abre a fila de envio persistente configurada em config.yaml."""
+        arquivo = self.config.get('arquivos', {}).get('fila_envio', fila_envio.ARQUIVO_FILA_PADRAO)
+        return fila_envio.FilaEnvio(arquivo, self.config)
 
-        delay = self.config.get('envio', {}).get('delay_entre_emails', 30)
+    def enviar_emails_aprovados(self, candidaturas_aprovadas):
+        """Coloca as candidaturas aprovadas na fila e envia as que estão liberadas agora."""
+        self.fila = self.abrir_fila_envio()
+        try:
+            if candidaturas_aprovadas:
+                print(f"\n📥 Enfileirando {len(candidaturas_aprovadas)} candidatura(s) aprovada(s)...")
+                novos = self._enfileirar_aprovados(candidaturas_aprovadas)
+                print(f"   📥 {novos} email(s) novo(s) na fila de envio")
+            self.processar_fila_envio()
+        finally:
+            self.fila.fechar()
+
+    def processar_fila_envio(self):
+        """Envia os itens liberados pela fila (cota, horário e ritmo) e informa o próximo envio."""
+        contas = envio_assincrono.contas_configuradas(self.config)
+        if not contas:
+            print("⚠️  Nenhuma conta de email configurada (config.yaml, seção email)")
+            return
 
-        emails_enviados = 0
+        itens = self.fila.reservar()
+        if itens:
+            print(f"\n📧 Enviando {len(itens)} email(s) liberado(s) pela fila (maior pontuação primeiro)...")
+
+            # Caixa de saída assíncrona: conexões SMTP reaproveitadas e intervalo
+            # por conta sem bloquear a montagem das mensagens seguintes
+            delay = self.config.get('envio', {}).get('delay_entre_emails', 30)
+            caixa = envio_assincrono.CaixaSaida(contas, delay, self.registrar_resultado_envio).iniciar()
+            try:
+                for item in itens:
+                    try:
+                        anexos = [item['anexo']] if item['anexo'] else []
+                        mensagem = envio_assincrono.montar_mensagem(item['email'], item['assunto'], item['corpo'], anexos)
+                    except OSError as e:
+                        self.registrar_resultado_envio(item, e)
+                        continue
+                    print(f"   📧 {item['empresa']} ({item['email']}) - {item['vaga']} ({item['pontuacao']}%)")
+                    caixa.enfileirar(mensagem, item)
+            finally:
+                estatisticas = caixa.concluir()
+
+            print(f"\n📊 Total de emails enviados: {estatisticas['enviados']}")
+            if estatisticas['falhas']:
+                print(f"   ❌ Falhas: {estatisticas['falhas']}")
+            print(f"   🔌 Conexões SMTP abertas: {estatisticas['conexoes']} em {estatisticas['duracao_s']:.1f}s")
+
+        # Nada de dormir até o próximo envio: a próxima execução continua a fila
+        contagem = self.fila.contagem()
+        print(f"\n📬 Fila de envio: {contagem.get('pendente', 0)} pendente(s), "
+              f"{self.fila.enviados_no_dia()}/{self.fila.max_por_dia} enviado(s) hoje")
+        if contagem.get('falha'):
+            print(f"   ❌ {contagem['falha']} envio(s) desistido(s) após {fila_envio.MAX_TENTATIVAS} tentativas")
+        proximo = self.fila.proximo_envio()
+        if proximo:
+            print(f"⏰ Próximo envio liberado em {proximo:%d/%m/%Y %H:%M} (execute novamente o modo envio)")
+
+    def _enfileirar_aprovados(self, candidaturas_aprovadas):
+        """Monta as mensagens das candidaturas aprovadas e as coloca na fila; retorna quantas entraram."""
+        novos = 0
+        # Empresas de todas as vagas aprovadas em uma única passada pela planilha
+        empresas_por_vaga = self.casador_empresas.casar({dados['vaga'] for dados in candidaturas_aprovadas.values()})
 
         for nome_curriculo, dados in candidaturas_aprovadas.items():
             try:
                 # Encontra empresa correspondente à vaga
                 vaga_nome = dados['vaga']
-                empresas_vaga = self.df_empresas[self.df_empresas['Vaga'].str.contains(vaga_nome, case=False, na=False)]
+                empresas_vaga = [self.casador_empresas.empresas[i] for i in empresas_por_vaga[vaga_nome]]
 
-                if empresas_vaga.empty:
+                if not empresas_vaga:
                     print(f"   ⚠️  Nenhuma empresa encontrada para vaga '{vaga_nome}'")
                     continue
 
                 # Envia para todas as empresas da vaga
-                for _, empresa in empresas_vaga.iterrows():
+                for empresa in empresas_vaga:
                     empresa_nome = empresa['Empresa']
                     empresa_email = empresa['Email']
 
-                    # Verifica se já foi enviado
-                    ja_enviado = ((self.df_log['Email'] == empresa_email) &
-                                (self.df_log['Vaga'] == empresa['Vaga'])).any()
-
-                    if ja_enviado:
+                    # Verifica se já foi enviado (ou já está na fila)
+                    if self.registro.ja_enviado(empresa_email, empresa['Vaga']):
                         print(f"   ⏭️  Já enviado para {empresa_nome} ({empresa_email})")
                         continue
 
@@ -286,36 +370,15 @@ class ATSEmailIntegration:
                     ).split('\n', 1)
 
                     # Anexa currículo (versão TXT para melhor compatibilidade ATS)
-                    anexos = [dados['caminho_curriculo']]
-
-                    print(f"   📧 Enviando para {empresa_nome} ({empresa_email})...")
-
-                    # Envia email
-                    yag.send(
-                        to=empresa_email,
-                        subject=assunto,
-                        contents=corpo,
-                        attachments=anexos
-                    )
-
-                    # Registra no log
-                    self.registrar_envio_log(
-                        empresa_nome, empresa['Vaga'], empresa_email,
-                        dados['pontuacao'], "Enviado com análise ATS"
-                    )
-
-                    emails_enviados += 1
-                    print(f"   ✅ Email enviado com sucesso!")
-
-                    # Delay entre envios
-                    if delay > 0:
-                        print(f"   ⏱️  Aguardando {delay}s...")
-                        time.sleep(delay)
+                    if self.fila.enfileirar(empresa_email, empresa['Vaga'], empresa_nome, dados['pontuacao'],
+                                            assunto.strip(), corpo, dados['caminho_curriculo']):
+                        novos += 1
+                    else:
+                        print(f"   ⏭️  Já na fila de envio: {empresa_nome} ({empresa_email})")
 
             except Exception as e:
-                print(f"   ❌ Erro ao enviar para {nome_curriculo}: {e}")
-
-        print(f"\n📊 Total de emails enviados: {emails_enviados}")
+                print(f"   ❌ Erro ao enfileirar {nome_curriculo}: {e}")
+        return novos
 
     def registrar_envio_log(self, empresa, vaga, email, pontuacao_ats, observacoes):
         """Registra envio no log com pontuação ATS."""
@@ -331,11 +394,14 @@ class ATSEmailIntegration:
             'Pontuacao_ATS': pontuacao_ats
         }
 
-        # Adiciona nova linha ao DataFrame
-        self.df_log = pd.concat([self.df_log, pd.DataFrame([novo_registro])], ignore_index=True)
+        # Uma inserção no registro; a planilha é exportada ao final da execução
+        self.registro.registrar(novo_registro)
 
-        # Salva no arquivo
-        self.df_log.to_excel('log/log_respostas.xlsx', index=False)
+    def exportar_log_excel(self):
+        """Exporta o registro de envios para a planilha de log."""
+        arquivo = self.config.get('arquivos', {}).get('log_respostas', registro_envios.ARQUIVO_EXCEL_PADRAO)
+        total = self.registro.exportar_excel(arquivo)
+        print(f"📄 Log exportado: {arquivo} ({total} registros)")
 
     def gerar_relatorio_analise(self, aprovadas, reprovadas):
         """Gera relatório completo da análise ATS."""
@@ -387,12 +453,16 @@ class ATSEmailIntegration:
         # 4. Gera relatório
         self.gerar_relatorio_analise(aprovadas, reprovadas)
 
-        # 5. Envia emails aprovados
-        if aprovadas:
-            self.enviar_emails_aprovados(aprovadas)
-        else:
+        # 5. Enfileira os aprovados e envia o que a fila liberar agora
+        if not aprovadas:
             print("\n⚠️  Nenhum currículo atingiu a pontuação mínima de 70%")
             print("💡 Otimize seus currículos antes de enviar")
+        self.enviar_emails_aprovados(aprovadas)
+
+        # 6. Exporta a planilha de log se houve envios nesta execução
+        if self.registro.novos:
+            self.exportar_log_excel()
+        self.registro.fechar()
 
         print("\n" + "=" * 60)
         print("✅ Fluxo integrado concluído!")
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ATS Matriz - Pontuação em Lote Currículos × Vagas
+=================================================
+
+DESCRIÇÃO:
+Este módulo calcula de uma só vez a pontuação ATS de todos os pares
+currículo-vaga, substituindo chamadas repetidas de analisar_compatibilidade,
+que testa cada palavra da vaga contra a lista de tokens do currículo.
+
+LÓGICA DE FUNCIONAMENTO:
+
+1. VOCABULÁRIO COMPARTILHADO:
+   - Reúne os termos distintos de todas as vagas em um único vocabulário
+   - Cada termo recebe um índice de coluna
+   - Termos do currículo que não aparecem em nenhuma vaga são ignorados
+   - Documentos do core.corpus já trazem os termos como ids (core.vocabulario):
+     a coluna de cada id vem de um array de mapeamento, sem comparar strings
+
+2. MATRIZES DE PRESENÇA:
+   - Vagas: matriz binária (vagas × vocabulário)
+   - Currículos: matriz binária (currículos × vocabulário), em blocos
+   - Produto das matrizes = quantidade de palavras da vaga presentes no currículo
+
+3. PONTUAÇÃO:
+   - Fórmula idêntica à de analisar_compatibilidade:
+     (palavras_presentes / palavras_distintas_vaga) * 100, arredondado em 1 casa
+   - O arredondamento usa round() do Python sobre os valores distintos,
+     garantindo resultado idêntico ao cálculo par a par
+
+4. PALAVRAS FALTANTES SOB DEMANDA:
+   - A lista de palavras faltantes só é montada para os pares consultados
+   - A ordem segue a primeira ocorrência na vaga, como no cálculo original
+   - Com documentos do corpus, os ids faltantes são decodificados só nesse momento
+
+DEPENDÊNCIAS:
+- numpy: operações vetorizadas
+- core.vocabulario (indiretamente): ids dos termos dos documentos do corpus
+
+EXEMPLO DE USO:
+matriz = score_matrix([tokens_cv_1, tokens_cv_2], [tokens_vaga_1])
+pontuacao = matriz.pontuacao(0, 0)
+faltantes = matriz.palavras_faltantes(0, 0)
+
+Autor: Cara Core Informática
+Data: 2025
+Licença: MIT
+"""
+
+import numpy as np
+
+# Quantidade de currículos processados por bloco na multiplicação de matrizes
+TAMANHO_BLOCO = 1024
+
+class MatrizPontuacao:
+    """Resultado do cálculo em lote: pontuações e palavras faltantes sob demanda."""
+
+    def __init__(self, pontuacoes, termos_vagas, conjuntos_curriculos, vocabulario=None):
+        """Inicializa com a matriz de pontuações e os termos (ou ids, com vocabulário) de cada documento."""
+        self.pontuacoes = pontuacoes
+        self.termos_vagas = termos_vagas
+        self.conjuntos_curriculos = conjuntos_curriculos
+        self.vocabulario = vocabulario
+
+    @property
+    def formato(self):
+        """Retorna (quantidade de currículos, quantidade de vagas)."""
+        return self.pontuacoes.shape
+
+    def pontuacao(self, i_curriculo, j_vaga):
+        """Retorna a pontuação do par currículo-vaga."""
+        return float(self.pontuacoes[i_curriculo, j_vaga])
+
+    def palavras_faltantes(self, i_curriculo, j_vaga):
+        """Retorna as palavras da vaga ausentes no currículo."""
+        conjunto = self.conjuntos_curriculos[i_curriculo]
+        if self.vocabulario is None:
+            return [termo for termo in self.termos_vagas[j_vaga] if termo not in conjunto]
+        conjunto = set(conjunto)
+        return self.vocabulario.decodificar([id_termo for id_termo in self.termos_vagas[j_vaga]
+                                             if id_termo not in conjunto])
+
+    def melhor_vaga(self, i_curriculo):
+        """Retorna o índice da vaga de maior pontuação (primeira em caso de empate)."""
+        return int(np.argmax(self.pontuacoes[i_curriculo]))
+
+def _arredondar(valores):
+    """Arredonda como round(valor, 1) do Python, avaliando cada valor distinto uma vez."""
+    distintos, inversos = np.unique(valores, return_inverse=True)
+    arredondados = np.array([round(float(v), 1) for v in distintos], dtype=np.float64)
+    return arredondados[inversos].reshape(valores.shape)
+
+def _termos(documento):
+    """Termos distintos na ordem de primeira ocorrência (reaproveita os do Corpus)."""
+    termos = getattr(documento, 'termos', None)
+    return termos if termos is not None else list(dict.fromkeys(documento))
+
+def _conjunto(documento):
+    """Conjunto de termos do documento (reaproveita o do Corpus)."""
+    conjunto = getattr(documento, 'conjunto', None)
+    return conjunto if conjunto is not None else set(documento)
+
+def _vocabulario_comum(documentos):
+    """Vocabulário compartilhado pelos documentos do corpus (None se algum não tiver ids)."""
+    if not documentos or not all(hasattr(documento, 'ids_termos') for documento in documentos):
+        return None
+    vocabulario = documentos[0].vocabulario
+    return vocabulario if all(documento.vocabulario is vocabulario for documento in documentos) else None
+
+def _score_matrix_ids(curriculos, vagas, vocabulario):
+    """Pontuação em lote sobre os ids de termos dos documentos do corpus."""
+    termos_vagas = [documento.ids_termos for documento in vagas]
+    ids_curriculos = [documento.ids_termos for documento in curriculos]
+
+    # Coluna de cada id do vocabulário (-1: termo ausente de todas as vagas)
+    colunas = np.full(len(vocabulario), -1, dtype=np.int64)
+    n_colunas = 0
+    for ids in termos_vagas:
+        ids = np.frombuffer(ids, dtype=np.uint32)
+        novos = np.unique(ids[colunas[ids] < 0])
+        colunas[novos] = np.arange(n_colunas, n_colunas + len(novos))
+        n_colunas += len(novos)
+
+    n_curriculos, n_vagas = len(curriculos), len(vagas)
+    pontuacoes = np.zeros((n_curriculos, n_vagas), dtype=np.float64)
+
+    if n_curriculos == 0 or n_vagas == 0 or not n_colunas:
+        return MatrizPontuacao(pontuacoes, termos_vagas, ids_curriculos, vocabulario)
+
+    presenca_vagas = np.zeros((n_vagas, n_colunas), dtype=np.float32)
+    for j, ids in enumerate(termos_vagas):
+        presenca_vagas[j, colunas[np.frombuffer(ids, dtype=np.uint32)]] = 1.0
+
+    tamanhos = np.array([len(ids) for ids in termos_vagas], dtype=np.float64)
+    vagas_validas = tamanhos > 0
+
+    for inicio in range(0, n_curriculos, TAMANHO_BLOCO):
+        bloco = [np.frombuffer(ids, dtype=np.uint32) for ids in ids_curriculos[inicio:inicio + TAMANHO_BLOCO]]
+        linhas = np.repeat(np.arange(len(bloco)), [len(ids) for ids in bloco])
+        colunas_bloco = colunas[np.concatenate(bloco)]
+        presentes = colunas_bloco >= 0
+
+        presenca_bloco = np.zeros((len(bloco), n_colunas), dtype=np.float32)
+        presenca_bloco[linhas[presentes], colunas_bloco[presentes]] = 1.0
+
+        contagens = (presenca_bloco @ presenca_vagas.T).astype(np.float64)
+        pontuacoes[inicio:inicio + len(bloco), vagas_validas] = (
+            contagens[:, vagas_validas] / tamanhos[vagas_validas]
+        ) * 100
+
+    return MatrizPontuacao(_arredondar(pontuacoes), termos_vagas, ids_curriculos, vocabulario)
+
+def score_matrix(curriculos, vagas):
+    """Calcula a matriz de pontuações ATS para currículos e vagas.
+
+    Aceita listas de tokens ou objetos Documento do core.corpus; com
+    documentos do corpus, a pontuação é calculada sobre os ids dos termos.
+    """
+    vocabulario = _vocabulario_comum(list(curriculos) + list(vagas))
+    if vocabulario is not None:
+        return _score_matrix_ids(curriculos, vagas, vocabulario)
+
+    # Termos distintos por vaga, na ordem de primeira ocorrência
+    termos_vagas = [_termos(documento) for documento in vagas]
+    conjuntos_curriculos = [_conjunto(documento) for documento in curriculos]
+
+    # Vocabulário compartilhado construído uma única vez
+    vocabulario = {}
+    for termos in termos_vagas:
+        for termo in termos:
+            if termo not in vocabulario:
+                vocabulario[termo] = len(vocabulario)
+
+    n_curriculos, n_vagas = len(curriculos), len(vagas)
+    pontuacoes = np.zeros((n_curriculos, n_vagas), dtype=np.float64)
+
+    if n_curriculos == 0 or n_vagas == 0 or not vocabulario:
+        return MatrizPontuacao(pontuacoes, termos_vagas, conjuntos_curriculos)
+
+    presenca_vagas = np.zeros((n_vagas, len(vocabulario)), dtype=np.float32)
+    for j, termos in enumerate(termos_vagas):
+        presenca_vagas[j, [vocabulario[termo] for termo in termos]] = 1.0
+
+    tamanhos = np.array([len(termos) for termos in termos_vagas], dtype=np.float64)
+    vagas_validas = tamanhos > 0
+
+    for inicio in range(0, n_curriculos, TAMANHO_BLOCO):
+        bloco = conjuntos_curriculos[inicio:inicio + TAMANHO_BLOCO]
+        presenca_bloco = np.zeros((len(bloco), len(vocabulario)), dtype=np.float32)
+        for i, conjunto in enumerate(bloco):
+            indices = [vocabulario[termo] for termo in conjunto if termo in vocabulario]
+            presenca_bloco[i, indices] = 1.0
+
+        # Contagens inteiras exatas (float32 representa inteiros até 2^24)
+        contagens = (presenca_bloco @ presenca_vagas.T).astype(np.float64)
+        pontuacoes[inicio:inicio + len(bloco), vagas_validas] = (
+            contagens[:, vagas_validas] / tamanhos[vagas_validas]
+        ) * 100
+
+    return MatrizPontuacao(_arredondar(pontuacoes), termos_vagas, conjuntos_curriculos)
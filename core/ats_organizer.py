@@ -44,7 +44,42 @@ LÓGICA DE FUNCIONAMENTO:
    - Mostra ranking de currículos por pontuação
    - Recomendações específicas por candidato
 
-4. INTEGRAÇÃO COM SISTEMA PRINCIPAL:
+4. REANÁLISE INCREMENTAL (--incremental):
+   - Manifesto com assinatura dos arquivos e resultados ao lado do CSV
+   - Só pares vaga/currículo novos ou alterados são recalculados
+   - Rankings e CSV são reconstruídos com resultados antigos + novos
+
+5. CURRÍCULOS QUASE IDÊNTICOS (core.deduplicacao):
+   - Cópias de um mesmo currículo na pasta da vaga formam um grupo
+   - Só o representante do grupo é pontuado; as cópias reaproveitam o resultado
+     (coluna duplicata_de no CSV) e o relatório mostra as pontuações evitadas
+
+6. RESULTADOS COMPACTOS (core.resultados_compactos):
+   - Cada currículo vira um ResultadoCurriculo (__slots__) com pontuação,
+     contagens e só as 10 primeiras palavras faltantes; recomendações são
+     geradas no relatório
+   - Acima de LIMITE_CURRICULOS_MEMORIA currículos, as listas completas de
+     palavras faltantes vão para <resultados>.detalhes.jsonl (arquivo apenas
+     de saída) e os currículos são carregados e descartados vaga a vaga
+   - Nessas execuções, cada vaga é planejada (manifesto incremental) só na sua
+     vez e, depois de exportada em streaming, guarda apenas as estatísticas e
+     os TOP_RELATORIO_EXECUCAO_GRANDE melhores para o relatório: a memória
+     acompanha a maior vaga, não o total de currículos
+
+7. TOP K POR VAGA (--top K, core.ranking_vagas):
+   - O ranking de cada vaga é montado com um heap de K resultados enquanto as
+     pontuações chegam, sem ordenar todos os currículos
+   - Relatório e exportação mostram só os K melhores; total, taxa de aprovação,
+     média e percentis das pontuações são calculados na mesma passada e
+     exportados em <resultados>.resumo.csv
+
+8. EXPORTAÇÃO EM STREAMING (core.exportacao_resultados):
+   - As linhas de cada vaga são gravadas assim que a vaga termina
+     (executar_analise_organizada(exportar=True)), sem montar a tabela completa
+   - Formato pela extensão do arquivo de resultados: CSV, Parquet (row groups)
+     ou XLSX write-only com uma aba por vaga (--formato no main.py)
+
+9. INTEGRAÇÃO COM SISTEMA PRINCIPAL:
    - Compatível com sistema de email existente
    - Mantém estrutura de log unificada
    - Suporte a múltiplos formatos (PDF, DOCX, TXT)
@@ -58,12 +93,19 @@ VANTAGENS DA ESTRUTURA ORGANIZADA:
 
 DEPENDÊNCIAS:
 - core.ats_analyzer: Para análise técnica ATS
+- core.ats_matriz: Para pontuação em lote dos currículos
+- core.corpus: Para carregar cada documento uma única vez (em paralelo com --workers N)
+- core.manifesto_ats: Para reanálise incremental (--incremental)
+- core.deduplicacao: Para pontuar uma vez cada grupo de currículos quase idênticos
 - os, shutil: Para manipulação de arquivos e pastas
-- pandas: Para relatórios estruturados
+- core.resultados_compactos: Para guardar os resultados por currículo em pouca memória
+- core.ranking_vagas: Para o ranking (top K) e as estatísticas de cada vaga
+- core.exportacao_resultados: Para exportar os resultados em CSV, Parquet ou XLSX
+- csv: Para acrescentar resultados ao CSV no modo watch (sem carregar o pandas)
 
 EXEMPLO DE USO:
-organizer = ATSOrganizer()
-organizer.executar_analise_organizada()
+organizer = ATSOrganizer(arquivo_resultados=caminho_resultados('xlsx'))
+organizer.executar_analise_organizada(exportar=True)
 organizer.gerar_relatorios_por_vaga()
 
 Autor: Cara Core Informática
@@ -72,17 +114,71 @@ Licença: MIT
 """
 
 import os
+import csv
 import shutil
-import pandas as pd
+import itertools
 from datetime import datetime
 from core import ats_analyzer
+from core import ats_matriz
+from core import corpus as corpus_ats
+from core import exportacao_resultados
+from core import manifesto_ats
+from core import ranking_vagas
+from core import resultados_compactos
+
+# Arquivo CSV de resultados (o manifesto incremental fica ao lado)
+ARQUIVO_RESULTADOS = 'log/resultados_ats_organizado.csv'
+
+CAMPOS_RESULTADOS = exportacao_resultados.CAMPOS_RESULTADOS
+
+# Execuções grandes exportadas em streaming: currículos de cada vaga mantidos
+# para o relatório depois de gravados (o ranking completo fica no arquivo)
+TOP_RELATORIO_EXECUCAO_GRANDE = 10
+
+CAMPOS_RESUMO = (['vaga', 'total', 'aprovados', 'taxa_aprovacao', 'media', 'minimo']
+                 + [f"p{p}" for p in ranking_vagas.PERCENTIS] + ['maximo', 'data_analise'])
+
+def caminho_resumo(arquivo_resultados):
+    """Arquivo CSV com as estatísticas por vaga, ao lado do arquivo de resultados."""
+    return os.path.splitext(arquivo_resultados)[0] + '.resumo.csv'
+
+def caminho_resultados(formato='csv'):
+    """Arquivo de resultados padrão no formato de exportação (csv, parquet ou xlsx)."""
+    return exportacao_resultados.caminho_formato(ARQUIVO_RESULTADOS, formato)
+
+def gravar_resultados_csv(arquivo_saida, linhas, anexar=False):
+    """Grava (ou acrescenta) linhas de resultados no CSV, com cabeçalho em arquivo novo."""
+    novo = not anexar or not os.path.exists(arquivo_saida)
+    with open(arquivo_saida, 'a' if anexar else 'w', newline='', encoding='utf-8') as f:
+        escritor = csv.DictWriter(f, fieldnames=CAMPOS_RESULTADOS, lineterminator=os.linesep)
+        if novo:
+            escritor.writeheader()
+        escritor.writerows(linhas)
 
 class ATSOrganizer:
     """Classe principal para sistema organizado de análise ATS."""
 
-    def __init__(self, pasta_base='vagas'):
-        """Inicializa o organizador com a pasta base."""
+    def __init__(self, pasta_base='vagas', workers=1, corpus=None,
+                 arquivo_resultados=ARQUIVO_RESULTADOS, deduplicador=None, detalhes_em_disco=None, top=None):
+        """Inicializa o organizador com a pasta base.
+
+        deduplicador: core.deduplicacao.Deduplicador opcional; currículos quase
+        idênticos da mesma vaga são pontuados uma única vez.
+        detalhes_em_disco: grava as listas completas de palavras faltantes em
+        disco (None: só acima de LIMITE_CURRICULOS_MEMORIA currículos).
+        top: mantém, exibe e exporta só os K melhores currículos de cada vaga
+        (None: todos; senão K ≥ 1).
+        """
+        if top is not None and top < 1:
+            raise ValueError(f"top deve ser maior ou igual a 1: {top}")
         self.pasta_base = pasta_base
+        self.arquivo_resultados = arquivo_resultados
+        self.workers = workers
+        self.corpus = corpus if corpus is not None else corpus_ats.Corpus(workers)
+        self.deduplicador = deduplicador
+        self.detalhes_em_disco = detalhes_em_disco
+        self.top = top
+        self.detalhes = None
         self.resultados_por_vaga = {}
         self.relatorios = {}
 
@@ -118,94 +214,192 @@ class ATSOrganizer:
         print(f"\n📊 Total de vagas organizadas encontradas: {len(vagas_encontradas)}")
         return vagas_encontradas
 
-    def analisar_vaga_organizada(self, vaga_info):
-        """Analisa uma vaga específica com seus currículos."""
+    def listar_curriculos(self, pasta_curriculos):
+        """Lista os arquivos de currículo suportados de uma pasta."""
+        return [f for f in os.listdir(pasta_curriculos)
+                if f.lower().endswith(('.txt', '.docx', '.pdf'))]
+
+    def analisar_vaga_organizada(self, vaga_info, documentos=None, resultados_previos=None, todos=None):
+        """Analisa uma vaga específica com seus currículos.
+
+        documentos: lista opcional de Documento já carregados pelo corpus;
+        se omitida, os currículos da pasta são carregados aqui.
+        resultados_previos: resultados reaproveitados da análise anterior
+        (modo incremental, dicionários do manifesto), combinados com os recalculados.
+        todos: lista opcional que recebe todos os resultados, inclusive os fora
+        do top K (usada pelo manifesto incremental).
+        """
         nome_vaga = vaga_info['nome']
         arquivo_vaga = vaga_info['arquivo_vaga']
         pasta_curriculos = vaga_info['pasta_curriculos']
+        resultados_previos = list(resultados_previos or [])
 
         print(f"\n🔍 Analisando vaga organizada: {nome_vaga}")
         print("=" * 60)
 
-        # Carrega descrição da vaga
-        try:
-            with open(arquivo_vaga, 'r', encoding='utf-8') as f:
-                texto_vaga = f.read()
-        except Exception as e:
-            print(f"❌ Erro ao carregar vaga {nome_vaga}: {e}")
-            return None
-
-        # Tokeniza a vaga
-        tokens_vaga = ats_analyzer.tokenizar(texto_vaga)
-        print(f"📊 Palavras-chave na vaga: {len(tokens_vaga)}")
+        # Lista e carrega currículos da vaga (em paralelo com --workers)
+        if documentos is None:
+            caminhos = [os.path.join(pasta_curriculos, f) for f in self.listar_curriculos(pasta_curriculos)]
+            documentos = self.corpus.documentos(caminhos)
 
-        # Lista currículos da vaga
-        arquivos_curriculos = [f for f in os.listdir(pasta_curriculos)
-                              if f.lower().endswith(('.txt', '.docx', '.pdf'))]
-
-        if not arquivos_curriculos:
+        if not documentos and not resultados_previos:
             print(f"⚠️  Nenhum currículo encontrado para {nome_vaga}")
             return None
 
-        print(f"📄 Currículos encontrados: {len(arquivos_curriculos)}")
-
-        # Analisa cada currículo
-        resultados_curriculos = []
-
-        for curriculo_file in arquivos_curriculos:
-            caminho_curriculo = os.path.join(pasta_curriculos, curriculo_file)
-            nome_base = os.path.splitext(curriculo_file)[0]
-
-            print(f"\n   👤 Analisando: {curriculo_file}")
-
-            # Carrega e converte currículo se necessário
-            texto_curriculo = ats_analyzer.carregar_arquivo(caminho_curriculo)
-            if not texto_curriculo:
+        # Carrega e tokeniza a descrição da vaga (desnecessário se nada mudou)
+        if documentos:
+            vaga = self.corpus.documento(arquivo_vaga)
+            if vaga.erro:
+                print(f"❌ Erro ao carregar vaga {nome_vaga}: {vaga.erro}")
+                return None
+            total_tokens_vaga = vaga.total_tokens
+        else:
+            vaga = None
+            total_tokens_vaga = resultados_previos[0]['tokens_vaga']
+
+        print(f"📊 Palavras-chave na vaga: {total_tokens_vaga}")
+        print(f"📄 Currículos encontrados: {len(documentos) + len(resultados_previos)}")
+
+        # Ranking montado conforme as pontuações chegam (heap de K com --top)
+        ranking = ranking_vagas.RankingVaga(self.top)
+        # Com --top, o progresso de cada currículo não é exibido
+        detalhar = self.top is None
+
+        # Resultados da análise anterior (detalhes completos copiados do arquivo anterior)
+        previos = [resultados_compactos.ResultadoCurriculo.de_dicionario(r) for r in resultados_previos]
+        for resultado in previos:
+            ranking.adicionar(resultado)
+            if todos is not None:
+                todos.append(resultado)
+        if self.detalhes is not None and previos:
+            self.detalhes.reaproveitar(nome_vaga, previos)
+        if previos:
+            print(f"♻️  Reaproveitados da análise anterior: {len(previos)}")
+
+        curriculos_carregados = []
+
+        for documento in documentos:
+            if detalhar:
+                print(f"\n   👤 Analisando: {documento.arquivo}")
+
+            # Falhas de um documento não interrompem a análise da vaga
+            if documento.erro:
+                print(f"      ❌ Erro ao processar currículo {documento.arquivo}: {documento.erro}")
                 continue
 
-            tokens_curriculo = ats_analyzer.tokenizar(texto_curriculo)
-            print(f"      📊 Palavras no currículo: {len(tokens_curriculo)}")
+            if not documento.valido:
+                continue
 
-            # Calcula pontuação
-            pontuacao, palavras_faltantes = ats_analyzer.analisar_compatibilidade(
-                tokens_curriculo, tokens_vaga
+            if detalhar:
+                print(f"      📊 Palavras no currículo: {documento.total_tokens}")
+            curriculos_carregados.append(documento)
+
+        # Currículos quase idênticos são pontuados uma vez, pelo representante do grupo
+        representante = list(range(len(curriculos_carregados)))
+        if self.deduplicador is not None and len(curriculos_carregados) > 1:
+            agrupamento = self.deduplicador.agrupar(curriculos_carregados)
+            agrupamento.imprimir_resumo('currículo(s)')
+            representante = agrupamento.representante
+        linha_matriz = {i: k for k, i in enumerate(sorted(set(representante)))}
+
+        # Calcula a pontuação de todos os currículos contra a vaga de uma vez
+        if curriculos_carregados:
+            matriz = ats_matriz.score_matrix([curriculos_carregados[i] for i in linha_matriz], [vaga])
+
+        for i, documento in enumerate(curriculos_carregados):
+            curriculo_file = documento.arquivo
+            k = linha_matriz[representante[i]]
+            pontuacao = matriz.pontuacao(k, 0)
+            palavras_faltantes = matriz.palavras_faltantes(k, 0)
+
+            if representante[i] != i:
+                duplicata_de = curriculos_carregados[representante[i]].arquivo
+                if detalhar:
+                    print(f"   🔁 {curriculo_file}: Pontuação ATS {pontuacao}% (reaproveitada de {duplicata_de})")
+            else:
+                duplicata_de = None
+                if detalhar:
+                    print(f"   🎯 {curriculo_file}: Pontuação ATS {pontuacao}%")
+
+            # Armazena resultado compacto (lista completa de faltantes em disco, se ativado)
+            if self.detalhes is not None:
+                self.detalhes.gravar(nome_vaga, curriculo_file, palavras_faltantes)
+            resultado = resultados_compactos.ResultadoCurriculo(
+                curriculo_file, pontuacao, palavras_faltantes, documento.total_tokens, total_tokens_vaga,
+                duplicata_de
             )
+            ranking.adicionar(resultado)
+            if todos is not None:
+                todos.append(resultado)
 
-            print(f"      🎯 Pontuação ATS: {pontuacao}%")
-
-            # Gera recomendações
-            recomendacoes = ats_analyzer.gerar_recomendacoes(palavras_faltantes, pontuacao)
-
-            # Armazena resultado
-            resultado = {
-                'curriculo': nome_base,
-                'arquivo': curriculo_file,
-                'caminho': caminho_curriculo,
-                'pontuacao': pontuacao,
-                'palavras_faltantes': palavras_faltantes,
-                'recomendacoes': recomendacoes,
-                'tokens_curriculo': len(tokens_curriculo),
-                'tokens_vaga': len(tokens_vaga)
-            }
-
-            resultados_curriculos.append(resultado)
+        if not detalhar:
+            print(f"🎯 {ranking.total} currículo(s) pontuado(s); mantidos os {self.top} melhores")
 
-        # Ordena por pontuação (maior para menor)
-        resultados_curriculos.sort(key=lambda x: x['pontuacao'], reverse=True)
-
-        # Armazena resultados da vaga
+        # Armazena resultados da vaga: ranking (maior pontuação primeiro; empates
+        # por nome do arquivo) e estatísticas de todos os currículos
         resultado_vaga = {
             'nome_vaga': nome_vaga,
-            'tokens_vaga': len(tokens_vaga),
-            'total_curriculos': len(resultados_curriculos),
-            'curriculos': resultados_curriculos,
+            'tokens_vaga': total_tokens_vaga,
+            'total_curriculos': ranking.total,
+            'curriculos': ranking.ranking(),
+            'resumo': ranking.resumo(),
             'data_analise': datetime.now()
         }
 
         return resultado_vaga
 
-    def executar_analise_organizada(self):
-        """Executa análise completa do sistema organizado."""
+    def planejar_vaga(self, manifesto, vaga_info):
+        """Lista os currículos da vaga e decide quais recalcular (todos sem manifesto).
+
+        Retorna (vaga_info, assinatura da vaga, assinaturas por caminho, caminhos a
+        recalcular, resultados reaproveitados).
+        """
+        caminhos = [os.path.join(vaga_info['pasta_curriculos'], f)
+                    for f in self.listar_curriculos(vaga_info['pasta_curriculos'])]
+        if manifesto is None:
+            return vaga_info, None, {}, caminhos, []
+        return (vaga_info,) + self.planejar_vaga_incremental(manifesto, vaga_info, caminhos)
+
+    def planejar_vaga_incremental(self, manifesto, vaga_info, caminhos):
+        """Separa os currículos da vaga em reaproveitados e a recalcular.
+
+        Retorna (assinatura da vaga, assinaturas por caminho, caminhos a recalcular,
+        resultados reaproveitados).
+        """
+        nome_vaga = vaga_info['nome']
+        assinatura_vaga = manifesto.assinatura_vaga(nome_vaga, vaga_info['arquivo_vaga'])
+        vaga_inalterada = manifesto.vaga_inalterada(nome_vaga, assinatura_vaga)
+
+        assinaturas = {}
+        recalcular = []
+        reaproveitados = []
+
+        for caminho in caminhos:
+            assinatura = manifesto.assinatura_curriculo(nome_vaga, caminho)
+            assinaturas[caminho] = assinatura
+            resultado = manifesto.resultado_curriculo(nome_vaga, assinatura) if vaga_inalterada else None
+            if resultado is not None:
+                reaproveitados.append(resultado)
+            else:
+                recalcular.append(caminho)
+
+        # Uma duplicata só é reaproveitada se o seu representante também for
+        arquivos_reaproveitados = {resultado['arquivo'] for resultado in reaproveitados}
+        for resultado in list(reaproveitados):
+            if resultado.get('duplicata_de') and resultado['duplicata_de'] not in arquivos_reaproveitados:
+                reaproveitados.remove(resultado)
+                recalcular.append(resultado['caminho'])
+
+        return assinatura_vaga, assinaturas, recalcular, reaproveitados
+
+    def executar_analise_organizada(self, incremental=False, exportar=False):
+        """Executa análise completa do sistema organizado.
+
+        Com incremental=True, apenas pares vaga/currículo novos ou alterados desde
+        a última execução são recalculados (ver core.manifesto_ats).
+        Com exportar=True, os resultados de cada vaga são gravados no arquivo de
+        resultados assim que a vaga termina.
+        """
         print("🚀 Iniciando análise organizada ATS")
         print("=" * 60)
 
@@ -216,16 +410,94 @@ class ATSOrganizer:
             print("❌ Nenhuma vaga organizada encontrada")
             return False
 
-        # Analisa cada vaga
-        for vaga_info in vagas:
-            resultado = self.analisar_vaga_organizada(vaga_info)
-            if resultado:
-                self.resultados_por_vaga[vaga_info['nome']] = resultado
+        manifesto = manifesto_ats.ManifestoAnalise(self.arquivo_resultados) if incremental else None
+
+        # Execuções grandes: listas completas de palavras faltantes em disco (só a
+        # contagem aqui; os currículos de cada vaga são listados na sua vez)
+        total_curriculos = sum(len(self.listar_curriculos(vaga_info['pasta_curriculos'])) for vaga_info in vagas)
+        detalhes_em_disco = self.detalhes_em_disco
+        if detalhes_em_disco is None:
+            detalhes_em_disco = total_curriculos > resultados_compactos.LIMITE_CURRICULOS_MEMORIA
+        self.detalhes = None
+        if detalhes_em_disco:
+            self.detalhes = resultados_compactos.DetalhesEmDisco(
+                resultados_compactos.caminho_detalhes(self.arquivo_resultados),
+                reaproveitar_anterior=manifesto is not None)
+            print(f"📦 {total_curriculos} currículo(s): palavras faltantes completas em {self.detalhes.arquivo}")
+
+        try:
+            if exportar:
+                with self.abrir_exportacao() as escritor:
+                    self.analisar_planos(vagas, manifesto, escritor)
+                self.relatar_exportacao(escritor)
+                if self.top is not None:
+                    self.exportar_resumo()
+            else:
+                self.analisar_planos(vagas, manifesto)
+        finally:
+            if self.detalhes is not None:
+                self.detalhes.fechar()
+
+        if manifesto is not None:
+            manifesto.salvar()
+            print(f"\n♻️  Análise incremental: {manifesto.reaproveitados} par(es) reaproveitado(s), "
+                  f"{manifesto.recalculados} recalculado(s)")
+
+        if self.deduplicador is not None and self.deduplicador.documentos:
+            evitadas = self.deduplicador.duplicatas
+            print(f"\n🔁 Deduplicação: {evitadas} de {self.deduplicador.documentos} pontuação(ões) evitada(s) "
+                  f"({evitadas / self.deduplicador.documentos:.1%}), "
+                  f"similaridade mínima {self.deduplicador.similaridade_minima:.0%}")
 
         print("\n" + "=" * 60)
         print("✅ Análise organizada concluída!")
         return True
 
+    def analisar_planos(self, vagas, manifesto=None, escritor=None):
+        """Analisa as vagas detectadas; com escritor, grava as linhas de cada vaga ao terminar."""
+        # Decide, para cada vaga, quais currículos precisam ser (re)calculados
+        planejados = (self.planejar_vaga(manifesto, vaga_info) for vaga_info in vagas)
+
+        # Carrega em um único lote apenas os currículos a recalcular; com detalhes
+        # em disco (execuções grandes), planeja, carrega e descarta vaga a vaga
+        por_vaga = self.detalhes is not None
+        if not por_vaga:
+            planejados = list(planejados)
+            caminhos_lote = [caminho for plano in planejados for caminho in plano[3]]
+            documentos = iter(self.corpus.documentos(caminhos_lote))
+
+        # Analisa cada vaga com os seus documentos, na ordem da listagem
+        for vaga_info, assinatura_vaga, assinaturas, recalcular, reaproveitados in planejados:
+            if por_vaga:
+                documentos_vaga = self.corpus.documentos(recalcular)
+            else:
+                documentos_vaga = list(itertools.islice(documentos, len(recalcular)))
+            # O manifesto registra todos os currículos, não só o top K
+            todos = [] if manifesto is not None else None
+            resultado = self.analisar_vaga_organizada(vaga_info, documentos_vaga, reaproveitados, todos)
+            if por_vaga:
+                del documentos_vaga
+                for caminho in recalcular:
+                    self.corpus.descartar(caminho)
+            if not resultado:
+                continue
+
+            self.resultados_por_vaga[vaga_info['nome']] = resultado
+
+            if manifesto is not None:
+                manifesto.reaproveitados += len(reaproveitados)
+                manifesto.recalculados += len(recalcular)
+                manifesto.registrar_vaga(
+                    vaga_info['nome'], assinatura_vaga, resultado['tokens_vaga'],
+                    [(assinaturas[os.path.join(vaga_info['pasta_curriculos'], c.arquivo)], c) for c in todos]
+                )
+
+            if escritor is not None:
+                escritor.escrever_vaga(vaga_info['nome'], self.linhas_vaga(vaga_info['nome'], resultado))
+                # Execução grande: depois de gravada, a vaga guarda só o início do ranking
+                if por_vaga and self.top is None:
+                    del resultado['curriculos'][TOP_RELATORIO_EXECUCAO_GRANDE:]
+
     def gerar_relatorio_vaga(self, nome_vaga, resultado_vaga):
         """Gera relatório detalhado para uma vaga específica."""
         print(f"\n📊 RELATÓRIO DA VAGA: {nome_vaga}")
@@ -237,30 +509,42 @@ class ATSOrganizer:
         print(f"   • Data da análise: {resultado_vaga['data_analise'].strftime('%d/%m/%Y %H:%M')}")
 
         if resultado_vaga['curriculos']:
-            print(f"\n🏆 RANKING DE CURRÍCULOS:")
+            if self.top is not None or len(resultado_vaga['curriculos']) < resultado_vaga['total_curriculos']:
+                print(f"\n🏆 RANKING DE CURRÍCULOS (top {len(resultado_vaga['curriculos'])} "
+                      f"de {resultado_vaga['total_curriculos']}):")
+            else:
+                print(f"\n🏆 RANKING DE CURRÍCULOS:")
 
             for i, curriculo in enumerate(resultado_vaga['curriculos'], 1):
-                status = "✅ APROVADO" if curriculo['pontuacao'] >= 70 else "❌ REPROVADO"
-                print(f"\n   {i}º LUGAR - {curriculo['curriculo']}")
-                print(f"      Pontuação ATS: {curriculo['pontuacao']}% - {status}")
-                print(f"      Arquivo: {curriculo['arquivo']}")
-                print(f"      Palavras no currículo: {curriculo['tokens_curriculo']}")
-
-                if curriculo['recomendacoes']:
+                status = "✅ APROVADO" if curriculo.pontuacao >= 70 else "❌ REPROVADO"
+                print(f"\n   {i}º LUGAR - {curriculo.curriculo}")
+                print(f"      Pontuação ATS: {curriculo.pontuacao}% - {status}")
+                print(f"      Arquivo: {curriculo.arquivo}")
+                print(f"      Palavras no currículo: {curriculo.tokens_curriculo}")
+                if curriculo.duplicata_de:
+                    print(f"      🔁 Quase idêntico a {curriculo.duplicata_de} (pontuação reaproveitada)")
+
+                # Recomendações geradas na hora (usam só as primeiras palavras faltantes)
+                recomendacoes = ats_analyzer.gerar_recomendacoes(list(curriculo.palavras_faltantes),
+                                                                 curriculo.pontuacao)
+                if recomendacoes:
                     print("      💡 Recomendações:")
-                    for rec in curriculo['recomendacoes']:
+                    for rec in recomendacoes:
                         print(f"         • {rec}")
 
-        # Estatísticas de aprovação
-        aprovados = len([c for c in resultado_vaga['curriculos'] if c['pontuacao'] >= 70])
+        # Estatísticas de aprovação (de todos os currículos, calculadas no ranking)
+        resumo = resultado_vaga['resumo']
+        aprovados = resumo['aprovados']
         reprovados = resultado_vaga['total_curriculos'] - aprovados
 
         print(f"\n📊 RESUMO DA VAGA:")
         print(f"   ✅ Aprovados (≥70%): {aprovados}")
         print(f"   ❌ Reprovados (<70%): {reprovados}")
         if resultado_vaga['total_curriculos'] > 0:
-            taxa_aprovacao = (aprovados / resultado_vaga['total_curriculos']) * 100
-            print(f"   📈 Taxa de aprovação: {taxa_aprovacao:.1f}%")
+            print(f"   📈 Taxa de aprovação: {resumo['taxa_aprovacao']:.1f}%")
+            percentis = ", ".join(f"P{p} {valor}%" for p, valor in resumo['percentis'].items())
+            print(f"   📉 Pontuações: média {resumo['media']:.1f}%, mínima {resumo['minimo']}%, "
+                  f"máxima {resumo['maximo']}% ({percentis})")
 
     def gerar_relatorios_por_vaga(self):
         """Gera relatórios para todas as vagas analisadas."""
@@ -287,7 +571,7 @@ class ATSOrganizer:
         total_aprovados = 0
 
         for resultado in self.resultados_por_vaga.values():
-            total_aprovados += len([c for c in resultado['curriculos'] if c['pontuacao'] >= 70])
+            total_aprovados += resultado['resumo']['aprovados']
 
         print(f"📊 Estatísticas Gerais:")
         print(f"   • Total de vagas analisadas: {total_vagas}")
@@ -300,35 +584,80 @@ class ATSOrganizer:
 
         print(f"\n🏆 VAGAS ANALISADAS:")
         for nome_vaga, resultado in self.resultados_por_vaga.items():
-            aprovados_vaga = len([c for c in resultado['curriculos'] if c['pontuacao'] >= 70])
+            aprovados_vaga = resultado['resumo']['aprovados']
             print(f"   • {nome_vaga}: {resultado['total_curriculos']} currículos, {aprovados_vaga} aprovados")
 
-    def exportar_resultados_csv(self, arquivo_saida='log/resultados_ats_organizado.csv'):
-        """Exporta todos os resultados para CSV."""
-        print(f"\n💾 Exportando resultados para {arquivo_saida}...")
-
-        dados_exportacao = []
+    def linha_exportacao(self, nome_vaga, curriculo, data_analise):
+        """Monta a linha do CSV de resultados para um currículo."""
+        return {
+            'vaga': nome_vaga,
+            'curriculo': curriculo.curriculo,
+            'arquivo': curriculo.arquivo,
+            'pontuacao_ats': curriculo.pontuacao,
+            'aprovado': 'Sim' if curriculo.pontuacao >= 70 else 'Não',
+            'palavras_curriculo': curriculo.tokens_curriculo,
+            'palavras_vaga': curriculo.tokens_vaga,
+            'data_analise': data_analise,
+            'duplicata_de': curriculo.duplicata_de or ''
+        }
 
-        for nome_vaga, resultado in self.resultados_por_vaga.items():
-            for curriculo in resultado['curriculos']:
-                dados_exportacao.append({
-                    'vaga': nome_vaga,
-                    'curriculo': curriculo['curriculo'],
-                    'arquivo': curriculo['arquivo'],
-                    'pontuacao_ats': curriculo['pontuacao'],
-                    'aprovado': 'Sim' if curriculo['pontuacao'] >= 70 else 'Não',
-                    'palavras_curriculo': curriculo['tokens_curriculo'],
-                    'palavras_vaga': curriculo['tokens_vaga'],
-                    'data_analise': resultado['data_analise']
-                })
-
-        if dados_exportacao:
-            df = pd.DataFrame(dados_exportacao)
-            df.to_csv(arquivo_saida, index=False, encoding='utf-8')
-            print(f"✅ Resultados exportados com sucesso: {len(dados_exportacao)} registros")
+    def linhas_vaga(self, nome_vaga, resultado):
+        """Linhas de exportação dos currículos de uma vaga, geradas sob demanda."""
+        for curriculo in resultado['curriculos']:
+            yield self.linha_exportacao(nome_vaga, curriculo, resultado['data_analise'])
+
+    def abrir_exportacao(self, arquivo_saida=None):
+        """Escritor em streaming do arquivo de resultados (formato pela extensão)."""
+        escritor = exportacao_resultados.abrir_escritor(arquivo_saida or self.arquivo_resultados)
+        print(f"\n💾 Exportando resultados para {escritor.arquivo}...")
+        return escritor
+
+    def relatar_exportacao(self, escritor):
+        """Mostra o resultado da exportação."""
+        if escritor.linhas:
+            print(f"✅ Resultados exportados com sucesso: {escritor.linhas} registros de {escritor.vagas} vaga(s)")
         else:
             print("❌ Nenhum dado para exportar")
 
+    def exportar_resultados(self, arquivo_saida=None):
+        """Exporta todos os resultados em memória (CSV, Parquet ou XLSX, pela extensão).
+
+        Em execuções grandes já exportadas em streaming, a memória guarda só o
+        início do ranking de cada vaga (TOP_RELATORIO_EXECUCAO_GRANDE).
+        """
+        with self.abrir_exportacao(arquivo_saida) as escritor:
+            for nome_vaga, resultado in self.resultados_por_vaga.items():
+                escritor.escrever_vaga(nome_vaga, self.linhas_vaga(nome_vaga, resultado))
+        self.relatar_exportacao(escritor)
+        if self.top is not None:
+            self.exportar_resumo(caminho_resumo(escritor.arquivo))
+
+    def exportar_resultados_csv(self, arquivo_saida=ARQUIVO_RESULTADOS):
+        """Exporta todos os resultados para CSV (nome anterior de exportar_resultados)."""
+        self.exportar_resultados(arquivo_saida)
+
+    def exportar_resumo(self, arquivo_saida=None):
+        """Exporta as estatísticas de cada vaga (todos os currículos, não só o top K) em CSV."""
+        arquivo_saida = arquivo_saida or caminho_resumo(self.arquivo_resultados)
+        if not self.resultados_por_vaga:
+            return
+        linhas = []
+        for nome_vaga, resultado in self.resultados_por_vaga.items():
+            resumo = resultado['resumo']
+            linha = {campo: resumo.get(campo) for campo in ('total', 'aprovados', 'media', 'minimo', 'maximo')}
+            linha.update({f"p{p}": valor for p, valor in resumo['percentis'].items()})
+            linha.update(vaga=nome_vaga, taxa_aprovacao=round(resumo['taxa_aprovacao'], 1),
+                         data_analise=resultado['data_analise'])
+            if linha['media'] is not None:
+                linha['media'] = round(linha['media'], 1)
+            linhas.append(linha)
+
+        with open(arquivo_saida, 'w', newline='', encoding='utf-8') as f:
+            escritor = csv.DictWriter(f, fieldnames=CAMPOS_RESUMO, lineterminator=os.linesep)
+            escritor.writeheader()
+            escritor.writerows(linhas)
+        print(f"📊 Estatísticas por vaga exportadas: {arquivo_saida}")
+
     def criar_exemplo_estrutura(self):
         """Cria estrutura de exemplo para demonstração."""
         print("🏗️  Criando estrutura de exemplo...")
@@ -385,14 +714,11 @@ def main():
     """Função principal do organizador ATS."""
     organizer = ATSOrganizer()
 
-    # Executa análise organizada
-    if organizer.executar_analise_organizada():
+    # Executa análise organizada (resultados exportados ao fim de cada vaga)
+    if organizer.executar_analise_organizada(exportar=True):
         # Gera relatórios
         organizer.gerar_relatorios_por_vaga()
 
-        # Exporta resultados
-        organizer.exportar_resultados_csv()
-
     print("\n" + "=" * 60)
     print("🎯 Sistema organizado concluído!")
     print("💡 Use a estrutura de pastas para melhor organização")
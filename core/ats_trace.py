@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ATS Trace - Tempo por Etapa e por Documento de uma Execução
+===========================================================
+
+DESCRIÇÃO:
+Este módulo mede quanto tempo cada etapa de uma execução consome (descoberta
+de arquivos, conversão PDF/DOCX, tokenização, pontuação, relatórios, CSV e
+log Excel) e grava um trace JSON com totais por etapa, tempos por documento
+e os documentos mais lentos. É ativado com main.py --trace arquivo.json.
+
+LÓGICA DE FUNCIONAMENTO:
+
+1. INSTRUMENTAÇÃO SOB DEMANDA:
+   - Desativado, nada muda: as funções originais são chamadas diretamente
+   - Ao ativar, as funções do caminho crítico são substituídas por versões
+     que medem o tempo de cada chamada (time.perf_counter)
+   - Apenas módulos já importados pelo modo em execução são instrumentados
+   - Funções medidas: carregar_documento, carregar_arquivo, conversões
+     PDF/DOCX, tokenizar, analisar_compatibilidade, score_matrix, índice de
+     vagas, detecção de estrutura, relatórios, CSV e registrar_envio_log
+
+2. TEMPOS POR DOCUMENTO:
+   - A chamada mais externa que recebe um caminho (ex.: carregar_documento)
+     define o documento atual; conversão e tokenização internas são
+     atribuídas a ele
+   - O tempo total do documento é o da chamada mais externa
+
+3. PROCESSOS PARALELOS (--workers N):
+   - Cada processo mede seus documentos e devolve os tempos junto com o
+     resultado; o processo principal os incorpora ao trace
+
+4. TRACE JSON:
+   - etapas: chamadas, tempo total, média e máximo (tempos inclusivos:
+     uma etapa inclui as etapas chamadas dentro dela)
+   - documentos: tempo de cada etapa por documento
+   - mais_lentos: os N documentos de maior tempo total
+
+DEPENDÊNCIAS:
+- time, json, functools: biblioteca padrão
+
+EXEMPLO DE USO:
+python main.py organizado --trace log/trace.json
+
+ats_trace.ativar('log/trace.json')
+...
+ats_trace.finalizar()
+
+Autor: Cara Core Informática
+Data: 2025
+Licença: MIT
+"""
+
+import os
+import sys
+import json
+import time
+import functools
+import importlib
+from datetime import datetime
+
+VERSAO_TRACE = 1
+
+# Quantidade de documentos mais lentos listados no trace
+TOP_LENTOS = 10
+
+# (módulo, classe ou None, função, etapa, recebe o caminho do documento)
+ALVOS = [
+    ('core.ats_analyzer', None, 'carregar_documento', 'carregar_documento', True),
+    ('core.ats_analyzer', None, 'carregar_arquivo', 'carregar_arquivo', True),
+    ('core.ats_analyzer', None, 'converter_pdf_para_txt', 'conversao_pdf', True),
+    ('core.ats_analyzer', None, 'converter_docx_para_txt', 'conversao_docx', True),
+    ('core.ats_analyzer', None, 'tokenizar', 'tokenizar', False),
+    ('core.ats_analyzer', None, 'analisar_compatibilidade', 'analisar_compatibilidade', False),
+    ('core.ats_matriz', None, 'score_matrix', 'pontuacao_lote', False),
+    ('core.indice_vagas', 'IndiceInvertido', 'atualizar', 'indice_atualizacao', False),
+    ('core.indice_vagas', 'IndiceInvertido', 'buscar', 'indice_busca', False),
+    ('core.ats_organizer', 'ATSOrganizer', 'detectar_estrutura_vagas', 'descoberta', False),
+    ('core.ats_organizer', 'ATSOrganizer', 'listar_curriculos', 'descoberta', False),
+    ('core.ats_organizer', 'ATSOrganizer', 'gerar_relatorios_por_vaga', 'relatorios', False),
+    ('core.exportacao_resultados', 'EscritorResultados', 'escrever_vaga', 'exportar_resultados', False),
+    ('core.exportacao_resultados', 'EscritorResultados', 'fechar', 'exportar_resultados', False),
+    ('core.ats_email_integration', 'ATSEmailIntegration', 'registrar_envio_log', 'registrar_envio_log', False)
+]
+
+_trace = None
+_originais = []
+
+class TraceExecucao:
+    """Tempos acumulados por etapa e por documento."""
+
+    def __init__(self, arquivo=None):
+        """Inicializa um trace vazio (arquivo None: apenas em memória)."""
+        self.arquivo = arquivo
+        self.data_inicio = datetime.now()
+        self.inicio = time.perf_counter()
+        self.limpar()
+
+    def limpar(self):
+        """Descarta os tempos registrados."""
+        self.etapas = {}
+        self.documentos = {}
+        self.documento_atual = None
+
+    def registrar(self, etapa, duracao, documento=None):
+        """Acumula a duração de uma chamada da etapa (e do documento, se houver)."""
+        estatistica = self.etapas.get(etapa)
+        if estatistica is None:
+            estatistica = self.etapas[etapa] = [0, 0.0, 0.0]
+        estatistica[0] += 1
+        estatistica[1] += duracao
+        if duracao > estatistica[2]:
+            estatistica[2] = duracao
+
+        if documento is not None:
+            tempos = self.documentos.setdefault(documento, {})
+            tempos[etapa] = tempos.get(etapa, 0.0) + duracao
+
+    def registrar_total_documento(self, documento, duracao):
+        """Acumula o tempo total (chamada mais externa) do documento."""
+        tempos = self.documentos.setdefault(documento, {})
+        tempos['total'] = tempos.get('total', 0.0) + duracao
+
+    def parcial(self):
+        """Tempos registrados, em formato serializável entre processos."""
+        return {'etapas': self.etapas, 'documentos': self.documentos}
+
+    def mesclar(self, parcial):
+        """Incorpora os tempos medidos em outro processo."""
+        for etapa, (chamadas, total, maximo) in parcial['etapas'].items():
+            estatistica = self.etapas.setdefault(etapa, [0, 0.0, 0.0])
+            estatistica[0] += chamadas
+            estatistica[1] += total
+            estatistica[2] = max(estatistica[2], maximo)
+        for documento, tempos in parcial['documentos'].items():
+            destino = self.documentos.setdefault(documento, {})
+            for etapa, duracao in tempos.items():
+                destino[etapa] = destino.get(etapa, 0.0) + duracao
+
+    def relatorio(self, top=TOP_LENTOS):
+        """Monta o trace completo em formato JSON."""
+        etapas = {
+            etapa: {
+                'chamadas': chamadas,
+                'total_s': round(total, 6),
+                'media_ms': round(total / chamadas * 1000, 4) if chamadas else 0.0,
+                'max_ms': round(maximo * 1000, 4)
+            }
+            for etapa, (chamadas, total, maximo) in sorted(self.etapas.items(), key=lambda item: -item[1][1])
+        }
+        documentos = [
+            {'documento': documento, 'total_s': round(tempos.get('total', 0.0), 6),
+             'etapas': {etapa: round(duracao, 6) for etapa, duracao in tempos.items() if etapa != 'total'}}
+            for documento, tempos in self.documentos.items()
+        ]
+        mais_lentos = sorted(documentos, key=lambda d: -d['total_s'])[:top]
+
+        return {
+            'versao': VERSAO_TRACE,
+            'inicio': self.data_inicio.isoformat(timespec='seconds'),
+            'duracao_total_s': round(time.perf_counter() - self.inicio, 6),
+            'argumentos': sys.argv[1:],
+            'etapas': etapas,
+            'mais_lentos': mais_lentos,
+            'documentos': documentos
+        }
+
+def _instrumentar(funcao, etapa, por_documento):
+    """Cria a versão medida da função."""
+    @functools.wraps(funcao)
+    def instrumentada(*args, **kwargs):
+        trace = _trace
+        if trace is None:
+            return funcao(*args, **kwargs)
+
+        documento = trace.documento_atual
+        externa = por_documento and documento is None and bool(args)
+        if externa:
+            documento = trace.documento_atual = os.fspath(args[0])
+
+        inicio = time.perf_counter()
+        try:
+            return funcao(*args, **kwargs)
+        finally:
+            duracao = time.perf_counter() - inicio
+            trace.registrar(etapa, duracao, documento)
+            if externa:
+                trace.documento_atual = None
+                trace.registrar_total_documento(documento, duracao)
+
+    instrumentada.etapa_trace = etapa
+    return instrumentada
+
+def _instalar():
+    """Substitui as funções alvo pelas versões medidas."""
+    for nome_modulo, nome_classe, nome_funcao, etapa, por_documento in ALVOS:
+        # Só instrumenta módulos já importados (não carrega pandas/yagmail à toa)
+        modulo = sys.modules.get(nome_modulo)
+        if modulo is None:
+            continue
+        dono = getattr(modulo, nome_classe) if nome_classe else modulo
+        original = getattr(dono, nome_funcao)
+        if hasattr(original, 'etapa_trace'):
+            continue
+        _originais.append((dono, nome_funcao, original))
+        setattr(dono, nome_funcao, _instrumentar(original, etapa, por_documento))
+
+    # Os conversores também são referenciados pela tabela de extratores
+    ats_analyzer = importlib.import_module('core.ats_analyzer')
+    for extensao, (pacote, conversor) in list(ats_analyzer.EXTRATORES.items()):
+        ats_analyzer.EXTRATORES[extensao] = (pacote, getattr(ats_analyzer, conversor.__name__))
+
+def _desinstalar():
+    """Restaura as funções originais."""
+    while _originais:
+        dono, nome_funcao, original = _originais.pop()
+        setattr(dono, nome_funcao, original)
+
+    ats_analyzer = sys.modules.get('core.ats_analyzer')
+    if ats_analyzer is not None:
+        for extensao, (pacote, conversor) in list(ats_analyzer.EXTRATORES.items()):
+            ats_analyzer.EXTRATORES[extensao] = (pacote, getattr(ats_analyzer, conversor.__name__))
+
+def ativar(arquivo=None):
+    """Ativa o trace da execução (arquivo None: apenas em memória, ex.: processos filhos)."""
+    global _trace
+    if _trace is None:
+        _instalar()
+    _trace = TraceExecucao(arquivo)
+    return _trace
+
+def ativo():
+    """Indica se o trace está ativo."""
+    return _trace is not None
+
+def obter():
+    """Retorna o trace ativo (ou None)."""
+    return _trace
+
+def finalizar():
+    """Grava o trace JSON, exibe o resumo, restaura as funções e retorna o relatório."""
+    global _trace
+    trace = _trace
+    if trace is None:
+        return None
+    _trace = None
+    _desinstalar()
+
+    relatorio = trace.relatorio()
+    if trace.arquivo:
+        pasta = os.path.dirname(trace.arquivo)
+        if pasta:
+            os.makedirs(pasta, exist_ok=True)
+        with open(trace.arquivo, 'w', encoding='utf-8') as f:
+            json.dump(relatorio, f, ensure_ascii=False, indent=2)
+        imprimir_resumo(relatorio)
+        print(f"Trace gravado em {trace.arquivo}")
+    return relatorio
+
+def imprimir_resumo(relatorio, etapas=8, documentos=5):
+    """Exibe as etapas e os documentos mais demorados."""
+    print(f"\nTRACE DA EXECUCAO ({relatorio['duracao_total_s']:.2f} s)")
+    print(f"{'Etapa':<28}{'Chamadas':>10}{'Total s':>10}{'Media ms':>11}")
+    for etapa, dados in list(relatorio['etapas'].items())[:etapas]:
+        print(f"{etapa:<28}{dados['chamadas']:>10}{dados['total_s']:>10.3f}{dados['media_ms']:>11.3f}")
+
+    if relatorio['mais_lentos']:
+        print("Documentos mais lentos:")
+        for documento in relatorio['mais_lentos'][:documentos]:
+            print(f"   {documento['total_s'] * 1000:9.2f} ms  {documento['documento']}")
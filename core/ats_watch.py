@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ATS Watch - Monitoramento Contínuo de Currículos por Vaga
+========================================================
+
+DESCRIÇÃO:
+Este módulo mantém um processo em execução que acompanha a estrutura
+vagas/<nome_vaga>/curriculos e pontua cada currículo assim que ele chega,
+sem reiniciar o interpretador nem varrer novamente todos os arquivos a cada
+execução (como acontece ao rodar main.py organizado pelo cron).
+
+LÓGICA DE FUNCIONAMENTO:
+
+1. INICIALIZAÇÃO:
+   - Registra o estado atual das pastas (arquivos e assinaturas)
+   - Executa a análise organizada incremental e exporta o CSV de resultados
+   - As vagas ficam tokenizadas em memória (core.corpus)
+
+2. VERIFICAÇÃO PERIÓDICA (a cada N segundos):
+   - Consulta a data de modificação da pasta base, de cada pasta de vaga,
+     de cada vaga.txt e de cada pasta de currículos (poucas chamadas stat)
+   - Só lista uma pasta de currículos (os.scandir) quando a data dela muda
+   - Periodicamente faz uma varredura completa para detectar arquivos
+     editados no próprio lugar (que não alteram a data da pasta)
+
+3. PONTUAÇÃO SOB DEMANDA:
+   - Arquivo novo ou alterado é pontuado apenas contra a sua vaga
+   - O arquivo só é processado quando tamanho e data ficam estáveis entre
+     duas verificações (evita ler cópias pela metade)
+   - Vaga alterada: a vaga é recarregada e seus currículos são repontuados
+   - Cada resultado é acrescentado ao CSV de resultados
+
+DEPENDÊNCIAS:
+- core.ats_organizer: estrutura das vagas, análise inicial e formato do CSV
+- core.ats_matriz: cálculo da pontuação
+- core.resultados_compactos: resultado de cada currículo pontuado
+
+EXEMPLO DE USO:
+organizer = ATSOrganizer()
+monitor = MonitorVagas(organizer, intervalo=2)
+monitor.executar()
+
+Autor: Cara Core Informática
+Data: 2025
+Licença: MIT
+"""
+
+import os
+import time
+from datetime import datetime
+from core import ats_matriz
+from core import ats_organizer
+from core import resultados_compactos
+
+# Intervalo padrão entre verificações (segundos)
+INTERVALO_PADRAO = 2.0
+
+# A cada N verificações, confere todos os arquivos (edições no próprio lugar)
+CICLOS_VARREDURA_COMPLETA = 15
+
+EXTENSOES_CURRICULO = ('.txt', '.docx', '.pdf')
+
+def _mtime(caminho):
+    """Data de modificação (ns) do caminho, ou None se não existir."""
+    try:
+        return os.stat(caminho).st_mtime_ns
+    except OSError:
+        return None
+
+def _assinatura(caminho):
+    """Assinatura (tamanho, data de modificação) do arquivo, ou None se não existir."""
+    try:
+        info = os.stat(caminho)
+    except OSError:
+        return None
+    return (info.st_size, info.st_mtime_ns)
+
+def _listar_curriculos(pasta_curriculos):
+    """Assinaturas dos currículos suportados da pasta, usando os.scandir."""
+    arquivos = {}
+    try:
+        with os.scandir(pasta_curriculos) as entradas:
+            for entrada in entradas:
+                if entrada.name.lower().endswith(EXTENSOES_CURRICULO) and entrada.is_file():
+                    info = entrada.stat()
+                    arquivos[entrada.name] = (info.st_size, info.st_mtime_ns)
+    except OSError:
+        pass
+    return arquivos
+
+class MonitorVagas:
+    """Acompanha as pastas de vagas e pontua currículos assim que chegam."""
+
+    def __init__(self, organizer, intervalo=INTERVALO_PADRAO):
+        """Inicializa o monitor a partir de um ATSOrganizer."""
+        self.organizer = organizer
+        self.corpus = organizer.corpus
+        self.pasta_base = organizer.pasta_base
+        self.arquivo_resultados = organizer.arquivo_resultados
+        self.intervalo = intervalo
+        self.mtime_base = None
+        self.mtimes_pastas = {}
+        self.vagas = {}
+        self.ciclos = 0
+        self.pontuados = 0
+
+    def _novo_estado(self, nome_vaga):
+        """Estado inicial de uma vaga: nenhum arquivo conhecido."""
+        caminho = os.path.join(self.pasta_base, nome_vaga)
+        return {
+            'nome': nome_vaga,
+            'arquivo_vaga': os.path.join(caminho, 'vaga.txt'),
+            'pasta_curriculos': os.path.join(caminho, 'curriculos'),
+            'assinatura_vaga': None,
+            'mtime_curriculos': None,
+            'arquivos': {},
+            'pendentes': {}
+        }
+
+    def atualizar_estrutura(self):
+        """Detecta vagas criadas, completadas ou removidas na pasta base."""
+        mtime_base = _mtime(self.pasta_base)
+        if mtime_base != self.mtime_base:
+            self.mtime_base = mtime_base
+            try:
+                with os.scandir(self.pasta_base) as entradas:
+                    nomes = {e.name for e in entradas if e.is_dir()}
+            except OSError:
+                nomes = set()
+            for nome in set(self.mtimes_pastas) - nomes:
+                del self.mtimes_pastas[nome]
+            for nome in nomes:
+                self.mtimes_pastas.setdefault(nome, None)
+
+        # Uma vaga só é monitorada com vaga.txt e pasta curriculos presentes
+        for nome, mtime_anterior in self.mtimes_pastas.items():
+            mtime = _mtime(os.path.join(self.pasta_base, nome))
+            if mtime == mtime_anterior:
+                continue
+            self.mtimes_pastas[nome] = mtime
+            estado = self.vagas.get(nome) or self._novo_estado(nome)
+            completa = os.path.isfile(estado['arquivo_vaga']) and os.path.isdir(estado['pasta_curriculos'])
+            if completa and nome not in self.vagas:
+                self.vagas[nome] = estado
+                print(f"🆕 Vaga detectada: {nome}")
+            elif not completa and nome in self.vagas:
+                del self.vagas[nome]
+                print(f"🗑️  Vaga removida ou incompleta: {nome}")
+
+        for nome in set(self.vagas) - set(self.mtimes_pastas):
+            del self.vagas[nome]
+            print(f"🗑️  Vaga removida: {nome}")
+
+    def registrar_estado_atual(self):
+        """Marca vagas e currículos existentes como conhecidos."""
+        self.atualizar_estrutura()
+        for estado in self.vagas.values():
+            estado['assinatura_vaga'] = _assinatura(estado['arquivo_vaga'])
+            estado['mtime_curriculos'] = _mtime(estado['pasta_curriculos'])
+            estado['arquivos'] = _listar_curriculos(estado['pasta_curriculos'])
+
+    def verificar_vaga(self, estado, varredura_completa=False):
+        """Retorna os caminhos de currículos da vaga que precisam ser pontuados."""
+        assinatura_vaga = _assinatura(estado['arquivo_vaga'])
+        vaga_alterada = assinatura_vaga != estado['assinatura_vaga']
+
+        mtime = _mtime(estado['pasta_curriculos'])
+        if (mtime != estado['mtime_curriculos'] or varredura_completa
+                or estado['pendentes'] or vaga_alterada):
+            estado['mtime_curriculos'] = mtime
+            atuais = _listar_curriculos(estado['pasta_curriculos'])
+        else:
+            atuais = estado['arquivos']
+
+        for arquivo in set(estado['arquivos']) - set(atuais):
+            del estado['arquivos'][arquivo]
+            self.corpus.descartar(os.path.join(estado['pasta_curriculos'], arquivo))
+            print(f"🗑️  Currículo removido: {estado['nome']}/{arquivo}")
+
+        # Novos ou alterados só são processados quando estáveis por um ciclo
+        prontos = []
+        for arquivo, assinatura in atuais.items():
+            if estado['arquivos'].get(arquivo) == assinatura:
+                estado['pendentes'].pop(arquivo, None)
+            elif estado['pendentes'].get(arquivo) == assinatura:
+                del estado['pendentes'][arquivo]
+                estado['arquivos'][arquivo] = assinatura
+                prontos.append(arquivo)
+            else:
+                estado['pendentes'][arquivo] = assinatura
+        for arquivo in set(estado['pendentes']) - set(atuais):
+            del estado['pendentes'][arquivo]
+
+        if vaga_alterada:
+            if estado['assinatura_vaga'] is not None:
+                print(f"✏️  Vaga alterada: {estado['nome']} (currículos serão repontuados)")
+            estado['assinatura_vaga'] = assinatura_vaga
+            self.corpus.descartar(estado['arquivo_vaga'])
+            prontos = list(estado['arquivos'])
+
+        for arquivo in prontos:
+            self.corpus.descartar(os.path.join(estado['pasta_curriculos'], arquivo))
+        return [os.path.join(estado['pasta_curriculos'], arquivo) for arquivo in sorted(prontos)]
+
+    def pontuar(self, estado, caminhos):
+        """Pontua os currículos contra a vaga e retorna as linhas do CSV."""
+        vaga = self.corpus.documento(estado['arquivo_vaga'])
+        if vaga.erro:
+            print(f"❌ Erro ao carregar vaga {estado['nome']}: {vaga.erro}")
+            return []
+
+        documentos = []
+        for documento in self.corpus.documentos(caminhos):
+            if documento.erro:
+                print(f"❌ Erro ao processar {estado['nome']}/{documento.arquivo}: {documento.erro}")
+            elif documento.valido:
+                documentos.append(documento)
+
+        if not documentos:
+            return []
+
+        matriz = ats_matriz.score_matrix(documentos, [vaga])
+        data_analise = datetime.now()
+        linhas = []
+        for i, documento in enumerate(documentos):
+            pontuacao = matriz.pontuacao(i, 0)
+            curriculo = resultados_compactos.ResultadoCurriculo(
+                documento.arquivo, pontuacao, (), documento.total_tokens, vaga.total_tokens
+            )
+            status = "✅" if pontuacao >= 70 else "⚠️ "
+            print(f"{status} {estado['nome']}/{documento.arquivo}: Pontuação ATS {pontuacao}%")
+            linhas.append(self.organizer.linha_exportacao(estado['nome'], curriculo, data_analise))
+
+        self.pontuados += len(linhas)
+        return linhas
+
+    def anexar_resultados(self, linhas):
+        """Acrescenta as linhas ao CSV de resultados."""
+        pasta = os.path.dirname(self.arquivo_resultados)
+        if pasta:
+            os.makedirs(pasta, exist_ok=True)
+        ats_organizer.gravar_resultados_csv(self.arquivo_resultados, linhas, anexar=True)
+
+    def verificar(self):
+        """Executa uma verificação e pontua o que chegou; retorna quantos foram pontuados."""
+        self.ciclos += 1
+        varredura_completa = self.ciclos % CICLOS_VARREDURA_COMPLETA == 0
+        if varredura_completa:
+            self.mtime_base = None
+            self.mtimes_pastas = dict.fromkeys(self.mtimes_pastas)
+        self.atualizar_estrutura()
+
+        linhas = []
+        for estado in list(self.vagas.values()):
+            caminhos = self.verificar_vaga(estado, varredura_completa)
+            if caminhos:
+                linhas.extend(self.pontuar(estado, caminhos))
+
+        if linhas:
+            self.anexar_resultados(linhas)
+        return len(linhas)
+
+    def iniciar(self):
+        """Registra o estado atual e executa a análise inicial incremental."""
+        # O estado é registrado antes da análise: arquivos que chegarem durante
+        # a análise serão pontuados na primeira verificação
+        self.registrar_estado_atual()
+        if self.organizer.executar_analise_organizada(incremental=True):
+            self.organizer.exportar_resultados()
+
+    def executar(self, ciclos=None):
+        """Monitora as pastas até Ctrl+C (ou pelo número de ciclos informado)."""
+        self.iniciar()
+        print(f"\n👀 Monitorando {self.pasta_base}/*/curriculos a cada {self.intervalo}s (Ctrl+C para encerrar)")
+
+        try:
+            while ciclos is None or self.ciclos < ciclos:
+                time.sleep(self.intervalo)
+                self.verificar()
+        except KeyboardInterrupt:
+            print("\n⏹️  Monitoramento encerrado")
+
+        print(f"📊 Currículos pontuados durante o monitoramento: {self.pontuados}")
+        return self.pontuados
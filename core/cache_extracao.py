@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cache de Extração - Cache Persistente Endereçado por Conteúdo
+=============================================================
+
+DESCRIÇÃO:
+Este módulo mantém em disco o resultado da conversão de documentos PDF e DOCX
+(texto extraído e lista de tokens), evitando abrir novamente com pdfplumber ou
+python-docx arquivos que não mudaram desde a última execução.
+
+LÓGICA DE FUNCIONAMENTO:
+
+1. CHAVE DO CACHE:
+   - Hash SHA-256 do conteúdo binário do arquivo
+   - Nome do extrator (pdfplumber, python-docx)
+   - Versão instalada do extrator
+   - Renomear ou mover o arquivo não invalida a entrada; alterar o conteúdo
+     ou atualizar o extrator invalida
+
+2. ARMAZENAMENTO:
+   - Uma entrada JSON por documento em .cache/extracao/<xx>/<chave>.json
+   - Cada entrada guarda o texto extraído, os tokens e a versão do tokenizador
+   - Tokens gerados por outra versão do tokenizador são recalculados
+
+3. REMOÇÃO POR TAMANHO:
+   - O tamanho total do cache é limitado (padrão: 256 MB)
+   - Ao ultrapassar o limite, as entradas acessadas há mais tempo são removidas
+   - Cada leitura atualiza o horário de acesso da entrada (política LRU)
+   - Cada processo soma as próprias gravações ao último tamanho lido do disco
+     e relê o tamanho real a cada 1/FRACAO_RELEITURA do limite gravado; com
+     --workers N, o cache passa do limite em no máximo N/FRACAO_RELEITURA dele
+
+DEPENDÊNCIAS:
+- hashlib, json, os: apenas biblioteca padrão
+
+EXEMPLO DE USO:
+cache = CacheExtracao()
+chave = cache.gerar_chave(hash_arquivo('curriculo.pdf'), 'pdfplumber', '0.11.7')
+entrada = cache.obter(chave)
+if entrada is None:
+    cache.salvar(chave, texto, tokens, versao_tokenizador)
+
+Autor: Cara Core Informática
+Data: 2025
+Licença: MIT
+"""
+
+import os
+import json
+import hashlib
+
+# Configurações padrão do cache
+PASTA_CACHE_PADRAO = os.path.join('.cache', 'extracao')
+TAMANHO_MAXIMO_MB_PADRAO = 256
+TAMANHO_BLOCO_HASH = 1024 * 1024
+
+# Gravações de um processo (em frações do limite) entre releituras do tamanho real;
+# as gravações dos outros processos só aparecem na releitura
+FRACAO_RELEITURA = 16
+
+def hash_arquivo(caminho):
+    """Calcula o hash SHA-256 do conteúdo binário de um arquivo."""
+    sha = hashlib.sha256()
+    with open(caminho, 'rb') as f:
+        for bloco in iter(lambda: f.read(TAMANHO_BLOCO_HASH), b''):
+            sha.update(bloco)
+    return sha.hexdigest()
+
+class CacheExtracao:
+    """Cache em disco de textos e tokens extraídos de documentos."""
+
+    def __init__(self, pasta=PASTA_CACHE_PADRAO, tamanho_maximo_mb=TAMANHO_MAXIMO_MB_PADRAO):
+        """Inicializa o cache na pasta indicada com limite de tamanho."""
+        self.pasta = pasta
+        self.tamanho_maximo = int(tamanho_maximo_mb * 1024 * 1024)
+        self.acertos = 0
+        self.falhas = 0
+        self._tamanho_atual = None
+        self._gravados_desde_leitura = 0
+
+    def gerar_chave(self, hash_conteudo, extrator, versao_extrator):
+        """Gera a chave da entrada a partir do hash, extrator e versão."""
+        base = f"{hash_conteudo}|{extrator}|{versao_extrator}"
+        return hashlib.sha256(base.encode('utf-8')).hexdigest()
+
+    def _caminho_entrada(self, chave):
+        """Retorna o caminho do arquivo JSON de uma entrada."""
+        return os.path.join(self.pasta, chave[:2], f"{chave}.json")
+
+    def obter(self, chave):
+        """Retorna a entrada do cache ou None se não existir."""
+        caminho = self._caminho_entrada(chave)
+        try:
+            with open(caminho, 'r', encoding='utf-8') as f:
+                entrada = json.load(f)
+        except (OSError, ValueError):
+            self.falhas += 1
+            return None
+
+        # Atualiza horário de acesso para a política LRU
+        try:
+            os.utime(caminho, None)
+        except OSError:
+            pass
+
+        self.acertos += 1
+        return entrada
+
+    def salvar(self, chave, texto, tokens, versao_tokenizador):
+        """Grava uma entrada no cache e aplica o limite de tamanho."""
+        caminho = self._caminho_entrada(chave)
+        entrada = {
+            'texto': texto,
+            'tokens': tokens,
+            'versao_tokenizador': versao_tokenizador
+        }
+        try:
+            os.makedirs(os.path.dirname(caminho), exist_ok=True)
+            tamanho_anterior = os.path.getsize(caminho) if os.path.exists(caminho) else 0
+
+            # Escrita atômica para não deixar entradas corrompidas
+            caminho_temp = f"{caminho}.{os.getpid()}.tmp"
+            with open(caminho_temp, 'w', encoding='utf-8') as f:
+                json.dump(entrada, f, ensure_ascii=False)
+            os.replace(caminho_temp, caminho)
+
+            if self._tamanho_atual is not None:
+                gravados = os.path.getsize(caminho) - tamanho_anterior
+                self._tamanho_atual += gravados
+                self._gravados_desde_leitura += gravados
+        except OSError as e:
+            print(f"Erro ao gravar cache de extração: {e}")
+            return
+
+        self.aplicar_limite()
+
+    def _listar_entradas(self):
+        """Lista (horário de acesso, tamanho, caminho) de todas as entradas."""
+        entradas = []
+        if not os.path.isdir(self.pasta):
+            return entradas
+        for subpasta in os.scandir(self.pasta):
+            if not subpasta.is_dir():
+                continue
+            for item in os.scandir(subpasta.path):
+                if item.name.endswith('.json'):
+                    info = item.stat()
+                    entradas.append((info.st_mtime, info.st_size, item.path))
+        return entradas
+
+    def tamanho_total(self):
+        """Retorna o tamanho total ocupado pelo cache em bytes.
+
+        O valor é relido do disco na primeira chamada e depois de cada
+        1/FRACAO_RELEITURA do limite gravado por este processo, para incluir
+        as gravações de outros processos (--workers N).
+        """
+        if (self._tamanho_atual is None
+                or self._gravados_desde_leitura >= self.tamanho_maximo // FRACAO_RELEITURA):
+            self._tamanho_atual = sum(tamanho for _, tamanho, _ in self._listar_entradas())
+            self._gravados_desde_leitura = 0
+        return self._tamanho_atual
+
+    def aplicar_limite(self):
+        """Remove as entradas menos usadas até respeitar o tamanho máximo."""
+        if self.tamanho_total() <= self.tamanho_maximo:
+            return 0
+
+        removidas = 0
+        entradas = sorted(self._listar_entradas())
+        self._tamanho_atual = sum(tamanho for _, tamanho, _ in entradas)
+        self._gravados_desde_leitura = 0
+
+        for _, tamanho, caminho in entradas:
+            if self._tamanho_atual <= self.tamanho_maximo:
+                break
+            try:
+                os.remove(caminho)
+                self._tamanho_atual -= tamanho
+                removidas += 1
+            except OSError:
+                pass
+
+        return removidas
+
+    def limpar(self):
+        """Remove todas as entradas do cache."""
+        for _, _, caminho in self._listar_entradas():
+            try:
+                os.remove(caminho)
+            except OSError:
+                pass
+        self._tamanho_atual = 0
+        self._gravados_desde_leitura = 0
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cache de Planilhas - Snapshot Colunar das Planilhas Excel de Entrada
+====================================================================
+
+DESCRIÇÃO:
+Este módulo substitui pd.read_excel na leitura de empresas.xlsx e
+log/log_respostas.xlsx. Ao lado de cada planilha fica um snapshot do
+DataFrame em formato colunar, que é lido em milissegundos enquanto a
+planilha não muda; o openpyxl só é usado quando a planilha é alterada.
+
+LÓGICA DE FUNCIONAMENTO:
+
+1. SNAPSHOT AO LADO DA PLANILHA:
+   - empresas.xlsx → .empresas.xlsx.snapshot.<formato> e
+     .empresas.xlsx.snapshot.json (metadados)
+   - Formato: Feather ou Parquet quando o pyarrow está instalado; senão,
+     pickle do pandas (sem dependências extras)
+
+2. VALIDADE (tamanho, data de modificação e hash):
+   - Tamanho e data iguais aos dos metadados: snapshot usado sem ler a planilha
+   - Data alterada mas hash SHA-256 igual: snapshot usado e metadados atualizados
+   - Conteúdo alterado, snapshot ausente/ilegível ou outro formato/versão:
+     snapshot reconstruído
+
+3. RECONSTRUÇÃO EM STREAMING:
+   - openpyxl em modo somente leitura (read_only, values_only): as linhas
+     são lidas em sequência, sem montar o modelo completo da planilha
+   - Primeira linha = cabeçalho; linhas totalmente vazias são ignoradas
+   - Nomes de coluna como no read_excel: repetidos viram "A.1", "A.2"... e
+     células vazias do cabeçalho viram "Unnamed: i" (mesmo parser do pandas)
+   - Snapshot e metadados gravados em arquivos temporários e substituídos
+     ao final (leitores nunca veem arquivos pela metade)
+
+DEPENDÊNCIAS:
+- pandas: DataFrame e formatos de snapshot
+- openpyxl: leitura da planilha na reconstrução
+- pyarrow (opcional): snapshots Feather/Parquet
+- core.cache_extracao: hash do conteúdo
+
+EXEMPLO DE USO:
+df_empresas = ler_excel('empresas.xlsx')   # mesmo resultado de pd.read_excel
+
+Autor: Cara Core Informática
+Data: 2025
+Licença: MIT
+"""
+
+import os
+import json
+import importlib.util
+import pandas as pd
+from core import cache_extracao
+
+VERSAO_SNAPSHOT = 2
+
+# Formatos em ordem de preferência: (nome, extensão, exige pyarrow)
+FORMATOS = (
+    ('feather', 'feather', True),
+    ('parquet', 'parquet', True),
+    ('pickle', 'pkl', False)
+)
+
+def formato_disponivel():
+    """Primeiro formato de snapshot utilizável neste ambiente: (nome, extensão)."""
+    tem_pyarrow = importlib.util.find_spec('pyarrow') is not None
+    for nome, extensao, exige_pyarrow in FORMATOS:
+        if tem_pyarrow or not exige_pyarrow:
+            return nome, extensao
+
+def caminhos_snapshot(caminho, extensao):
+    """Caminhos do snapshot e dos metadados ao lado da planilha."""
+    pasta, nome = os.path.split(caminho)
+    base = os.path.join(pasta, f".{nome}.snapshot")
+    return f"{base}.{extensao}", f"{base}.json"
+
+def nomes_colunas(cabecalho):
+    """Nomes das colunas como o read_excel os gera (repetidos numerados, vazios "Unnamed: i")."""
+    from pandas.io.parsers import TextParser
+    if not cabecalho:
+        return []
+    return list(TextParser([['' if nome is None else nome for nome in cabecalho]], header=0).read().columns)
+
+def ler_planilha_streaming(caminho):
+    """Lê a primeira aba com openpyxl em modo somente leitura (como pd.read_excel)."""
+    from openpyxl import load_workbook
+    livro = load_workbook(caminho, read_only=True, data_only=True)
+    try:
+        linhas = livro.worksheets[0].iter_rows(values_only=True)
+        cabecalho = next(linhas, None) or ()
+        registros = [linha for linha in linhas if any(valor is not None for valor in linha)]
+    finally:
+        livro.close()
+
+    df = pd.DataFrame(registros, columns=nomes_colunas(cabecalho))
+    # None → NaN e tipos numéricos inferidos, como no read_excel
+    return df.fillna(float('nan')).infer_objects()
+
+def _gravar_snapshot(df, arquivo, formato):
+    """Grava o DataFrame no formato do snapshot."""
+    if formato == 'feather':
+        df.to_feather(arquivo)
+    elif formato == 'parquet':
+        df.to_parquet(arquivo)
+    else:
+        df.to_pickle(arquivo)
+
+def _ler_snapshot(arquivo, formato):
+    """Lê o snapshot no formato indicado."""
+    if formato == 'feather':
+        return pd.read_feather(arquivo)
+    if formato == 'parquet':
+        return pd.read_parquet(arquivo)
+    return pd.read_pickle(arquivo)
+
+def _ler_metadados(arquivo):
+    """Metadados do snapshot, ou dicionário vazio se ausentes ou inválidos."""
+    try:
+        with open(arquivo, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _gravar_atomico(arquivo, gravar):
+    """Grava via arquivo temporário e substitui o destino ao final."""
+    temporario = f"{arquivo}.{os.getpid()}.tmp"
+    gravar(temporario)
+    os.replace(temporario, arquivo)
+
+def ler_excel(caminho):
+    """Lê a planilha pelo snapshot quando válido; senão reconstrói o snapshot."""
+    formato, extensao = formato_disponivel()
+    arquivo_snapshot, arquivo_metadados = caminhos_snapshot(caminho, extensao)
+    info = os.stat(caminho)
+    metadados = _ler_metadados(arquivo_metadados)
+
+    valido = (metadados.get('versao') == VERSAO_SNAPSHOT and metadados.get('formato') == formato
+              and os.path.exists(arquivo_snapshot))
+    if valido and (metadados.get('tamanho'), metadados.get('mtime_ns')) != (info.st_size, info.st_mtime_ns):
+        # Data alterada sem mudança de conteúdo (cópia, checkout) mantém o snapshot
+        hash_atual = cache_extracao.hash_arquivo(caminho)
+        valido = hash_atual == metadados.get('hash')
+        if valido:
+            metadados.update(tamanho=info.st_size, mtime_ns=info.st_mtime_ns)
+            _gravar_atomico(arquivo_metadados, lambda t: _gravar_json(t, metadados))
+
+    if valido:
+        try:
+            return _ler_snapshot(arquivo_snapshot, formato)
+        except Exception:
+            pass
+
+    df = ler_planilha_streaming(caminho)
+    metadados = {
+        'versao': VERSAO_SNAPSHOT,
+        'formato': formato,
+        'tamanho': info.st_size,
+        'mtime_ns': info.st_mtime_ns,
+        'hash': cache_extracao.hash_arquivo(caminho),
+        'linhas': len(df)
+    }
+    try:
+        _gravar_atomico(arquivo_snapshot, lambda t: _gravar_snapshot(df, t, formato))
+        _gravar_atomico(arquivo_metadados, lambda t: _gravar_json(t, metadados))
+    except OSError as e:
+        print(f"⚠️  Snapshot de {caminho} não gravado: {e}")
+    return df
+
+def _gravar_json(arquivo, dados):
+    """Grava os metadados em JSON."""
+    with open(arquivo, 'w', encoding='utf-8') as f:
+        json.dump(dados, f, ensure_ascii=False)
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Casador de Empresas - Vagas Aprovadas × Planilha de Empresas em Uma Passada
+===========================================================================
+
+DESCRIÇÃO:
+Este módulo encontra, para cada vaga das candidaturas aprovadas, as linhas de
+empresas.xlsx cuja coluna Vaga contém o nome da vaga (sem diferenciar
+maiúsculas de minúsculas). A planilha é compilada uma vez por execução, e
+todas as vagas aprovadas são casadas com ela em uma única passada, em vez de
+um str.contains (expressão regular) sobre a planilha inteira por currículo.
+
+LÓGICA DE FUNCIONAMENTO:
+
+1. ÍNDICE POR CHAVE NORMALIZADA (uma vez por execução):
+   - Chave = texto da coluna Vaga em minúsculas (casefold), com espaços
+     repetidos reduzidos a um
+   - Empresas com a mesma vaga compartilham a chave: cada texto distinto é
+     examinado uma única vez
+   - Linhas sem vaga são ignoradas
+
+2. AUTÔMATO AHO-CORASICK (vagas aprovadas):
+   - Os nomes das vagas aprovadas, normalizados, formam um autômato
+     (trie + ligações de falha)
+   - Cada chave do índice é percorrida uma vez, caractere a caractere,
+     reportando todas as vagas que aparecem nela
+   - Custo: tamanho total das chaves + ocorrências, independente da
+     quantidade de currículos aprovados
+
+3. RESULTADO:
+   - Para cada vaga, os índices das linhas de empresas na ordem da planilha
+   - O nome da vaga é texto literal (antes era interpretado como regex)
+
+DEPENDÊNCIAS:
+- re: biblioteca padrão
+
+EXEMPLO DE USO:
+casador = CasadorEmpresas(df_empresas.to_dict('records'))
+correspondencias = casador.casar(['Python Developer', 'Dev Fullstack'])
+for i in correspondencias['Python Developer']:
+    empresa = casador.empresas[i]
+
+Autor: Cara Core Informática
+Data: 2025
+Licença: MIT
+"""
+
+import re
+
+_ESPACOS = re.compile(r'\s+')
+
+def normalizar(texto):
+    """Chave de comparação: minúsculas (casefold) e espaços simples."""
+    return _ESPACOS.sub(' ', texto.casefold()).strip()
+
+class AhoCorasick:
+    """Autômato Aho-Corasick: encontra todos os padrões de um texto em uma passada."""
+
+    def __init__(self, padroes):
+        """Monta a trie dos padrões e calcula as ligações de falha (busca em largura)."""
+        self.transicoes = [{}]
+        self.saidas = [[]]
+        self.falhas = [0]
+        for padrao in padroes:
+            estado = 0
+            for caractere in padrao:
+                proximo = self.transicoes[estado].get(caractere)
+                if proximo is None:
+                    proximo = self.transicoes[estado][caractere] = len(self.transicoes)
+                    self.transicoes.append({})
+                    self.saidas.append([])
+                    self.falhas.append(0)
+                estado = proximo
+            self.saidas[estado].append(padrao)
+
+        fila = list(self.transicoes[0].values())
+        for estado in fila:
+            for caractere, proximo in self.transicoes[estado].items():
+                fila.append(proximo)
+                falha = self.falhas[estado]
+                while falha and caractere not in self.transicoes[falha]:
+                    falha = self.falhas[falha]
+                destino = self.transicoes[falha].get(caractere, 0)
+                self.falhas[proximo] = destino if destino != proximo else 0
+                # Padrões que terminam no estado de falha também terminam aqui
+                self.saidas[proximo] = self.saidas[proximo] + self.saidas[self.falhas[proximo]]
+
+    def encontrar(self, texto):
+        """Conjunto dos padrões que ocorrem no texto."""
+        transicoes, falhas, saidas = self.transicoes, self.falhas, self.saidas
+        encontrados = set()
+        estado = 0
+        for caractere in texto:
+            while estado and caractere not in transicoes[estado]:
+                estado = falhas[estado]
+            estado = transicoes[estado].get(caractere, 0)
+            if saidas[estado]:
+                encontrados.update(saidas[estado])
+        return encontrados
+
+class CasadorEmpresas:
+    """Planilha de empresas indexada pela coluna Vaga normalizada."""
+
+    def __init__(self, empresas, coluna_vaga='Vaga'):
+        """Compila o índice chave normalizada → linhas (empresas: lista de dicionários)."""
+        self.empresas = empresas
+        self.por_chave = {}
+        for i, empresa in enumerate(empresas):
+            vaga = empresa.get(coluna_vaga)
+            if isinstance(vaga, str):
+                self.por_chave.setdefault(normalizar(vaga), []).append(i)
+
+    @classmethod
+    def de_dataframe(cls, df_empresas):
+        """Compila o casador a partir do DataFrame de empresas.xlsx."""
+        return cls(df_empresas.to_dict('records'))
+
+    def casar(self, nomes_vagas):
+        """Linhas de empresas cuja vaga contém cada nome (dicionário nome → índices)."""
+        nomes = {nome: normalizar(nome) for nome in nomes_vagas}
+        padroes = {padrao for padrao in nomes.values() if padrao}
+        linhas = {padrao: set() for padrao in padroes}
+
+        automato = AhoCorasick(padroes)
+        for chave, indices in self.por_chave.items():
+            for padrao in automato.encontrar(chave):
+                linhas[padrao].update(indices)
+
+        # Nome vazio está contido em qualquer vaga (como no str.contains anterior)
+        linhas[''] = {i for indices in self.por_chave.values() for i in indices}
+        return {nome: sorted(linhas[padrao]) for nome, padrao in nomes.items()}
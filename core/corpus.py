@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Corpus - Documentos Carregados Uma Única Vez por Execução
+=========================================================
+
+DESCRIÇÃO:
+Este módulo mantém em memória os documentos (currículos e vagas) já carregados
+durante uma execução. Cada arquivo é lido, convertido e tokenizado exatamente
+uma vez, e as mesmas estruturas de tokens são entregues ao analisador, ao
+organizador e à integração de email.
+
+LÓGICA DE FUNCIONAMENTO:
+
+1. CARREGAMENTO ÚNICO:
+   - Documentos são indexados pelo caminho absoluto
+   - O primeiro pedido carrega (conversão + tokenização); os seguintes reutilizam
+   - Lotes de documentos ausentes são carregados em paralelo (core.ingestao)
+
+2. ESTRUTURAS COMPARTILHADAS (core.vocabulario):
+   - ids: array('I') com o id de cada token, na ordem do texto
+   - ids_termos: array('I') com os ids distintos, na ordem de primeira ocorrência
+   - Os textos dos termos ficam uma única vez no vocabulário compartilhado
+   - tokens, termos e conjunto são decodificados sob demanda (exibição/índice)
+   - O texto completo não fica em memória, apenas seu tamanho
+
+3. CONTADORES:
+   - carregamentos: documentos efetivamente lidos do disco
+   - reutilizacoes: pedidos atendidos pela memória (carregamentos evitados)
+   - erros: documentos cujo carregamento falhou
+   - memória por documento, comparada à representação em lista de tokens
+
+DEPENDÊNCIAS:
+- core.ingestao: carregamento (paralelo) e tokenização
+- core.vocabulario: internação dos termos em ids
+
+EXEMPLO DE USO:
+corpus = Corpus(workers=4)
+documentos = corpus.documentos(['curriculos/joao.pdf', 'vagas/vaga.txt'])
+corpus.imprimir_estatisticas()
+corpus.imprimir_memoria()
+
+Autor: Cara Core Informática
+Data: 2025
+Licença: MIT
+"""
+
+import os
+import sys
+from array import array
+from core import ingestao
+from core import vocabulario as vocabulario_ats
+
+class Documento:
+    """Documento carregado e tokenizado, compartilhado entre os módulos."""
+
+    __slots__ = ('caminho', 'vocabulario', 'ids', 'ids_termos', 'tamanho_texto', 'erro')
+
+    def __init__(self, caminho, texto, tokens, erro=None, vocabulario=None):
+        """Interna os tokens do texto carregado no vocabulário compartilhado."""
+        self.caminho = caminho
+        self.vocabulario = vocabulario if vocabulario is not None else vocabulario_ats.VOCABULARIO
+        self.ids = self.vocabulario.codificar(tokens)
+        self.ids_termos = array(vocabulario_ats.TIPO_ID, dict.fromkeys(self.ids))
+        self.tamanho_texto = len(texto)
+        self.erro = erro
+
+    @property
+    def total_tokens(self):
+        """Quantidade de tokens do documento."""
+        return len(self.ids)
+
+    @property
+    def tokens(self):
+        """Tokens na ordem do texto (decodificados do vocabulário)."""
+        return self.vocabulario.decodificar(self.ids)
+
+    @property
+    def termos(self):
+        """Termos distintos na ordem de primeira ocorrência (decodificados)."""
+        return self.vocabulario.decodificar(self.ids_termos)
+
+    @property
+    def conjunto(self):
+        """Conjunto dos termos distintos (decodificado)."""
+        return frozenset(self.termos)
+
+    def memoria(self):
+        """Bytes ocupados pelo documento (objeto e arrays de ids)."""
+        return sys.getsizeof(self) + sys.getsizeof(self.ids) + sys.getsizeof(self.ids_termos)
+
+    @property
+    def arquivo(self):
+        """Nome do arquivo do documento."""
+        return os.path.basename(self.caminho)
+
+    @property
+    def valido(self):
+        """Indica se o documento foi carregado com conteúdo."""
+        return self.erro is None and self.tamanho_texto > 0
+
+class Corpus:
+    """Conjunto de documentos carregados uma única vez por execução."""
+
+    def __init__(self, workers=1, vocabulario=None):
+        """Inicializa o corpus vazio."""
+        self.workers = workers
+        self.vocabulario = vocabulario if vocabulario is not None else vocabulario_ats.VOCABULARIO
+        self._documentos = {}
+        self.carregamentos = 0
+        self.reutilizacoes = 0
+        self.erros = 0
+
+    def _chave(self, caminho):
+        """Normaliza o caminho usado como chave do corpus."""
+        return os.path.abspath(caminho)
+
+    def _registrar(self, caminho, texto, tokens, erro):
+        """Guarda um documento recém-carregado e atualiza os contadores."""
+        documento = Documento(caminho, texto, tokens, erro, self.vocabulario)
+        self._documentos[self._chave(caminho)] = documento
+        self.carregamentos += 1
+        if erro:
+            self.erros += 1
+        return documento
+
+    def documento(self, caminho):
+        """Retorna o documento do caminho, carregando-o apenas na primeira vez."""
+        documento = self._documentos.get(self._chave(caminho))
+        if documento is not None:
+            self.reutilizacoes += 1
+            return documento
+        return self._registrar(*ingestao.processar_documento(caminho))
+
+    def documentos(self, caminhos):
+        """Retorna os documentos dos caminhos, na ordem, carregando os ausentes em lote."""
+        ausentes = []
+        vistos = set()
+        for caminho in caminhos:
+            chave = self._chave(caminho)
+            if chave not in self._documentos and chave not in vistos:
+                vistos.add(chave)
+                ausentes.append(caminho)
+
+        for resultado in ingestao.carregar_documentos(ausentes, self.workers):
+            self._registrar(*resultado)
+
+        resultado = []
+        for caminho in caminhos:
+            chave = self._chave(caminho)
+            if chave in vistos:
+                vistos.discard(chave)
+            else:
+                self.reutilizacoes += 1
+            resultado.append(self._documentos[chave])
+        return resultado
+
+    def descartar(self, caminho):
+        """Remove o documento da memória para que seja recarregado no próximo pedido."""
+        self._documentos.pop(self._chave(caminho), None)
+
+    def __len__(self):
+        """Quantidade de documentos em memória."""
+        return len(self._documentos)
+
+    def estatisticas(self):
+        """Retorna os contadores de uso do corpus."""
+        return {
+            'documentos': len(self._documentos),
+            'carregamentos': self.carregamentos,
+            'reutilizacoes': self.reutilizacoes,
+            'erros': self.erros
+        }
+
+    def memoria(self):
+        """Bytes dos documentos em memória, por documento e comparados à lista de tokens."""
+        documentos = list(self._documentos.values())
+        bytes_documentos = sum(documento.memoria() for documento in documentos)
+        bytes_lista = self.vocabulario.bytes_lista_tokens(documentos)
+        quantidade = len(documentos) or 1
+        return {
+            'documentos': len(documentos),
+            'termos_vocabulario': len(self.vocabulario),
+            'bytes_documentos': bytes_documentos,
+            'bytes_vocabulario': self.vocabulario.memoria(),
+            'bytes_por_documento': round(bytes_documentos / quantidade, 1),
+            'bytes_por_documento_lista_tokens': round(bytes_lista / quantidade, 1)
+        }
+
+    def imprimir_estatisticas(self):
+        """Exibe os contadores de uso do corpus."""
+        print(f"Corpus: {self.carregamentos} documento(s) carregado(s), "
+              f"{self.reutilizacoes} carregamento(s) evitado(s), {self.erros} erro(s)")
+
+    def imprimir_memoria(self):
+        """Exibe a memória por documento e a economia em relação à lista de tokens."""
+        memoria = self.memoria()
+        if not memoria['documentos']:
+            return
+        print(f"Memoria: {memoria['bytes_por_documento']:.0f} bytes/documento com ids "
+              f"(lista de tokens: {memoria['bytes_por_documento_lista_tokens']:.0f}); "
+              f"vocabulario com {memoria['termos_vocabulario']} termos em {memoria['bytes_vocabulario'] / 1024:.1f} KB")
@@ -5,6 +5,10 @@ Dashboard Streamlit para Sending_CV
 ===================================
 
 Interface web para monitoramento e controle do sistema de envio de currículos.
+Métricas e gráficos vêm de agregados incrementais (core.painel_envios); as
+tabelas são paginadas e filtradas no registro de envios (SQLite). Cada
+atualização (botão ou automática, em intervalos) lê apenas os envios novos e
+só relê empresas.xlsx quando a planilha muda.
 """
 
 import streamlit as st
@@ -13,6 +17,13 @@ import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import os
+import sys
+
+# streamlit run core/dashboard.py: a raiz do projeto entra no caminho de importação
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import painel_envios
+from core import registro_envios
 
 # Configuração da página
 st.set_page_config(
@@ -22,65 +33,41 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-@st.cache_data
-def load_data():
-    """Carrega os dados dos arquivos Excel."""
+@st.cache_resource
+def carregar_painel():
+    """Carrega o painel: agregados do registro de envios e planilha de empresas."""
+    registro_path = registro_envios.ARQUIVO_REGISTRO_PADRAO
+    log_path = os.path.join('log', 'log_respostas.xlsx')
+    if not os.path.exists(registro_path):
+        # Primeira execução: importa a planilha de log para o registro
+        registro_envios.RegistroEnvios(registro_path, log_path).fechar()
+
+    # Empresas acompanhadas pela assinatura da planilha (relidas só se mudar)
+    painel = painel_envios.PainelEnvios(registro_path, arquivo_empresas='empresas.xlsx')
+    painel.atualizar()
+    return painel
+
+def seletor_pagina(rotulo, total, tamanho):
+    """Seletor de página para uma tabela com o total de linhas informado."""
+    paginas = painel_envios.total_paginas(total, tamanho)
+    pagina = st.number_input(f"{rotulo} - página (de {paginas}):", min_value=1, max_value=paginas, value=1)
+    return int(pagina)
+
+def exibir_painel(painel, status, tamanho_pagina):
+    """Métricas, gráficos e tabelas, após acrescentar os envios novos do registro."""
     try:
-        log_path = os.path.join('log', 'log_respostas.xlsx')
-        if os.path.exists(log_path):
-            df_log = pd.read_excel(log_path)
-        else:
-            df_log = pd.DataFrame()
-            
-        if os.path.exists('empresas.xlsx'):
-            df_empresas = pd.read_excel('empresas.xlsx')
-        else:
-            df_empresas = pd.DataFrame()
-            
-        return df_log, df_empresas
+        painel.atualizar()
     except Exception as e:
-        st.error(f"Erro ao carregar dados: {e}")
-        return pd.DataFrame(), pd.DataFrame()
-
-def main():
-    """Função principal do dashboard."""
-    
-    # Header
-    st.title("Sending_CV Dashboard")
-    st.markdown("**Sistema de Automação de Envio de Currículos**")
-    st.divider()
-    
-    # Carrega dados
-    df_log, df_empresas = load_data()
-    
-    # Sidebar
-    st.sidebar.header("Controles")
-    
-    # Filtros
-    if not df_log.empty:
-        status_options = ['Todos'] + df_log['Status'].unique().tolist()
-        status_filter = st.sidebar.selectbox("Filtrar por Status:", status_options)
-        
-        if status_filter != 'Todos':
-            df_filtered = df_log[df_log['Status'] == status_filter]
-        else:
-            df_filtered = df_log
-    else:
-        df_filtered = df_log
+        st.error(f"Erro ao atualizar dados: {e}")
+        return
     
     # Métricas principais
     col1, col2, col3, col4 = st.columns(4)
     
-    if not df_log.empty:
-        total_envios = len(df_log)
-        total_respostas = len(df_log[df_log['Status'].isin(['Entrevista', 'Respondido'])])
-        taxa_resposta = (total_respostas / total_envios * 100) if total_envios > 0 else 0
-        followups_pendentes = len(df_log[df_log['Status'] == 'Sem Retorno'])
-    else:
-        total_envios = total_respostas = taxa_resposta = followups_pendentes = 0
-    
-    total_empresas = len(df_empresas) if not df_empresas.empty else 0
-    empresas_restantes = total_empresas - total_envios
+    total_envios = painel.total
+    total_respostas = painel.total_respostas
+    taxa_resposta = (total_respostas / total_envios * 100) if total_envios > 0 else 0
+    followups_pendentes = painel.followups_pendentes
     
     with col1:
         st.metric("Total de Envios", total_envios)
@@ -96,18 +83,18 @@ def main():
     
     st.divider()
     
-    # Gráficos
-    if not df_log.empty:
+    # Gráficos (a partir dos agregados: um ponto por status e por dia)
+    if painel.total:
         col1, col2 = st.columns(2)
         
         with col1:
             st.subheader("Status dos Envios")
             
             # Gráfico de pizza para status
-            status_counts = df_log['Status'].value_counts()
+            status_counts = painel.por_status.most_common()
             fig_pie = px.pie(
-                values=status_counts.values,
-                names=status_counts.index,
+                values=[total for _, total in status_counts],
+                names=[nome for nome, _ in status_counts],
                 title="Distribuição por Status"
             )
             st.plotly_chart(fig_pie, use_container_width=True)
@@ -115,27 +102,26 @@ def main():
         with col2:
             st.subheader("Envios por Data")
             
-            # Converter Data_Envio para datetime se necessário
-            if 'Data_Envio' in df_log.columns:
-                df_log['Data_Envio'] = pd.to_datetime(df_log['Data_Envio'])
-                envios_por_data = df_log.groupby(df_log['Data_Envio'].dt.date).size()
-                
-                fig_line = px.line(
-                    x=envios_por_data.index,
-                    y=envios_por_data.values,
-                    title="Histórico de Envios",
-                    labels={'x': 'Data', 'y': 'Número de Envios'}
-                )
-                st.plotly_chart(fig_line, use_container_width=True)
-    
-    # Tabelas
+            dias, envios = painel.envios_por_dia()
+            fig_line = px.line(
+                x=pd.to_datetime(dias),
+                y=envios,
+                title="Histórico de Envios",
+                labels={'x': 'Data', 'y': 'Número de Envios'}
+            )
+            st.plotly_chart(fig_line, use_container_width=True)
+    
+    # Tabelas (paginadas)
     col1, col2 = st.columns(2)
     
     with col1:
         st.subheader("Log de Respostas")
-        if not df_filtered.empty:
+        total_filtrado = painel.total_log(status)
+        if total_filtrado:
+            pagina = seletor_pagina("Log", total_filtrado, tamanho_pagina)
             st.dataframe(
-                df_filtered[['Empresa', 'Vaga', 'Status', 'Data_Envio', 'Observações']],
+                painel.pagina_log(status, pagina, tamanho_pagina,
+                                  ['Empresa', 'Vaga', 'Status', 'Data_Envio', 'Observações']),
                 use_container_width=True
             )
         else:
@@ -143,19 +129,47 @@ def main():
     
     with col2:
         st.subheader("Empresas Pendentes")
-        if not df_empresas.empty and not df_log.empty:
-            empresas_contatadas = df_log['Email'].tolist()
-            empresas_pendentes = df_empresas[~df_empresas['Email'].isin(empresas_contatadas)]
-            
-            if not empresas_pendentes.empty:
-                st.dataframe(empresas_pendentes, use_container_width=True)
+        if not painel.df_empresas.empty:
+            if painel.total_pendentes:
+                pagina = seletor_pagina("Empresas", painel.total_pendentes, tamanho_pagina)
+                st.dataframe(painel.pagina_pendentes(pagina, tamanho_pagina), use_container_width=True)
             else:
                 st.success("Todas as empresas já foram contatadas!")
-        elif not df_empresas.empty:
-            st.dataframe(df_empresas, use_container_width=True)
         else:
             st.info("Nenhuma empresa cadastrada")
     
+    st.caption(f"Atualizado às {datetime.now():%H:%M:%S} ({painel.total} envios no registro)")
+
+def main():
+    """Função principal do dashboard."""
+    
+    # Header
+    st.title("Sending_CV Dashboard")
+    st.markdown("**Sistema de Automação de Envio de Currículos**")
+    st.divider()
+    
+    # Carrega dados (agregados mantidos entre interações)
+    try:
+        painel = carregar_painel()
+    except Exception as e:
+        st.error(f"Erro ao carregar dados: {e}")
+        return
+    
+    # Sidebar
+    st.sidebar.header("Controles")
+    
+    # Filtros (aplicados no SQLite, só a página visível é carregada)
+    status_options = ['Todos'] + sorted(painel.por_status)
+    status_filter = st.sidebar.selectbox("Filtrar por Status:", status_options)
+    status = None if status_filter == 'Todos' else status_filter
+    tamanho_pagina = st.sidebar.selectbox("Linhas por página:", [25, 50, 100, 200], index=1)
+    
+    # Atualização automática: só o painel é reexecutado, lendo os envios novos
+    intervalo = None
+    if st.sidebar.toggle("Atualização automática"):
+        intervalo = st.sidebar.selectbox("Intervalo (segundos):", [5, 10, 30, 60], index=1)
+    st.fragment(run_every=intervalo)(exibir_painel)(painel, status, tamanho_pagina)
+    
     # Ações rápidas
     st.divider()
     st.subheader("Ações Rápidas")
@@ -164,7 +178,7 @@ def main():
     
     with col1:
         if st.button("Atualizar Dados", type="primary"):
-            st.cache_data.clear()
+            # Mantém os agregados em cache; a nova execução soma só os envios novos
             st.rerun()
     
     with col2:
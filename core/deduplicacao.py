@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Deduplicação - Agrupamento de Currículos e Vagas Quase Idênticos
+================================================================
+
+DESCRIÇÃO:
+Este módulo agrupa documentos quase idênticos (ex.: joao_silva.txt,
+joao_silva_ats.txt e joao_silva_otimizado.txt, ou vagas republicadas) para
+que a pontuação seja calculada uma única vez por grupo. Cada duplicata recebe
+o resultado do representante do grupo, e o relatório informa quanto trabalho
+foi evitado.
+
+LÓGICA DE FUNCIONAMENTO:
+
+1. ASSINATURAS MINHASH (na ingestão):
+   - Calculadas sobre os ids dos termos distintos do documento (core.vocabulario),
+     o mesmo conjunto que define a pontuação ATS
+   - 128 funções de hash (multiplicação e deslocamento, semente fixa):
+     a fração de posições iguais estima a similaridade de Jaccard
+
+2. LSH (LOCALITY-SENSITIVE HASHING):
+   - A assinatura é dividida em bandas; documentos com alguma banda idêntica
+     são candidatos a duplicata
+   - A quantidade de bandas é escolhida para encontrar, com 99% de chance,
+     pares com a similaridade mínima configurada
+   - Só os representantes entram nas tabelas: o custo cresce com o número de
+     documentos, não com o número de pares
+
+3. AGRUPAMENTO:
+   - Documentos processados em ordem de caminho (resultado determinístico)
+   - Candidatos cuja similaridade estimada pela assinatura fica bem abaixo
+     do mínimo são descartados sem comparar os termos
+   - Os demais, do mais ao menos parecido, são confirmados pela similaridade
+     de Jaccard exata
+   - O documento vira duplicata do primeiro representante confirmado,
+     ou se torna representante de um novo grupo
+   - Documentos vazios nunca são agrupados
+
+4. CONFIGURAÇÃO (config.yaml):
+   ats:
+     deduplicacao:
+       habilitada: true
+       similaridade_minima: 0.9
+   - main.py --sem-deduplicacao pontua todos os documentos
+
+DEPENDÊNCIAS:
+- numpy: assinaturas MinHash vetorizadas
+- yaml: leitura da configuração (importado sob demanda)
+
+EXEMPLO DE USO:
+deduplicador = Deduplicador(similaridade_minima=0.9)
+grupos = deduplicador.agrupar(documentos)
+representantes = [documentos[i] for i in grupos.representantes]
+grupos.imprimir_resumo('currículo(s)')
+
+Autor: Cara Core Informática
+Data: 2025
+Licença: MIT
+"""
+
+import os
+import numpy as np
+
+SIMILARIDADE_PADRAO = 0.9
+
+# Funções de hash da assinatura MinHash
+NUM_PERMUTACOES = 128
+
+# Folga da similaridade estimada antes da confirmação exata (~3 desvios padrão)
+MARGEM_ESTIMATIVA = 0.1
+
+# Probabilidade mínima de um par com a similaridade configurada virar candidato
+PROBABILIDADE_CANDIDATO = 0.99
+
+SEMENTE = 20250101
+
+ARQUIVO_CONFIG_PADRAO = 'config.yaml'
+
+def escolher_bandas(similaridade_minima, num_permutacoes=NUM_PERMUTACOES):
+    """Escolhe (bandas, linhas por banda): o mínimo de candidatos falsos com 99% de recall."""
+    escolha = (num_permutacoes, 1)
+    for linhas in range(1, num_permutacoes + 1):
+        if num_permutacoes % linhas:
+            continue
+        bandas = num_permutacoes // linhas
+        if 1 - (1 - similaridade_minima ** linhas) ** bandas >= PROBABILIDADE_CANDIDATO:
+            escolha = (bandas, linhas)
+    return escolha
+
+def jaccard(ids_a, ids_b):
+    """Similaridade de Jaccard exata entre dois conjuntos de ids distintos."""
+    a = np.frombuffer(ids_a, dtype=np.uint32)
+    b = np.frombuffer(ids_b, dtype=np.uint32)
+    if len(a) == 0 or len(b) == 0:
+        return 0.0
+    comuns = len(np.intersect1d(a, b, assume_unique=True))
+    return comuns / (len(a) + len(b) - comuns)
+
+class Agrupamento:
+    """Resultado do agrupamento: representante e similaridade de cada documento."""
+
+    def __init__(self, documentos, representante, similaridade):
+        """Inicializa com o índice do representante de cada documento."""
+        self.documentos = documentos
+        self.representante = representante
+        self.similaridade = similaridade
+
+    @property
+    def representantes(self):
+        """Índices dos documentos que são representantes de grupo, na ordem original."""
+        return [i for i, r in enumerate(self.representante) if r == i]
+
+    @property
+    def duplicatas(self):
+        """Quantidade de documentos que reaproveitam o resultado de outro."""
+        return sum(1 for i, r in enumerate(self.representante) if r != i)
+
+    def duplicata_de(self, i):
+        """Documento representante do documento i (None se ele próprio for representante)."""
+        r = self.representante[i]
+        return None if r == i else self.documentos[r]
+
+    def grupos(self):
+        """Grupos com mais de um documento: representante → duplicatas."""
+        grupos = {}
+        for i, r in enumerate(self.representante):
+            if r != i:
+                grupos.setdefault(r, []).append(i)
+        return grupos
+
+    def imprimir_resumo(self, descricao='documento(s)'):
+        """Exibe os grupos de duplicatas encontrados."""
+        grupos = self.grupos()
+        if not grupos:
+            return
+        print(f"Duplicatas: {self.duplicatas} de {len(self.documentos)} {descricao} "
+              f"agrupado(s) em {len(grupos)} grupo(s)")
+        for r, membros in grupos.items():
+            nomes = ', '.join(f"{self.documentos[i].arquivo} ({self.similaridade[i]:.0%})" for i in membros)
+            print(f"   {self.documentos[r].arquivo} <- {nomes}")
+
+class Deduplicador:
+    """Agrupa documentos do corpus quase idênticos usando MinHash/LSH."""
+
+    def __init__(self, similaridade_minima=SIMILARIDADE_PADRAO, num_permutacoes=NUM_PERMUTACOES):
+        """Inicializa as funções de hash e a divisão em bandas."""
+        self.similaridade_minima = similaridade_minima
+        self.num_permutacoes = num_permutacoes
+        self.bandas, self.linhas = escolher_bandas(similaridade_minima, num_permutacoes)
+
+        gerador = np.random.default_rng(SEMENTE)
+        maximo = np.iinfo(np.uint64).max
+        self.multiplicadores = gerador.integers(1, maximo, size=num_permutacoes, dtype=np.uint64, endpoint=True) | np.uint64(1)
+        self.deslocamentos = gerador.integers(0, maximo, size=num_permutacoes, dtype=np.uint64, endpoint=True)
+        self.pesos_banda = gerador.integers(1, maximo, size=self.linhas, dtype=np.uint64, endpoint=True) | np.uint64(1)
+
+        # Estatísticas acumuladas (documentos vistos e duplicatas encontradas)
+        self.documentos = 0
+        self.duplicatas = 0
+
+    def assinatura(self, documento):
+        """Assinatura MinHash dos termos distintos do documento (None se vazio)."""
+        ids = np.frombuffer(documento.ids_termos, dtype=np.uint32).astype(np.uint64)
+        if len(ids) == 0:
+            return None
+        # Hash (a·x + b) mod 2^64, usando os 32 bits mais altos
+        hashes = (ids[:, None] * self.multiplicadores + self.deslocamentos) >> np.uint64(32)
+        return hashes.min(axis=0).astype(np.uint32)
+
+    def chaves_bandas(self, assinatura):
+        """Uma chave inteira por banda da assinatura."""
+        bandas = assinatura[:self.bandas * self.linhas].reshape(self.bandas, self.linhas).astype(np.uint64)
+        return (bandas * self.pesos_banda).sum(axis=1).tolist()
+
+    def agrupar(self, documentos):
+        """Agrupa os documentos e retorna o Agrupamento (índices na ordem recebida)."""
+        documentos = list(documentos)
+        representante = list(range(len(documentos)))
+        similaridade = [1.0] * len(documentos)
+        tabelas = [{} for _ in range(self.bandas)]
+        assinaturas = np.zeros((len(documentos), self.num_permutacoes), dtype=np.uint32)
+        minimo_estimado = self.similaridade_minima - MARGEM_ESTIMATIVA
+
+        for i in sorted(range(len(documentos)), key=lambda i: documentos[i].caminho):
+            assinatura = self.assinatura(documentos[i])
+            if assinatura is None:
+                continue
+            chaves = self.chaves_bandas(assinatura)
+
+            candidatos = set()
+            for tabela, chave in zip(tabelas, chaves):
+                candidatos.update(tabela.get(chave, ()))
+
+            confirmado = False
+            if candidatos:
+                candidatos = np.fromiter(sorted(candidatos), dtype=np.int64, count=len(candidatos))
+                estimativas = (assinaturas[candidatos] == assinatura).mean(axis=1)
+                for k in np.argsort(-estimativas, kind='stable'):
+                    if estimativas[k] < minimo_estimado:
+                        break
+                    r = int(candidatos[k])
+                    valor = jaccard(documentos[i].ids_termos, documentos[r].ids_termos)
+                    if valor >= self.similaridade_minima:
+                        representante[i] = r
+                        similaridade[i] = valor
+                        confirmado = True
+                        break
+
+            if not confirmado:
+                assinaturas[i] = assinatura
+                for tabela, chave in zip(tabelas, chaves):
+                    tabela.setdefault(chave, []).append(i)
+
+        agrupamento = Agrupamento(documentos, representante, similaridade)
+        self.documentos += len(documentos)
+        self.duplicatas += agrupamento.duplicatas
+        return agrupamento
+
+def carregar_deduplicador(arquivo_config=ARQUIVO_CONFIG_PADRAO):
+    """Cria o Deduplicador conforme config.yaml (None se desabilitado)."""
+    configuracao = {}
+    if os.path.exists(arquivo_config):
+        import yaml
+        try:
+            with open(arquivo_config, 'r', encoding='utf-8') as f:
+                configuracao = ((yaml.safe_load(f) or {}).get('ats') or {}).get('deduplicacao') or {}
+        except Exception as e:
+            print(f"⚠️  Configuração de deduplicação ignorada ({e})")
+
+    if not configuracao.get('habilitada', True):
+        return None
+    return Deduplicador(float(configuracao.get('similaridade_minima', SIMILARIDADE_PADRAO)))
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Envio Assíncrono - Caixa de Saída SMTP com Conexões Reaproveitadas
+==================================================================
+
+DESCRIÇÃO:
+Este módulo envia os emails das candidaturas aprovadas a partir de uma caixa
+de saída assíncrona (asyncio), executada em uma thread própria. O processo
+principal monta as mensagens e as coloca na fila sem esperar pelo SMTP nem
+pelo intervalo entre envios (delay_entre_emails).
+
+LÓGICA DE FUNCIONAMENTO:
+
+1. MENSAGENS MONTADAS COM ANTECEDÊNCIA:
+   - montar_mensagem cria o EmailMessage (assunto, corpo e anexos) no
+     processo principal, enquanto os envios anteriores ainda acontecem
+   - O remetente é definido no envio, pela conta que enviar a mensagem
+
+2. CONEXÕES REAPROVEITADAS:
+   - Uma conexão SMTP autenticada por conta, aberta no primeiro envio e
+     reaproveitada para todas as mensagens seguintes
+   - STARTTLS quando o servidor oferece; SSL direto na porta 465
+   - Conexão derrubada pelo servidor: reconecta e tenta de novo uma vez
+
+3. INTERVALO POR CONTA:
+   - Cada conta tem um trabalhador que consome a fila compartilhada
+   - delay_entre_emails é o intervalo mínimo entre dois envios da mesma conta,
+     aguardado com asyncio.sleep (não bloqueia a thread principal)
+   - Com várias contas (email.contas_adicionais), os envios ocorrem em paralelo
+
+4. RESULTADOS:
+   - ao_enviar(contexto, erro) é chamado após cada envio (erro None = sucesso),
+     na thread da caixa de saída
+   - concluir() espera a fila esvaziar, fecha as conexões e retorna as
+     estatísticas (enviados, falhas, conexões abertas, duração)
+
+DEPENDÊNCIAS:
+- asyncio, smtplib, email, threading: biblioteca padrão
+- aiosmtpd (apenas nos testes): servidor SMTP local de teste
+
+EXEMPLO DE USO:
+caixa = CaixaSaida(contas_configuradas(config), delay=30, ao_enviar=registrar)
+caixa.iniciar()
+caixa.enfileirar(montar_mensagem('rh@empresa.com', assunto, corpo, ['cv.txt']), contexto)
+estatisticas = caixa.concluir()
+
+Autor: Cara Core Informática
+Data: 2025
+Licença: MIT
+"""
+
+import os
+import time
+import smtplib
+import asyncio
+import threading
+import mimetypes
+from email.message import EmailMessage
+
+PORTA_PADRAO = 587
+PORTA_SSL = 465
+
+# Tempo limite de cada operação SMTP (segundos)
+TIMEOUT_SMTP = 60
+
+def contas_configuradas(config):
+    """Contas SMTP do config.yaml: a seção email e suas contas_adicionais."""
+    email_config = dict(config.get('email', {}) or {})
+    adicionais = email_config.pop('contas_adicionais', None) or []
+    contas = [email_config] if email_config.get('usuario') else []
+    # Contas adicionais herdam servidor e porta da conta principal
+    contas.extend({**email_config, **conta} for conta in adicionais)
+    return contas
+
+def montar_mensagem(destinatario, assunto, corpo, anexos=()):
+    """Monta o EmailMessage com corpo em texto e anexos (sem remetente)."""
+    mensagem = EmailMessage()
+    mensagem['To'] = destinatario
+    mensagem['Subject'] = assunto.strip()
+    mensagem.set_content(corpo)
+
+    for caminho in anexos:
+        tipo, _ = mimetypes.guess_type(caminho)
+        principal, subtipo = (tipo or 'application/octet-stream').split('/', 1)
+        with open(caminho, 'rb') as f:
+            mensagem.add_attachment(f.read(), maintype=principal, subtype=subtipo,
+                                    filename=os.path.basename(caminho))
+    return mensagem
+
+def conectar(conta):
+    """Abre e autentica uma conexão SMTP para a conta."""
+    servidor = conta.get('servidor_smtp', 'smtp.gmail.com')
+    porta = int(conta.get('porta', PORTA_PADRAO))
+
+    if porta == PORTA_SSL:
+        conexao = smtplib.SMTP_SSL(servidor, porta, timeout=TIMEOUT_SMTP)
+    else:
+        conexao = smtplib.SMTP(servidor, porta, timeout=TIMEOUT_SMTP)
+        conexao.ehlo()
+        if conexao.has_extn('starttls'):
+            conexao.starttls()
+            conexao.ehlo()
+
+    if conta.get('senha_app'):
+        conexao.login(conta['usuario'], conta['senha_app'])
+    return conexao
+
+def fechar(conexao):
+    """Encerra a conexão SMTP, ignorando falhas de uma conexão já derrubada."""
+    try:
+        conexao.quit()
+    except (smtplib.SMTPException, OSError):
+        conexao.close()
+
+class CaixaSaida:
+    """Fila de envio assíncrona, com uma conexão SMTP e um intervalo por conta."""
+
+    def __init__(self, contas, delay=0, ao_enviar=None, conectar=conectar):
+        """Inicializa a caixa de saída (conectar pode ser substituído nos testes)."""
+        if not contas:
+            raise ValueError("nenhuma conta de email configurada")
+        self.contas = contas
+        self.delay = delay
+        self.ao_enviar = ao_enviar
+        self.conectar = conectar
+        self.enviados = 0
+        self.falhas = 0
+        self.conexoes = 0
+        self._loop = None
+        self._fila = None
+        self._thread = None
+        self._pronta = threading.Event()
+        self._inicio = None
+
+    def iniciar(self):
+        """Inicia a thread do loop asyncio e aguarda a fila ficar pronta."""
+        self._inicio = time.perf_counter()
+        self._thread = threading.Thread(target=asyncio.run, args=(self._principal(),),
+                                        name='caixa-saida', daemon=True)
+        self._thread.start()
+        self._pronta.wait()
+        return self
+
+    def enfileirar(self, mensagem, contexto=None):
+        """Coloca a mensagem na fila sem esperar pelo envio (seguro entre threads)."""
+        self._loop.call_soon_threadsafe(self._fila.put_nowait, (mensagem, contexto))
+
+    def concluir(self):
+        """Aguarda o envio de tudo o que foi enfileirado e retorna as estatísticas."""
+        for _ in self.contas:
+            self._loop.call_soon_threadsafe(self._fila.put_nowait, None)
+        self._thread.join()
+        return {
+            'enviados': self.enviados,
+            'falhas': self.falhas,
+            'conexoes': self.conexoes,
+            'duracao_s': round(time.perf_counter() - self._inicio, 3)
+        }
+
+    async def _principal(self):
+        """Cria a fila e executa um trabalhador por conta até a fila ser encerrada."""
+        self._loop = asyncio.get_running_loop()
+        self._fila = asyncio.Queue()
+        self._pronta.set()
+        await asyncio.gather(*(self._trabalhador(conta) for conta in self.contas))
+
+    def _enviar(self, conta, conexao, mensagem):
+        """Envia pela conexão da conta (abrindo ou reabrindo se necessário); retorna a conexão."""
+        del mensagem['From']
+        mensagem['From'] = conta['usuario']
+
+        if conexao is None:
+            conexao = self.conectar(conta)
+            self.conexoes += 1
+        try:
+            conexao.send_message(mensagem)
+        except smtplib.SMTPServerDisconnected:
+            conexao = self.conectar(conta)
+            self.conexoes += 1
+            conexao.send_message(mensagem)
+        return conexao
+
+    async def _trabalhador(self, conta):
+        """Consome a fila com a conexão da conta, respeitando o intervalo entre envios."""
+        conexao = None
+        ultimo_envio = None
+
+        while True:
+            item = await self._fila.get()
+            if item is None:
+                break
+            mensagem, contexto = item
+
+            if ultimo_envio is not None:
+                espera = self.delay - (self._loop.time() - ultimo_envio)
+                if espera > 0:
+                    await asyncio.sleep(espera)
+
+            erro = None
+            ultimo_envio = self._loop.time()
+            try:
+                conexao = await asyncio.to_thread(self._enviar, conta, conexao, mensagem)
+                self.enviados += 1
+            except Exception as e:
+                erro = e
+                self.falhas += 1
+                if conexao is not None:
+                    await asyncio.to_thread(fechar, conexao)
+                    conexao = None
+
+            if self.ao_enviar is not None:
+                try:
+                    self.ao_enviar(contexto, erro)
+                except Exception as e:
+                    print(f"   ❌ Erro ao registrar envio: {e}")
+
+        if conexao is not None:
+            await asyncio.to_thread(fechar, conexao)
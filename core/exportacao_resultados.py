@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Exportação de Resultados - Gravação em Streaming (CSV, Parquet e XLSX)
+======================================================================
+
+DESCRIÇÃO:
+Este módulo grava os resultados do sistema organizado (uma linha por
+currículo analisado) à medida que cada vaga termina, sem montar a lista
+completa nem um DataFrame com todas as linhas. A memória usada pela
+exportação não depende da quantidade de resultados, o que permite exportar
+milhões de linhas.
+
+LÓGICA DE FUNCIONAMENTO:
+
+1. ESCRITOR POR FORMATO (pela extensão do arquivo):
+   - .csv: csv.DictWriter, linha a linha (mesmo formato de antes)
+   - .parquet: pyarrow.ParquetWriter, em grupos de LINHAS_POR_GRUPO linhas
+     (row groups); sem pyarrow, a exportação é feita em CSV com aviso
+   - .xlsx: openpyxl em modo write-only, uma aba por vaga (abas extras
+     quando a vaga passa do limite de linhas do Excel)
+
+2. GRAVAÇÃO POR VAGA:
+   - escrever_vaga recebe um iterável de linhas e as grava conforme chegam
+   - Chamado pelo ATSOrganizer logo após a análise de cada vaga
+
+3. ARQUIVO COMPLETO OU NENHUM:
+   - Gravação em arquivo temporário, que substitui o destino ao fechar
+   - Sem linhas (ou com erro durante a análise), o temporário é descartado
+     e o arquivo anterior é mantido
+
+DEPENDÊNCIAS:
+- csv: biblioteca padrão
+- openpyxl: exportação XLSX (importado sob demanda)
+- pyarrow (opcional): exportação Parquet (importado sob demanda)
+
+EXEMPLO DE USO:
+with abrir_escritor('log/resultados_ats_organizado.xlsx') as escritor:
+    escritor.escrever_vaga('desenvolvedor_python', linhas)
+print(escritor.linhas)
+
+Autor: Cara Core Informática
+Data: 2025
+Licença: MIT
+"""
+
+import os
+import re
+import csv
+import importlib.util
+
+CAMPOS_RESULTADOS = ['vaga', 'curriculo', 'arquivo', 'pontuacao_ats', 'aprovado',
+                     'palavras_curriculo', 'palavras_vaga', 'data_analise', 'duplicata_de']
+
+FORMATOS = ('csv', 'parquet', 'xlsx')
+
+# Linhas acumuladas por row group no Parquet
+LINHAS_POR_GRUPO = 65_536
+
+# Linhas de dados por aba no XLSX (limite do Excel menos o cabeçalho)
+LINHAS_POR_PLANILHA = 1_048_575
+
+TAMANHO_NOME_PLANILHA = 31
+_CARACTERES_INVALIDOS_PLANILHA = re.compile(r'[\[\]:*?/\\]')
+
+def formato_do_arquivo(caminho):
+    """Formato de exportação pela extensão do arquivo (csv, parquet ou xlsx)."""
+    formato = os.path.splitext(caminho)[1].lower().lstrip('.')
+    if formato not in FORMATOS:
+        raise ValueError(f"formato de exportação não suportado: {caminho} (use {', '.join(FORMATOS)})")
+    return formato
+
+def caminho_formato(caminho, formato):
+    """Mesmo caminho com a extensão do formato."""
+    return f"{os.path.splitext(caminho)[0]}.{formato}"
+
+class EscritorResultados:
+    """Base dos escritores: arquivo temporário, contagem e substituição ao fechar."""
+
+    def __init__(self, arquivo):
+        """Prepara o escritor para o arquivo de destino."""
+        self.arquivo = arquivo
+        self.temporario = f"{arquivo}.{os.getpid()}.tmp"
+        self.linhas = 0
+        self.vagas = 0
+
+    def __enter__(self):
+        """Abre o escritor no início do bloco with."""
+        self.abrir()
+        return self
+
+    def __exit__(self, tipo, valor, rastreamento):
+        """Fecha o escritor; com exceção no bloco, descarta o arquivo temporário."""
+        self.fechar(descartar=tipo is not None)
+
+    def abrir(self):
+        """Cria a pasta de destino e abre o arquivo temporário."""
+        pasta = os.path.dirname(self.arquivo)
+        if pasta:
+            os.makedirs(pasta, exist_ok=True)
+        self._abrir()
+
+    def escrever_vaga(self, nome_vaga, linhas):
+        """Grava as linhas (dicionários com CAMPOS_RESULTADOS) de uma vaga conforme chegam."""
+        self.vagas += 1
+        self._iniciar_vaga(nome_vaga)
+        for linha in linhas:
+            self._escrever(linha)
+            self.linhas += 1
+
+    def fechar(self, descartar=False):
+        """Finaliza o arquivo; substitui o destino se houver linhas (e não descartado)."""
+        self._finalizar(salvar=self.linhas > 0 and not descartar)
+        if self.linhas and not descartar:
+            os.replace(self.temporario, self.arquivo)
+        elif os.path.exists(self.temporario):
+            os.remove(self.temporario)
+
+    def _abrir(self):
+        """Abre o arquivo temporário no formato do escritor."""
+        raise NotImplementedError
+
+    def _iniciar_vaga(self, nome_vaga):
+        """Chamado antes das linhas de cada vaga (abas no XLSX)."""
+
+    def _escrever(self, linha):
+        """Grava uma linha."""
+        raise NotImplementedError
+
+    def _finalizar(self, salvar):
+        """Conclui e fecha o arquivo temporário (salvar: houve linhas e não foi descartado)."""
+        raise NotImplementedError
+
+class EscritorCSV(EscritorResultados):
+    """CSV gravado linha a linha."""
+
+    def _abrir(self):
+        self._arquivo = open(self.temporario, 'w', newline='', encoding='utf-8')
+        self._escritor = csv.DictWriter(self._arquivo, fieldnames=CAMPOS_RESULTADOS, lineterminator=os.linesep)
+        self._escritor.writeheader()
+
+    def _escrever(self, linha):
+        self._escritor.writerow(linha)
+
+    def _finalizar(self, salvar):
+        self._arquivo.close()
+
+class EscritorParquet(EscritorResultados):
+    """Parquet gravado em row groups de LINHAS_POR_GRUPO linhas (exige pyarrow)."""
+
+    def _abrir(self):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        self._pa = pa
+        self._esquema = pa.schema([
+            ('vaga', pa.string()), ('curriculo', pa.string()), ('arquivo', pa.string()),
+            ('pontuacao_ats', pa.float64()), ('aprovado', pa.string()),
+            ('palavras_curriculo', pa.int64()), ('palavras_vaga', pa.int64()),
+            ('data_analise', pa.timestamp('us')), ('duplicata_de', pa.string())
+        ])
+        self._escritor = pq.ParquetWriter(self.temporario, self._esquema)
+        self._lote = []
+
+    def _gravar_lote(self):
+        """Grava as linhas acumuladas como um row group."""
+        if self._lote:
+            self._escritor.write_table(self._pa.Table.from_pylist(self._lote, schema=self._esquema))
+            self._lote = []
+
+    def _escrever(self, linha):
+        self._lote.append(linha)
+        if len(self._lote) >= LINHAS_POR_GRUPO:
+            self._gravar_lote()
+
+    def _finalizar(self, salvar):
+        if salvar:
+            self._gravar_lote()
+        self._escritor.close()
+
+def nome_planilha(nome, usados):
+    """Nome de aba válido no Excel (31 caracteres, sem []:*?/\\) e único entre os usados."""
+    base = _CARACTERES_INVALIDOS_PLANILHA.sub('_', nome).strip("'")[:TAMANHO_NOME_PLANILHA] or 'vaga'
+    candidato = base
+    numero = 1
+    while candidato.casefold() in usados:
+        numero += 1
+        sufixo = f" ({numero})"
+        candidato = base[:TAMANHO_NOME_PLANILHA - len(sufixo)] + sufixo
+    usados.add(candidato.casefold())
+    return candidato
+
+class EscritorXLSX(EscritorResultados):
+    """XLSX em modo write-only do openpyxl, com uma aba por vaga."""
+
+    def _abrir(self):
+        from openpyxl import Workbook
+        self._livro = Workbook(write_only=True)
+        self._usados = set()
+        self._planilha = None
+
+    def _nova_planilha(self):
+        """Cria a próxima aba da vaga atual, com o cabeçalho."""
+        self._planilha = self._livro.create_sheet(nome_planilha(self._nome_vaga, self._usados))
+        self._planilha.append(CAMPOS_RESULTADOS)
+        self._linhas_planilha = 0
+
+    def _iniciar_vaga(self, nome_vaga):
+        self._nome_vaga = nome_vaga
+        self._planilha = None
+
+    def _escrever(self, linha):
+        if self._planilha is None or self._linhas_planilha >= LINHAS_POR_PLANILHA:
+            self._nova_planilha()
+        self._planilha.append([linha.get(campo) for campo in CAMPOS_RESULTADOS])
+        self._linhas_planilha += 1
+
+    def _finalizar(self, salvar):
+        if salvar:
+            self._livro.save(self.temporario)
+        else:
+            self._livro.close()
+
+ESCRITORES = {
+    'csv': EscritorCSV,
+    'parquet': EscritorParquet,
+    'xlsx': EscritorXLSX
+}
+
+def abrir_escritor(arquivo):
+    """Escritor do formato do arquivo (Parquet sem pyarrow é exportado em CSV)."""
+    formato = formato_do_arquivo(arquivo)
+    if formato == 'parquet' and importlib.util.find_spec('pyarrow') is None:
+        arquivo = caminho_formato(arquivo, 'csv')
+        formato = 'csv'
+        print(f"⚠️  pyarrow não instalado: resultados exportados em CSV ({arquivo})")
+    return ESCRITORES[formato](arquivo)
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Fila de Envio - Agendamento Persistente com Cota Diária e Horário Comercial
+===========================================================================
+
+DESCRIÇÃO:
+Este módulo guarda em SQLite (log/fila_envio.db) os emails das candidaturas
+aprovadas e decide quantos deles podem sair em cada execução, respeitando
+max_envios_por_dia e horario_funcionamento do config.yaml mesmo entre
+reinícios. Em vez de manter o processo dormindo entre um envio e outro, o
+modo envio envia o que está liberado, informa o horário do próximo envio e
+termina; a execução seguinte (cron, agendador) continua de onde parou.
+
+LÓGICA DE FUNCIONAMENTO:
+
+1. FILA DURÁVEL:
+   - Cada candidatura (email, vaga) entra uma única vez na fila
+   - Guarda empresa, assunto, corpo, anexo e pontuação ATS
+   - Estados: pendente → enviando → enviado (ou falha após 3 tentativas)
+   - Itens "enviando" de uma execução interrompida voltam a pendente
+
+2. BALDE DE TOKENS (RITMO):
+   - A cota diária é distribuída ao longo do expediente: um token a cada
+     (duração do expediente / max_envios_por_dia)
+   - O balde acumula no máximo envio.rajada_maxima tokens (envios seguidos)
+   - Tokens e horário da última atualização ficam no banco
+
+3. COTA DIÁRIA E HORÁRIO:
+   - Fora do horário_funcionamento nada é liberado
+   - Envios concluídos (ou em andamento) no dia contam para a cota
+   - Cada envio liberado consome um token, mesmo se falhar
+
+4. ORDEM E PRÓXIMO ENVIO:
+   - Pendentes liberados em ordem decrescente de pontuação ATS
+   - proximo_envio indica quando o próximo item estará liberado (próximo
+     token, abertura do expediente ou dia seguinte, se a cota acabou)
+
+CONFIGURAÇÃO (config.yaml):
+envio:
+  max_envios_por_dia: 10
+  rajada_maxima: 3
+  horario_funcionamento:
+    inicio: "09:00"
+    fim: "17:00"
+arquivos:
+  fila_envio: "log/fila_envio.db"
+
+DEPENDÊNCIAS:
+- sqlite3, threading, datetime: biblioteca padrão
+
+EXEMPLO DE USO:
+fila = FilaEnvio('log/fila_envio.db', config)
+fila.enfileirar('rh@empresa.com', 'Dev Python', 'Empresa', 92.5, assunto, corpo, 'cv.txt')
+for item in fila.reservar():
+    ...
+    fila.registrar_envio(item['id'], erro=None)
+print(fila.proximo_envio())
+
+Autor: Cara Core Informática
+Data: 2025
+Licença: MIT
+"""
+
+import os
+import math
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+ARQUIVO_FILA_PADRAO = 'log/fila_envio.db'
+
+MAX_ENVIOS_POR_DIA_PADRAO = 10
+RAJADA_MAXIMA_PADRAO = 3
+
+# Tentativas antes de um envio ser marcado como falha definitiva
+MAX_TENTATIVAS = 3
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS envios (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    email TEXT NOT NULL,
+    vaga TEXT NOT NULL,
+    empresa TEXT,
+    pontuacao REAL NOT NULL,
+    assunto TEXT,
+    corpo TEXT,
+    anexo TEXT,
+    status TEXT NOT NULL DEFAULT 'pendente',
+    tentativas INTEGER NOT NULL DEFAULT 0,
+    erro TEXT,
+    criado_em TEXT NOT NULL,
+    enviado_em TEXT,
+    UNIQUE (email, vaga)
+);
+CREATE INDEX IF NOT EXISTS envios_pendentes ON envios (status, pontuacao DESC);
+CREATE TABLE IF NOT EXISTS balde (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    tokens REAL NOT NULL,
+    atualizado REAL NOT NULL
+);
+"""
+
+def _ler_horario(texto):
+    """Converte "HH:MM" em minutos desde a meia-noite."""
+    horas, minutos = str(texto).split(':')
+    return int(horas) * 60 + int(minutos)
+
+def _no_dia(dia, minutos):
+    """Datetime do dia informado no horário (minutos desde a meia-noite)."""
+    return datetime.combine(dia.date(), datetime.min.time()) + timedelta(minutes=minutos)
+
+class FilaEnvio:
+    """Fila de emails em SQLite com cota diária, horário comercial e balde de tokens."""
+
+    def __init__(self, arquivo=ARQUIVO_FILA_PADRAO, config=None):
+        """Abre (ou cria) a fila e lê os limites da seção envio do config."""
+        envio = (config or {}).get('envio', {}) or {}
+        horario = envio.get('horario_funcionamento') or {}
+        self.max_por_dia = int(envio.get('max_envios_por_dia', MAX_ENVIOS_POR_DIA_PADRAO))
+        self.rajada = max(1, int(envio.get('rajada_maxima', RAJADA_MAXIMA_PADRAO)))
+        self.inicio = _ler_horario(horario.get('inicio', '00:00'))
+        self.fim = _ler_horario(horario.get('fim', '24:00'))
+
+        # Um token a cada (expediente / cota diária)
+        self.intervalo_token = max(1, self.fim - self.inicio) * 60 / max(1, self.max_por_dia)
+
+        pasta = os.path.dirname(arquivo)
+        if pasta:
+            os.makedirs(pasta, exist_ok=True)
+        self.arquivo = arquivo
+        # Usada também pela thread da caixa de saída (registrar_envio)
+        self._trava = threading.Lock()
+        self._conexao = sqlite3.connect(arquivo, check_same_thread=False)
+        self._conexao.row_factory = sqlite3.Row
+        with self._conexao:
+            self._conexao.executescript(ESQUEMA)
+            # Envios interrompidos no meio de uma execução anterior
+            self._conexao.execute("UPDATE envios SET status = 'pendente' WHERE status = 'enviando'")
+
+    def fechar(self):
+        """Fecha a conexão com o banco."""
+        self._conexao.close()
+
+    def enfileirar(self, email, vaga, empresa, pontuacao, assunto, corpo, anexo, agora=None):
+        """Acrescenta a candidatura à fila; retorna False se (email, vaga) já estava nela."""
+        agora = agora or datetime.now()
+        with self._trava, self._conexao:
+            cursor = self._conexao.execute(
+                "INSERT OR IGNORE INTO envios (email, vaga, empresa, pontuacao, assunto, corpo, anexo, criado_em) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (email, vaga, empresa, float(pontuacao), assunto, corpo, anexo, agora.isoformat(timespec='seconds'))
+            )
+        return cursor.rowcount == 1
+
+    def contem(self, email, vaga):
+        """Indica se a candidatura (email, vaga) já está na fila, em qualquer estado."""
+        with self._trava:
+            linha = self._conexao.execute("SELECT 1 FROM envios WHERE email = ? AND vaga = ?", (email, vaga)).fetchone()
+        return linha is not None
+
+    def contagem(self):
+        """Quantidade de itens da fila por estado."""
+        with self._trava:
+            linhas = self._conexao.execute("SELECT status, COUNT(*) FROM envios GROUP BY status").fetchall()
+        return {status: total for status, total in linhas}
+
+    def enviados_no_dia(self, agora=None):
+        """Envios concluídos ou em andamento no dia (contam para a cota)."""
+        agora = agora or datetime.now()
+        with self._trava:
+            return self._enviados_no_dia(agora)
+
+    def _enviados_no_dia(self, agora):
+        """Versão sem trava de enviados_no_dia."""
+        return self._conexao.execute(
+            "SELECT COUNT(*) FROM envios WHERE status = 'enviando' OR "
+            "(status = 'enviado' AND substr(enviado_em, 1, 10) = ?)",
+            (agora.date().isoformat(),)
+        ).fetchone()[0]
+
+    def _tokens(self, agora):
+        """Tokens disponíveis no balde no instante informado."""
+        linha = self._conexao.execute("SELECT tokens, atualizado FROM balde WHERE id = 1").fetchone()
+        if linha is None:
+            return float(self.rajada)
+        acumulados = max(0.0, agora.timestamp() - linha['atualizado']) / self.intervalo_token
+        return min(float(self.rajada), linha['tokens'] + acumulados)
+
+    def no_horario(self, agora=None):
+        """Indica se o instante está dentro do horário de funcionamento."""
+        agora = agora or datetime.now()
+        minutos = agora.hour * 60 + agora.minute
+        return self.inicio <= minutos < self.fim
+
+    def reservar(self, agora=None):
+        """Marca como "enviando" e retorna os pendentes liberados agora (maior pontuação primeiro)."""
+        agora = agora or datetime.now()
+        if not self.no_horario(agora):
+            return []
+
+        with self._trava, self._conexao:
+            tokens = self._tokens(agora)
+            liberados = min(math.floor(tokens), self.max_por_dia - self._enviados_no_dia(agora))
+            if liberados <= 0:
+                return []
+
+            itens = [dict(linha) for linha in self._conexao.execute(
+                "SELECT * FROM envios WHERE status = 'pendente' ORDER BY pontuacao DESC, id LIMIT ?",
+                (liberados,)
+            )]
+            if not itens:
+                return []
+
+            self._conexao.executemany("UPDATE envios SET status = 'enviando' WHERE id = ?",
+                                      [(item['id'],) for item in itens])
+            self._conexao.execute(
+                "INSERT OR REPLACE INTO balde (id, tokens, atualizado) VALUES (1, ?, ?)",
+                (tokens - len(itens), agora.timestamp())
+            )
+        return itens
+
+    def registrar_envio(self, id_envio, erro=None, agora=None):
+        """Registra o resultado de um envio reservado (erro None = enviado)."""
+        agora = agora or datetime.now()
+        with self._trava, self._conexao:
+            if erro is None:
+                self._conexao.execute(
+                    "UPDATE envios SET status = 'enviado', enviado_em = ?, erro = NULL WHERE id = ?",
+                    (agora.isoformat(timespec='seconds'), id_envio)
+                )
+            else:
+                self._conexao.execute(
+                    "UPDATE envios SET tentativas = tentativas + 1, erro = ?, "
+                    "status = CASE WHEN tentativas + 1 >= ? THEN 'falha' ELSE 'pendente' END WHERE id = ?",
+                    (str(erro), MAX_TENTATIVAS, id_envio)
+                )
+
+    def proximo_envio(self, agora=None):
+        """Quando o próximo pendente estará liberado (None se a fila estiver vazia)."""
+        agora = agora or datetime.now()
+        with self._trava:
+            pendentes = self._conexao.execute("SELECT COUNT(*) FROM envios WHERE status = 'pendente'").fetchone()[0]
+            if not pendentes:
+                return None
+            cota_esgotada = self._enviados_no_dia(agora) >= self.max_por_dia
+            tokens = self._tokens(agora)
+
+        abertura_amanha = _no_dia(agora + timedelta(days=1), self.inicio)
+        if cota_esgotada:
+            return abertura_amanha
+
+        minutos = agora.hour * 60 + agora.minute
+        if minutos < self.inicio:
+            candidato = _no_dia(agora, self.inicio)
+        elif minutos >= self.fim:
+            return abertura_amanha
+        else:
+            candidato = agora
+
+        # Espera pelo próximo token, contado a partir do candidato
+        if tokens < 1:
+            falta = (1 - tokens) * self.intervalo_token - (candidato - agora).total_seconds()
+            if falta > 0:
+                candidato += timedelta(seconds=falta)
+        if candidato >= _no_dia(candidato, self.fim):
+            return abertura_amanha
+        return candidato
@@ -0,0 +1,491 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gerador de Corpus - Vagas e Currículos Sintéticos para Testes de Escala
+=======================================================================
+
+DESCRIÇÃO:
+Este módulo gera um corpus sintético, reproduzível e em português, de N vagas e
+M currículos na estrutura organizada vagas/<nome_vaga>/curriculos/. Serve para
+benchmarks de escala e testes de regressão offline com 100 mil documentos ou
+mais, sem depender dos poucos arquivos de exemplo do repositório.
+
+LÓGICA DE FUNCIONAMENTO:
+
+1. REPRODUTIBILIDADE:
+   - Cada documento tem seu próprio gerador aleatório, semeado com
+     (semente, tipo, índice): o mesmo índice gera sempre o mesmo documento,
+     independentemente da quantidade total ou da ordem de geração
+   - Os arquivos .docx são gravados com datas fixas e os .pdf não têm datas,
+     então a mesma semente produz os mesmos bytes
+
+2. VOCABULÁRIO REALISTA:
+   - Áreas de atuação (dados, desenvolvimento, infraestrutura, gestão,
+     financeiro, marketing, RH) com cargos e termos técnicos próprios
+   - Competências comportamentais, verbos de ação, empresas, cidades,
+     cursos e nomes brasileiros
+   - Textos seguem o formato das vagas (criar_vaga_organizada) e de
+     currículos reais: resumo, experiência, competências e formação
+
+3. SOBREPOSIÇÃO CONTROLÁVEL:
+   - Cada vaga sorteia palavras-chave da sua área
+   - Cada currículo inclui uma fração dessas palavras-chave
+     (sobreposicao ± variacao) e completa o texto com termos de outras áreas
+   - Cargo e cidade da vaga aparecem no currículo com a mesma probabilidade
+   - Assim a distribuição de pontuações ATS acompanha os parâmetros
+
+4. FORMATOS:
+   - vaga.txt sempre em texto (exigido pelo sistema organizado)
+   - Currículos em .txt, .docx e .pdf, na proporção configurada
+   - O PDF é escrito diretamente (fonte Helvetica, 60 linhas por página), sem
+     dependências além da biblioteca padrão
+
+DEPENDÊNCIAS:
+- python-docx: geração dos arquivos .docx (apenas se houver .docx)
+- random, zipfile: biblioteca padrão
+
+EXEMPLO DE USO:
+python core/gerador_corpus.py --vagas 20 --curriculos 100000 --destino /tmp/corpus_ats
+python core/gerador_corpus.py --vagas 3 --curriculos 30 --formatos txt=0.5,docx=0.25,pdf=0.25
+python main.py organizado --pasta-vagas /tmp/corpus_ats/vagas
+
+Autor: Cara Core Informática
+Data: 2025
+Licença: MIT
+"""
+
+import os
+import io
+import sys
+import json
+import random
+import zipfile
+import argparse
+import unicodedata
+
+SEMENTE_PADRAO = 42
+
+# Fração média das palavras-chave da vaga presentes em cada currículo
+SOBREPOSICAO_PADRAO = 0.6
+VARIACAO_PADRAO = 0.25
+
+PESOS_FORMATOS_PADRAO = {'txt': 0.8, 'docx': 0.1, 'pdf': 0.1}
+
+# Data fixa gravada nos .docx (mantém os arquivos idênticos entre execuções)
+DATA_FIXA_DOCX = (2025, 1, 1, 0, 0, 0)
+
+AREAS = {
+    'dados': {
+        'cargos': ['Analista de Dados', 'Cientista de Dados', 'Engenheiro de Dados',
+                   'Analista de BI', 'Especialista em Analytics'],
+        'termos': ['python', 'sql', 'pandas', 'numpy', 'estatística', 'power bi', 'tableau',
+                   'machine learning', 'regressão', 'classificação', 'spark', 'airflow',
+                   'data warehouse', 'modelagem dimensional', 'etl', 'dashboards', 'kpis',
+                   'scikit-learn', 'visualização', 'bigquery', 'databricks', 'looker',
+                   'séries temporais', 'testes a/b', 'storytelling', 'excel avançado']
+    },
+    'desenvolvimento': {
+        'cargos': ['Desenvolvedor Python', 'Desenvolvedor Frontend', 'Desenvolvedor Backend',
+                   'Desenvolvedor Full Stack', 'Engenheiro de Software'],
+        'termos': ['python', 'django', 'flask', 'fastapi', 'javascript', 'typescript', 'react',
+                   'vue.js', 'angular', 'node.js', 'postgresql', 'mongodb', 'redis', 'rest',
+                   'graphql', 'microsserviços', 'testes unitários', 'git', 'docker',
+                   'integração contínua', 'clean code', 'design patterns', 'html', 'css',
+                   'java', 'spring boot', 'kotlin', 'mensageria']
+    },
+    'infraestrutura': {
+        'cargos': ['Engenheiro DevOps', 'Analista de Infraestrutura', 'Engenheiro de Cloud',
+                   'SRE', 'Administrador de Sistemas'],
+        'termos': ['linux', 'docker', 'kubernetes', 'terraform', 'ansible', 'aws', 'azure',
+                   'google cloud', 'monitoramento', 'prometheus', 'grafana', 'redes', 'firewall',
+                   'jenkins', 'gitlab', 'observabilidade', 'alta disponibilidade', 'backup',
+                   'segurança da informação', 'shell script', 'nginx', 'automação']
+    },
+    'gestao': {
+        'cargos': ['Gerente de Projetos', 'Product Owner', 'Scrum Master', 'Coordenador de TI',
+                   'Product Manager'],
+        'termos': ['scrum', 'kanban', 'gestão de projetos', 'pmbok', 'roadmap', 'backlog',
+                   'stakeholders', 'okrs', 'indicadores', 'orçamento', 'cronograma', 'riscos',
+                   'jira', 'priorização', 'discovery', 'métricas de produto', 'negociação',
+                   'gestão de equipes', 'planejamento estratégico', 'melhoria contínua']
+    },
+    'financeiro': {
+        'cargos': ['Analista Financeiro', 'Controller', 'Analista Contábil', 'Analista de Custos',
+                   'Analista de Planejamento Financeiro'],
+        'termos': ['contabilidade', 'fluxo de caixa', 'conciliação bancária', 'orçamento',
+                   'demonstrações financeiras', 'ifrs', 'auditoria', 'custos', 'tributos',
+                   'fechamento contábil', 'sap', 'totvs', 'excel avançado', 'forecast',
+                   'análise de investimentos', 'dre', 'balanço patrimonial', 'compliance']
+    },
+    'marketing': {
+        'cargos': ['Analista de Marketing Digital', 'Especialista em SEO', 'Coordenador de Marketing',
+                   'Analista de Growth', 'Social Media'],
+        'termos': ['seo', 'sem', 'google ads', 'meta ads', 'google analytics', 'inbound',
+                   'funil de vendas', 'crm', 'automação de marketing', 'copywriting',
+                   'redes sociais', 'branding', 'campanhas', 'conversão', 'email marketing',
+                   'marketing de conteúdo', 'persona', 'hubspot', 'rd station', 'growth']
+    },
+    'rh': {
+        'cargos': ['Analista de Recursos Humanos', 'Business Partner de RH', 'Recrutador',
+                   'Analista de Departamento Pessoal', 'Especialista em Treinamento'],
+        'termos': ['recrutamento', 'seleção', 'entrevistas', 'onboarding', 'folha de pagamento',
+                   'benefícios', 'clima organizacional', 'avaliação de desempenho',
+                   'treinamento e desenvolvimento', 'legislação trabalhista', 'esocial',
+                   'cargos e salários', 'employer branding', 'people analytics', 'ats',
+                   'endomarketing', 'diversidade e inclusão', 'sucessão']
+    }
+}
+
+COMPETENCIAS_COMPORTAMENTAIS = [
+    'comunicação', 'trabalho em equipe', 'liderança', 'proatividade', 'resolução de problemas',
+    'pensamento crítico', 'organização', 'adaptabilidade', 'criatividade', 'negociação',
+    'gestão do tempo', 'empatia', 'foco em resultados', 'visão analítica', 'autonomia'
+]
+
+VERBOS_ACAO = [
+    'Desenvolvi', 'Implementei', 'Liderei', 'Automatizei', 'Otimizei', 'Estruturei',
+    'Coordenei', 'Criei', 'Reduzi', 'Aumentei', 'Mantive', 'Integrei', 'Planejei', 'Analisei'
+]
+
+CONTEXTOS = [
+    'para a área comercial', 'em projetos de transformação digital', 'junto ao time de produto',
+    'com foco em redução de custos', 'para clientes corporativos', 'em ambiente ágil',
+    'atendendo mais de 50 mil usuários', 'em parceria com a diretoria', 'em operação 24x7',
+    'com ganho de 30% de produtividade', 'para o mercado nacional', 'em squads multidisciplinares'
+]
+
+EMPRESAS = [
+    'TechCorp', 'DataSoft', 'Inova Sistemas', 'Banco Horizonte', 'Varejo Brasil', 'LogiTrans',
+    'Saúde Mais', 'Agro Digital', 'EducaTech', 'Energia Verde', 'Seguradora Atlântica',
+    'Telecom Sul', 'Construtora Alfa', 'Fintech Nova', 'Indústria Paulista', 'Cara Core Informática'
+]
+
+CIDADES = [
+    'São Paulo, SP', 'Rio de Janeiro, RJ', 'Belo Horizonte, MG', 'Curitiba, PR', 'Porto Alegre, RS',
+    'Recife, PE', 'Salvador, BA', 'Fortaleza, CE', 'Brasília, DF', 'Campinas, SP', 'Florianópolis, SC',
+    'Goiânia, GO', 'Remoto'
+]
+
+CURSOS = [
+    'Ciência da Computação', 'Sistemas de Informação', 'Engenharia de Software', 'Estatística',
+    'Administração', 'Ciências Contábeis', 'Economia', 'Engenharia de Produção', 'Publicidade e Propaganda',
+    'Psicologia', 'Análise e Desenvolvimento de Sistemas', 'Matemática', 'Gestão de Recursos Humanos'
+]
+
+INSTITUICOES = [
+    'USP', 'UNICAMP', 'UFMG', 'UFRJ', 'UFPR', 'UFRGS', 'PUC-SP', 'Mackenzie', 'FGV', 'UNESP',
+    'UFPE', 'UnB', 'FIAP', 'Insper'
+]
+
+NOMES = [
+    'Ana', 'Bruno', 'Carla', 'Daniel', 'Eduarda', 'Felipe', 'Gabriela', 'Henrique', 'Isabela',
+    'João', 'Larissa', 'Lucas', 'Mariana', 'Mateus', 'Natália', 'Otávio', 'Paula', 'Rafael',
+    'Sofia', 'Thiago', 'Vitória', 'Carlos', 'Beatriz', 'Gustavo', 'Letícia', 'Pedro', 'Camila'
+]
+
+SOBRENOMES = [
+    'Silva', 'Santos', 'Oliveira', 'Souza', 'Rodrigues', 'Ferreira', 'Alves', 'Pereira', 'Lima',
+    'Gomes', 'Costa', 'Ribeiro', 'Martins', 'Carvalho', 'Almeida', 'Lopes', 'Soares', 'Fernandes',
+    'Vieira', 'Barbosa', 'Rocha', 'Dias', 'Nascimento', 'Andrade', 'Moreira', 'Nunes', 'Teixeira'
+]
+
+IDIOMAS = ['Inglês avançado', 'Inglês intermediário', 'Espanhol intermediário', 'Inglês fluente',
+           'Espanhol básico']
+
+def normalizar_nome(texto):
+    """Converte um texto em nome de pasta/arquivo ASCII (minúsculas e _)."""
+    texto = unicodedata.normalize('NFKD', texto).encode('ascii', 'ignore').decode('ascii')
+    return '_'.join(''.join(c if c.isalnum() else ' ' for c in texto.lower()).split())
+
+def _escapar_pdf(linha):
+    """Escapa uma linha de texto para um literal de string PDF."""
+    return linha.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+def escrever_pdf(caminho, texto, linhas_por_pagina=60):
+    """Grava um PDF mínimo (fonte Helvetica, WinAnsi) com uma página a cada N linhas."""
+    linhas = texto.splitlines() or ['']
+    paginas = [linhas[i:i + linhas_por_pagina] for i in range(0, len(linhas), linhas_por_pagina)]
+
+    # Objetos: 1 catálogo, 2 páginas, 3 fonte, depois (página, conteúdo) para cada página
+    objetos = [b'', b'', b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>']
+    ids_paginas = []
+    for pagina in paginas:
+        conteudo = ['BT', '/F1 10 Tf', '12 TL', '40 800 Td']
+        conteudo.extend(f"({_escapar_pdf(linha)}) Tj T*" for linha in pagina)
+        conteudo.append('ET')
+        stream = '\n'.join(conteudo).encode('cp1252', errors='replace')
+        id_pagina = len(objetos) + 1
+        ids_paginas.append(id_pagina)
+        objetos.append(b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] '
+                       b'/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>' % (id_pagina + 1))
+        objetos.append(b'<< /Length %d >>\nstream\n' % len(stream) + stream + b'\nendstream')
+
+    objetos[0] = b'<< /Type /Catalog /Pages 2 0 R >>'
+    objetos[1] = b'<< /Type /Pages /Kids [%s] /Count %d >>' % (
+        b' '.join(b'%d 0 R' % i for i in ids_paginas), len(ids_paginas))
+
+    dados = bytearray(b'%PDF-1.4\n')
+    posicoes = []
+    for numero, objeto in enumerate(objetos, start=1):
+        posicoes.append(len(dados))
+        dados += b'%d 0 obj\n' % numero + objeto + b'\nendobj\n'
+
+    inicio_xref = len(dados)
+    dados += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objetos) + 1)
+    for posicao in posicoes:
+        dados += b'%010d 00000 n \n' % posicao
+    dados += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objetos) + 1, inicio_xref)
+
+    with open(caminho, 'wb') as f:
+        f.write(dados)
+
+def escrever_docx(caminho, texto):
+    """Grava um .docx com um parágrafo por linha, com datas fixas (bytes reproduzíveis)."""
+    import docx
+    from datetime import datetime
+
+    documento = docx.Document()
+    propriedades = documento.core_properties
+    propriedades.created = propriedades.modified = datetime(*DATA_FIXA_DOCX)
+    propriedades.last_modified_by = propriedades.author = 'gerador_corpus'
+    for linha in texto.splitlines():
+        documento.add_paragraph(linha)
+
+    # O zip do python-docx usa a hora atual em cada entrada: regrava com data fixa
+    buffer = io.BytesIO()
+    documento.save(buffer)
+    with zipfile.ZipFile(buffer) as origem, zipfile.ZipFile(caminho, 'w', zipfile.ZIP_DEFLATED) as destino:
+        for item in origem.infolist():
+            info = zipfile.ZipInfo(item.filename, date_time=DATA_FIXA_DOCX)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            destino.writestr(info, origem.read(item.filename))
+
+def escrever_txt(caminho, texto):
+    """Grava o texto em UTF-8."""
+    with open(caminho, 'w', encoding='utf-8') as f:
+        f.write(texto)
+
+ESCRITORES = {'txt': escrever_txt, 'docx': escrever_docx, 'pdf': escrever_pdf}
+
+def escrever_documento(caminho_sem_extensao, texto, formato):
+    """Grava o documento no formato pedido e retorna o caminho completo."""
+    caminho = f"{caminho_sem_extensao}.{formato}"
+    ESCRITORES[formato](caminho, texto)
+    return caminho
+
+class GeradorCorpus:
+    """Gera vagas e currículos sintéticos determinísticos a partir de uma semente."""
+
+    def __init__(self, semente=SEMENTE_PADRAO, sobreposicao=SOBREPOSICAO_PADRAO,
+                 variacao=VARIACAO_PADRAO, pesos_formatos=None):
+        """Inicializa o gerador com a semente e os parâmetros de sobreposição e formatos."""
+        self.semente = semente
+        self.sobreposicao = sobreposicao
+        self.variacao = variacao
+        pesos_formatos = pesos_formatos or PESOS_FORMATOS_PADRAO
+        self.formatos = [formato for formato, peso in pesos_formatos.items() if peso > 0]
+        self.pesos_formatos = [pesos_formatos[formato] for formato in self.formatos]
+        self.nomes_areas = sorted(AREAS)
+        self._vagas = {}
+
+    def _rng(self, tipo, indice):
+        """Gerador aleatório próprio do documento (independe da ordem de geração)."""
+        return random.Random(f"{self.semente}:{tipo}:{indice}")
+
+    def vaga(self, indice):
+        """Gera (ou reaproveita) a vaga de índice informado."""
+        if indice in self._vagas:
+            return self._vagas[indice]
+
+        rng = self._rng('vaga', indice)
+        area = rng.choice(self.nomes_areas)
+        cargo = rng.choice(AREAS[area]['cargos'])
+        termos_area = AREAS[area]['termos']
+        palavras_chave = rng.sample(termos_area, k=min(len(termos_area), rng.randint(10, 16)))
+        comportamentais = rng.sample(COMPETENCIAS_COMPORTAMENTAIS, k=4)
+        empresa = rng.choice(EMPRESAS)
+        local = rng.choice(CIDADES)
+
+        metade = len(palavras_chave) // 2
+        linhas = [
+            cargo.upper(),
+            '',
+            f"Empresa: {empresa}",
+            f"Local: {local}",
+            '',
+            'DESCRIÇÃO DA VAGA:',
+            f"Procuramos {cargo} com experiência em projetos {rng.choice(CONTEXTOS)}.",
+            '',
+            'RESPONSABILIDADES:'
+        ]
+        linhas.extend(f"• Atuar com {termo}" for termo in palavras_chave[:metade])
+        linhas += ['', 'REQUISITOS TÉCNICOS:']
+        linhas.extend(f"• Experiência com {termo}" for termo in palavras_chave[metade:])
+        linhas += ['', 'COMPETÊNCIAS:']
+        linhas.extend(f"• {competencia.capitalize()}" for competencia in comportamentais)
+        linhas += ['', 'PALAVRAS-CHAVE ATS:', ' '.join(palavras_chave + comportamentais)]
+
+        vaga = {
+            'indice': indice,
+            'nome': f"{normalizar_nome(cargo)}_{indice:05d}",
+            'cargo': cargo,
+            'area': area,
+            'local': local,
+            'palavras_chave': palavras_chave + comportamentais,
+            'texto': '\n'.join(linhas)
+        }
+        self._vagas[indice] = vaga
+        return vaga
+
+    def curriculo(self, indice, vaga):
+        """Gera o currículo de índice informado, com sobreposição controlada à vaga."""
+        rng = self._rng('curriculo', indice)
+        nome = f"{rng.choice(NOMES)} {rng.choice(SOBRENOMES)} {rng.choice(SOBRENOMES)}"
+        formato = rng.choices(self.formatos, weights=self.pesos_formatos)[0]
+
+        # Fração das palavras-chave da vaga presentes neste currículo
+        sobreposicao = min(1.0, max(0.0, self.sobreposicao + rng.uniform(-self.variacao, self.variacao)))
+        palavras_chave = vaga['palavras_chave']
+        quantidade = round(sobreposicao * len(palavras_chave))
+        presentes = rng.sample(palavras_chave, k=quantidade)
+
+        # Completa com termos de outras áreas (ruído realista)
+        outras = [a for a in self.nomes_areas if a != vaga['area']]
+        ausentes = set(palavras_chave)
+        ruido = [t for t in AREAS[rng.choice(outras)]['termos'] if t not in ausentes]
+        extras = rng.sample(ruido, k=min(len(ruido), rng.randint(4, 10)))
+        termos = presentes + extras
+        rng.shuffle(termos)
+
+        # Cargo e cidade da vaga aparecem com a mesma probabilidade
+        cargo = vaga['cargo'] if rng.random() < sobreposicao else rng.choice(AREAS[rng.choice(outras)]['cargos'])
+        cidade = vaga['local'] if rng.random() < sobreposicao else rng.choice(CIDADES)
+
+        anos = rng.randint(1, 15)
+        linhas = [
+            nome.upper(),
+            f"{cidade} | {normalizar_nome(nome).replace('_', '.')}@email.com | "
+            f"(11) 9{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}",
+            '',
+            'OBJETIVO',
+            f"Atuar como {cargo}",
+            '',
+            'RESUMO PROFISSIONAL',
+            f"Profissional com {anos} anos de experiência em projetos, perfil orientado a "
+            f"resultados e aprendizado contínuo.",
+            '',
+            'EXPERIÊNCIA PROFISSIONAL'
+        ]
+
+        # Distribui os termos entre as experiências, um por realização
+        n_experiencias = rng.randint(1, 3)
+        for i in range(n_experiencias):
+            ano_fim = 2025 - i * rng.randint(1, 3)
+            linhas += ['', f"{rng.choice(EMPRESAS)} ({ano_fim - rng.randint(1, 4)} - {ano_fim})"]
+            for termo in termos[i::n_experiencias]:
+                linhas.append(f"• {rng.choice(VERBOS_ACAO)} soluções com {termo} {rng.choice(CONTEXTOS)}")
+
+        linhas += [
+            '',
+            'FORMAÇÃO ACADÊMICA',
+            f"{rng.choice(['Bacharelado', 'Tecnólogo', 'MBA', 'Pós-graduação'])} em {rng.choice(CURSOS)} - "
+            f"{rng.choice(INSTITUICOES)}",
+            '',
+            'IDIOMAS',
+            rng.choice(IDIOMAS)
+        ]
+
+        return {
+            'indice': indice,
+            'nome': f"{normalizar_nome(nome)}_{indice:07d}",
+            'formato': formato,
+            'sobreposicao': sobreposicao,
+            'texto': '\n'.join(linhas)
+        }
+
+    def curriculo_da_vaga(self, indice, n_vagas):
+        """Gera o currículo de índice informado para a sua vaga (distribuição circular)."""
+        vaga = self.vaga(indice % n_vagas)
+        return vaga, self.curriculo(indice, vaga)
+
+def gerar_corpus(pasta_destino, n_vagas, n_curriculos, semente=SEMENTE_PADRAO,
+                 sobreposicao=SOBREPOSICAO_PADRAO, variacao=VARIACAO_PADRAO,
+                 pesos_formatos=None, progresso=0):
+    """Grava <destino>/vagas/<vaga>/{vaga.txt,curriculos/} e retorna as contagens geradas."""
+    if n_vagas < 1:
+        raise ValueError("n_vagas deve ser pelo menos 1")
+
+    gerador = GeradorCorpus(semente, sobreposicao, variacao, pesos_formatos)
+    pasta_vagas = os.path.join(pasta_destino, 'vagas')
+
+    for j in range(n_vagas):
+        vaga = gerador.vaga(j)
+        os.makedirs(os.path.join(pasta_vagas, vaga['nome'], 'curriculos'), exist_ok=True)
+        escrever_txt(os.path.join(pasta_vagas, vaga['nome'], 'vaga.txt'), vaga['texto'])
+
+    contagem_formatos = dict.fromkeys(ESCRITORES, 0)
+    for i in range(n_curriculos):
+        vaga, curriculo = gerador.curriculo_da_vaga(i, n_vagas)
+        caminho = os.path.join(pasta_vagas, vaga['nome'], 'curriculos', curriculo['nome'])
+        escrever_documento(caminho, curriculo['texto'], curriculo['formato'])
+        contagem_formatos[curriculo['formato']] += 1
+        if progresso and (i + 1) % progresso == 0:
+            print(f"   {i + 1}/{n_curriculos} currículos gerados", flush=True)
+
+    resumo = {
+        'semente': semente,
+        'vagas': n_vagas,
+        'curriculos': n_curriculos,
+        'sobreposicao': sobreposicao,
+        'variacao': variacao,
+        'formatos': contagem_formatos
+    }
+    escrever_txt(os.path.join(pasta_destino, 'corpus.json'), json.dumps(resumo, ensure_ascii=False, indent=2))
+    return resumo
+
+def ler_pesos_formatos(valor):
+    """Converte 'txt=0.8,docx=0.1,pdf=0.1' em um dicionário de pesos."""
+    pesos = {}
+    for parte in valor.split(','):
+        formato, _, peso = parte.partition('=')
+        formato = formato.strip().lower()
+        if formato not in ESCRITORES:
+            raise argparse.ArgumentTypeError(f"formato desconhecido: {formato}")
+        pesos[formato] = float(peso) if peso else 1.0
+    return pesos
+
+def criar_parser():
+    """Cria o parser de argumentos do gerador."""
+    parser = argparse.ArgumentParser(description="Gerador de corpus sintético para o sistema ATS")
+    parser.add_argument('--vagas', type=int, default=10, help="quantidade de vagas")
+    parser.add_argument('--curriculos', type=int, default=100, help="quantidade de currículos")
+    parser.add_argument('--destino', default='corpus_sintetico', help="pasta de destino")
+    parser.add_argument('--semente', type=int, default=SEMENTE_PADRAO, help="semente de geração")
+    parser.add_argument('--sobreposicao', type=float, default=SOBREPOSICAO_PADRAO,
+                        help="fração média das palavras-chave da vaga em cada currículo (0 a 1)")
+    parser.add_argument('--variacao', type=float, default=VARIACAO_PADRAO,
+                        help="variação (±) da sobreposição entre currículos")
+    parser.add_argument('--formatos', type=ler_pesos_formatos, default=PESOS_FORMATOS_PADRAO,
+                        help="proporção dos formatos, ex.: txt=0.8,docx=0.1,pdf=0.1")
+    return parser
+
+def main(argv=None):
+    """Função principal."""
+    args = criar_parser().parse_args(argv)
+
+    print("🏗️  Gerador de Corpus Sintético")
+    print("=" * 50)
+    print(f"📁 Destino: {args.destino}")
+    print(f"📊 {args.vagas} vaga(s), {args.curriculos} currículo(s), semente {args.semente}")
+
+    resumo = gerar_corpus(args.destino, args.vagas, args.curriculos, args.semente,
+                          args.sobreposicao, args.variacao, args.formatos,
+                          progresso=10000 if args.curriculos >= 10000 else 0)
+
+    formatos = ', '.join(f"{quantidade} .{formato}" for formato, quantidade in resumo['formatos'].items())
+    print(f"✅ Corpus gerado: {formatos}")
+    print(f"\n💡 Para analisar: python main.py organizado --pasta-vagas {os.path.join(args.destino, 'vagas')}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
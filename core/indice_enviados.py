@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Índice de Enviados - Consulta O(1) de Pares (Email, Vaga) Já Enviados
+=====================================================================
+
+DESCRIÇÃO:
+Este módulo mantém em memória os pares (Email, Vaga) do registro de envios
+(core.registro_envios), carregados uma única vez por execução e atualizados a
+cada envio. A verificação "já enviado" de cada empresa de cada currículo
+aprovado deixa de consultar o log e passa a ser uma busca em tabela hash.
+
+LÓGICA DE FUNCIONAMENTO:
+
+1. CARREGAMENTO ÚNICO:
+   - Na primeira consulta, lê apenas as colunas Email e Vaga do registro
+   - O registro SQLite continua sendo a fonte persistente dos pares
+   - Cada envio registrado é acrescentado ao índice (sem recarregar)
+
+2. CONJUNTO EXATO (padrão):
+   - set de tuplas (email, vaga): consulta O(1), sem falsos positivos
+   - Adequado para históricos de até centenas de milhares de envios
+
+3. FILTRO DE BLOOM (históricos muito grandes):
+   - Vetor de bits dimensionado para 1% de falsos positivos, com folga para
+     o dobro dos pares atuais (~10 bits por par, em vez de ~200 bytes no set)
+   - Posições calculadas por hash duplo (blake2b), inseridas em lote com numpy
+     (packbits)
+   - "Não está no filtro" é resposta definitiva (O(1), sem acessar o banco)
+   - "Talvez esteja" é confirmado pelo índice (Email, Vaga) do SQLite
+   - Ativado por envio.filtro_bloom no config.yaml, ou automaticamente acima
+     de LIMITE_CONJUNTO pares
+
+DEPENDÊNCIAS:
+- hashlib: biblioteca padrão
+- numpy: vetor de bits do filtro de Bloom (importado só quando o filtro é criado)
+
+EXEMPLO DE USO:
+indice = IndiceEnviados(registro.pares_enviados(), confirmar=registro.consultar_par)
+if ('rh@empresa.com', 'Dev Python') not in indice:
+    ...
+    indice.adicionar('rh@empresa.com', 'Dev Python')
+
+Autor: Cara Core Informática
+Data: 2025
+Licença: MIT
+"""
+
+import math
+import hashlib
+
+# Acima desta quantidade de pares, o filtro de Bloom é usado automaticamente
+LIMITE_CONJUNTO = 500_000
+
+TAXA_FALSOS_POSITIVOS = 0.01
+
+# Pares previstos no filtro em relação aos atuais (envios futuros da execução)
+FOLGA_CAPACIDADE = 2
+
+_MASCARA_64 = (1 << 64) - 1
+
+def _chave(email, vaga):
+    """Chave em bytes do par (email, vaga)."""
+    return f"{email}\x1f{vaga}".encode('utf-8')
+
+def _hashes(chave):
+    """Dois hashes de 64 bits da chave (hash duplo do filtro de Bloom)."""
+    digest = hashlib.blake2b(chave, digest_size=16).digest()
+    return int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+
+class FiltroBloom:
+    """Filtro de Bloom sobre um vetor de bits numpy."""
+
+    def __init__(self, capacidade, taxa_falsos_positivos=TAXA_FALSOS_POSITIVOS):
+        """Dimensiona bits e funções de hash para a capacidade e a taxa de falsos positivos."""
+        # numpy só é carregado com o filtro ativo (acima de LIMITE_CONJUNTO pares)
+        import numpy as np
+        capacidade = max(1, capacidade)
+        self.bits = max(64, math.ceil(-capacidade * math.log(taxa_falsos_positivos) / math.log(2) ** 2))
+        self.funcoes = max(1, round(self.bits / capacidade * math.log(2)))
+        self.vetor = np.zeros((self.bits + 7) // 8, dtype=np.uint8)
+
+    def _posicoes(self, chave):
+        """Posições dos bits da chave."""
+        h1, h2 = _hashes(chave)
+        return [((h1 + i * h2) & _MASCARA_64) % self.bits for i in range(self.funcoes)]
+
+    def adicionar(self, chave):
+        """Marca os bits da chave."""
+        for posicao in self._posicoes(chave):
+            self.vetor[posicao >> 3] |= 1 << (posicao & 7)
+
+    def adicionar_lote(self, chaves):
+        """Marca os bits de várias chaves de uma vez."""
+        import numpy as np
+        digests = b''.join(hashlib.blake2b(chave, digest_size=16).digest() for chave in chaves)
+        if not digests:
+            return
+        # Mesmos hashes de _hashes: dois inteiros little-endian por chave, o segundo ímpar
+        hashes = np.frombuffer(digests, dtype='<u8').reshape(-1, 2).astype(np.uint64)
+        hashes[:, 1] |= np.uint64(1)
+        passos = np.arange(self.funcoes, dtype=np.uint64)
+        # Soma em uint64 com estouro (módulo 2^64), como no cálculo individual
+        with np.errstate(over='ignore'):
+            posicoes = (hashes[:, :1] + passos * hashes[:, 1:]) % np.uint64(self.bits)
+        marcados = np.zeros(self.vetor.size * 8, dtype=bool)
+        marcados[posicoes.ravel().astype(np.intp)] = True
+        self.vetor |= np.packbits(marcados, bitorder='little')
+
+    def __contains__(self, chave):
+        """Falso: a chave certamente não foi adicionada; verdadeiro: provavelmente foi."""
+        vetor = self.vetor
+        return all(vetor[posicao >> 3] & (1 << (posicao & 7)) for posicao in self._posicoes(chave))
+
+    @property
+    def bytes(self):
+        """Memória ocupada pelo vetor de bits."""
+        return self.vetor.nbytes
+
+class IndiceEnviados:
+    """Pares (email, vaga) já enviados, em conjunto exato ou filtro de Bloom."""
+
+    def __init__(self, pares, confirmar=None, filtro_bloom=None):
+        """Carrega os pares; filtro_bloom None escolhe pelo tamanho (exige confirmar)."""
+        pares = list(pares)
+        if filtro_bloom is None:
+            filtro_bloom = len(pares) > LIMITE_CONJUNTO and confirmar is not None
+        if filtro_bloom and confirmar is None:
+            raise ValueError("o filtro de Bloom exige a função confirmar (consulta exata)")
+
+        self.confirmar = confirmar
+        self.total = len(pares)
+        self.consultas_banco = 0
+        if filtro_bloom:
+            self.conjunto = None
+            self.filtro = FiltroBloom(len(pares) * FOLGA_CAPACIDADE)
+            self.filtro.adicionar_lote(_chave(email, vaga) for email, vaga in pares)
+        else:
+            self.conjunto = set(pares)
+            self.filtro = None
+
+    @property
+    def usa_filtro_bloom(self):
+        """Indica se o índice está no modo filtro de Bloom."""
+        return self.filtro is not None
+
+    def __len__(self):
+        """Quantidade de pares carregados e adicionados."""
+        return self.total
+
+    def __contains__(self, par):
+        """Indica se o par (email, vaga) já foi enviado."""
+        if self.conjunto is not None:
+            return par in self.conjunto
+        if _chave(*par) not in self.filtro:
+            return False
+        # Possível falso positivo: confirma no registro
+        self.consultas_banco += 1
+        return self.confirmar(*par)
+
+    def adicionar(self, email, vaga):
+        """Acrescenta um par recém-enviado."""
+        self.total += 1
+        if self.conjunto is not None:
+            self.conjunto.add((email, vaga))
+        else:
+            self.filtro.adicionar(_chave(email, vaga))
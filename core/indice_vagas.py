@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Índice de Vagas - Índice Invertido de Palavras-chave
+====================================================
+
+DESCRIÇÃO:
+Este módulo mantém um índice invertido persistente (termo → vagas) construído
+a partir das vagas tokenizadas. A busca de um currículo percorre apenas as
+listas de vagas dos termos do próprio currículo, de modo que o custo cresce
+com o tamanho do currículo e não com a quantidade de vagas.
+
+LÓGICA DE FUNCIONAMENTO:
+
+1. CONSTRUÇÃO INCREMENTAL:
+   - Escaneia a pasta vagas/ e compara tamanho e data de modificação
+   - Apenas vagas novas ou alteradas são carregadas e tokenizadas
+   - Vagas removidas saem do índice
+
+2. ESTRUTURA:
+   - postings: termo → lista de ids de vagas que contêm o termo
+   - vagas: id → nome, caminho, assinatura do arquivo e termos distintos
+   - A quantidade de termos distintos de cada vaga é o denominador da pontuação
+
+3. BUSCA:
+   - Conta, para cada vaga alcançada, quantos termos do currículo ela contém
+   - Pontuação = (termos presentes / termos distintos da vaga) * 100,
+     exatamente como analisar_compatibilidade
+   - Retorna as k vagas de maior pontuação (empate: vaga indexada primeiro)
+   - Sem vagas alcançadas suficientes, completa com as primeiras vagas do
+     índice (pontuação zero), percorrendo só até encontrar as que faltam
+
+4. PERSISTÊNCIA:
+   - Índice salvo em .cache/indice_vagas.json
+   - Reconstruído por completo se a versão do tokenizador mudar
+
+DEPENDÊNCIAS:
+- core.ats_analyzer: carregamento e tokenização das vagas
+- heapq, json, os: biblioteca padrão
+
+EXEMPLO DE USO:
+indice = IndiceInvertido()
+indice.atualizar('vagas')
+melhores = indice.buscar(tokens_curriculo, k=3)
+
+Autor: Cara Core Informática
+Data: 2025
+Licença: MIT
+"""
+
+import os
+import json
+import heapq
+from core import ats_analyzer
+
+ARQUIVO_INDICE_PADRAO = os.path.join('.cache', 'indice_vagas.json')
+EXTENSOES_VAGA = ('.txt', '.docx', '.pdf')
+
+class IndiceInvertido:
+    """Índice invertido persistente de termos das vagas."""
+
+    def __init__(self, arquivo_indice=ARQUIVO_INDICE_PADRAO):
+        """Inicializa o índice, carregando a versão salva se existir."""
+        self.arquivo_indice = arquivo_indice
+        self.postings = {}
+        self.vagas = []
+        self.ids_por_caminho = {}
+        self.carregar()
+
+    def carregar(self):
+        """Carrega o índice do disco se compatível com o tokenizador atual."""
+        if not os.path.exists(self.arquivo_indice):
+            return
+        try:
+            with open(self.arquivo_indice, 'r', encoding='utf-8') as f:
+                dados = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Índice de vagas ignorado ({e}), será reconstruído")
+            return
+
+        if dados.get('versao_tokenizador') != ats_analyzer.VERSAO_TOKENIZADOR:
+            return
+
+        self.postings = dados['postings']
+        self.vagas = dados['vagas']
+        self.ids_por_caminho = {vaga['caminho']: id_vaga
+                                for id_vaga, vaga in enumerate(self.vagas) if vaga}
+
+    def salvar(self):
+        """Grava o índice em disco."""
+        pasta = os.path.dirname(self.arquivo_indice)
+        if pasta:
+            os.makedirs(pasta, exist_ok=True)
+        dados = {
+            'versao_tokenizador': ats_analyzer.VERSAO_TOKENIZADOR,
+            'vagas': self.vagas,
+            'postings': self.postings
+        }
+        caminho_temp = f"{self.arquivo_indice}.tmp"
+        with open(caminho_temp, 'w', encoding='utf-8') as f:
+            json.dump(dados, f, ensure_ascii=False)
+        os.replace(caminho_temp, self.arquivo_indice)
+
+    @property
+    def total_vagas(self):
+        """Quantidade de vagas ativas no índice."""
+        return len(self.ids_por_caminho)
+
+    def adicionar_vaga(self, nome, caminho, tokens, assinatura=None):
+        """Adiciona uma vaga tokenizada ao índice e retorna seu id."""
+        if caminho in self.ids_por_caminho:
+            self.remover_vaga(caminho)
+
+        termos = list(dict.fromkeys(tokens))
+        id_vaga = len(self.vagas)
+        self.vagas.append({
+            'nome': nome,
+            'caminho': caminho,
+            'assinatura': assinatura,
+            'termos': termos
+        })
+        self.ids_por_caminho[caminho] = id_vaga
+
+        for termo in termos:
+            self.postings.setdefault(termo, []).append(id_vaga)
+
+        return id_vaga
+
+    def remover_vaga(self, caminho):
+        """Remove uma vaga do índice."""
+        id_vaga = self.ids_por_caminho.pop(caminho, None)
+        if id_vaga is None:
+            return
+
+        for termo in self.vagas[id_vaga]['termos']:
+            ids = [i for i in self.postings.get(termo, []) if i != id_vaga]
+            if ids:
+                self.postings[termo] = ids
+            else:
+                self.postings.pop(termo, None)
+
+        self.vagas[id_vaga] = None
+
+    def atualizar(self, pasta_vagas, corpus=None):
+        """Sincroniza o índice com os arquivos da pasta de vagas.
+
+        Com um Corpus, as vagas carregadas ficam disponíveis para o restante da execução.
+        """
+        if not os.path.exists(pasta_vagas):
+            return 0
+
+        encontrados = set()
+        alteradas = 0
+
+        for item in sorted(os.scandir(pasta_vagas), key=lambda e: e.name):
+            if not item.is_file() or not item.name.lower().endswith(EXTENSOES_VAGA):
+                continue
+
+            info = item.stat()
+            assinatura = [info.st_size, info.st_mtime]
+            encontrados.add(item.path)
+
+            id_vaga = self.ids_por_caminho.get(item.path)
+            if id_vaga is not None and self.vagas[id_vaga]['assinatura'] == assinatura:
+                continue
+
+            if corpus is not None:
+                documento = corpus.documento(item.path)
+                valido, tokens = documento.valido, documento.termos
+            else:
+                texto, tokens = ats_analyzer.carregar_documento(item.path)
+                valido = bool(texto)
+
+            if not valido:
+                self.remover_vaga(item.path)
+                continue
+
+            self.adicionar_vaga(os.path.splitext(item.name)[0], item.path, tokens, assinatura)
+            alteradas += 1
+
+        removidas = [caminho for caminho in self.ids_por_caminho if caminho not in encontrados]
+        for caminho in removidas:
+            self.remover_vaga(caminho)
+
+        # Descarta ids de vagas removidas quando passam a ocupar metade do índice
+        if len(self.vagas) > 2 * self.total_vagas:
+            self.compactar()
+
+        if alteradas or removidas:
+            self.salvar()
+
+        return alteradas + len(removidas)
+
+    def compactar(self):
+        """Renumera as vagas ativas e reconstrói as listas de termos."""
+        vagas_ativas = [vaga for vaga in self.vagas if vaga]
+        self.vagas = []
+        self.postings = {}
+        self.ids_por_caminho = {}
+        for vaga in vagas_ativas:
+            self.adicionar_vaga(vaga['nome'], vaga['caminho'], vaga['termos'], vaga['assinatura'])
+
+    def buscar(self, tokens_curriculo, k=1):
+        """Retorna as k vagas de maior pontuação como (id, nome, pontuação)."""
+        contagens = {}
+        for termo in set(tokens_curriculo):
+            for id_vaga in self.postings.get(termo, ()):
+                contagens[id_vaga] = contagens.get(id_vaga, 0) + 1
+
+        candidatos = []
+        for id_vaga, presentes in contagens.items():
+            pontuacao = round((presentes / len(self.vagas[id_vaga]['termos'])) * 100, 1)
+            candidatos.append((pontuacao, -id_vaga))
+
+        melhores = heapq.nlargest(k, candidatos)
+
+        # Completa com vagas sem nenhum termo em comum (pontuação zero), na ordem do
+        # índice: ids_por_caminho já guarda os ids em ordem crescente (um id novo é
+        # sempre maior que os existentes), então a busca para após k vagas sem
+        # termo em comum, sem ordenar todas as vagas
+        if len(melhores) < k:
+            for id_vaga in self.ids_por_caminho.values():
+                if len(melhores) >= k:
+                    break
+                if id_vaga not in contagens:
+                    melhores.append((0.0, -id_vaga))
+
+        return [(-id_negativo, self.vagas[-id_negativo]['nome'], pontuacao)
+                for pontuacao, id_negativo in melhores]
+
+    def palavras_faltantes(self, id_vaga, tokens_curriculo):
+        """Retorna as palavras da vaga ausentes no currículo."""
+        conjunto = set(tokens_curriculo)
+        return [termo for termo in self.vagas[id_vaga]['termos'] if termo not in conjunto]
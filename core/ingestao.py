@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ingestão - Carregamento Paralelo de Documentos
+==============================================
+
+DESCRIÇÃO:
+Este módulo distribui a conversão (carregar_arquivo) e a tokenização
+(tokenizar) de documentos entre vários processos, aproveitando todos os núcleos
+da máquina durante a extração de PDF/DOCX.
+
+LÓGICA DE FUNCIONAMENTO:
+
+1. DISTRIBUIÇÃO:
+   - Com workers=1 os documentos são processados no próprio processo
+   - Com workers>1 usa um ProcessPoolExecutor com N processos
+   - Cada processo configura o cache de extração igual ao processo principal
+
+2. ORDEM DETERMINÍSTICA:
+   - Os resultados são devolvidos como gerador, na mesma ordem dos caminhos
+   - Apenas uma janela limitada de documentos fica em processamento por vez,
+     então a memória não cresce com o tamanho do lote
+
+3. TRACE (--trace):
+   - Com o trace ativo, cada processo mede seus documentos e devolve os
+     tempos junto com o resultado, incorporados ao trace principal
+
+4. ISOLAMENTO DE FALHAS:
+   - Exceções de um documento viram um resultado com mensagem de erro
+   - Se um processo morrer (ex.: falha no extrator), o documento é refeito
+     em um processo isolado e o restante do lote continua em um novo pool
+   - Documentos que já tinham terminado antes da queda não são refeitos
+
+DEPENDÊNCIAS:
+- core.ats_analyzer: carregamento e tokenização
+- core.ats_trace: tempos por documento (opcional)
+- concurrent.futures: pool de processos
+
+EXEMPLO DE USO:
+for caminho, texto, tokens, erro in carregar_documentos(caminhos, workers=8):
+    if erro:
+        print(f"Erro em {caminho}: {erro}")
+
+Autor: Cara Core Informática
+Data: 2025
+Licença: MIT
+"""
+
+from collections import deque
+from core import ats_analyzer
+from core import ats_trace
+
+# Documentos em processamento por worker (limita a memória do lote)
+JANELA_POR_WORKER = 4
+
+def _inicializar_worker(configuracao_cache, trace_ativo=False):
+    """Replica no processo filho a configuração de cache e o trace do processo principal."""
+    ats_analyzer.configurar_cache(*configuracao_cache)
+    if trace_ativo:
+        ats_trace.ativar()
+
+def processar_documento(caminho):
+    """Carrega e tokeniza um documento, retornando (caminho, texto, tokens, erro)."""
+    try:
+        texto, tokens = ats_analyzer.carregar_documento(caminho)
+        return caminho, texto, tokens, None
+    except Exception as e:
+        return caminho, "", [], f"{type(e).__name__}: {e}"
+
+def _processar_com_trace(caminho):
+    """Processa um documento no processo filho e devolve também os tempos medidos."""
+    trace = ats_trace.obter()
+    trace.limpar()
+    return processar_documento(caminho), trace.parcial()
+
+def _submeter(executor, caminho):
+    """Envia o documento ao pool (com medição de tempos se o trace estiver ativo).
+
+    Com o pool já quebrado por um processo que morreu, devolve um futuro com a
+    falha, tratado como os demais documentos pendentes daquele pool.
+    """
+    from concurrent.futures import Future
+    from concurrent.futures.process import BrokenProcessPool
+    try:
+        if ats_trace.ativo():
+            return executor.submit(_processar_com_trace, caminho)
+        return executor.submit(processar_documento, caminho)
+    except BrokenProcessPool as e:
+        futuro = Future()
+        futuro.set_exception(e)
+        return futuro
+
+def _resultado(futuro):
+    """Obtém o resultado do documento, incorporando os tempos ao trace principal."""
+    resultado = futuro.result()
+    if ats_trace.ativo():
+        resultado, parcial = resultado
+        ats_trace.obter().mesclar(parcial)
+    return resultado
+
+def _concluido(futuro):
+    """Indica se o documento já foi processado com sucesso pelo pool."""
+    return futuro.done() and not futuro.cancelled() and futuro.exception() is None
+
+def _novo_executor(workers):
+    """Cria um pool de processos com a configuração de cache atual."""
+    # Importado só quando há paralelismo (--workers > 1)
+    from concurrent.futures import ProcessPoolExecutor
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_inicializar_worker,
+        initargs=(ats_analyzer.configuracao_cache(), ats_trace.ativo())
+    )
+
+def _processar_isolado(caminho):
+    """Processa um documento em um processo exclusivo."""
+    from concurrent.futures.process import BrokenProcessPool
+    executor = _novo_executor(1)
+    try:
+        return _resultado(_submeter(executor, caminho))
+    except BrokenProcessPool:
+        return caminho, "", [], "processo de extração encerrado inesperadamente"
+    finally:
+        executor.shutdown(wait=False)
+
+def carregar_documentos(caminhos, workers=1):
+    """Gera (caminho, texto, tokens, erro) para cada caminho, na ordem de entrada."""
+    if workers <= 1:
+        for caminho in caminhos:
+            yield processar_documento(caminho)
+        return
+
+    from concurrent.futures.process import BrokenProcessPool
+    iterador = iter(caminhos)
+    pendentes = deque()
+    executor = _novo_executor(workers)
+
+    try:
+        while True:
+            # Mantém a janela de documentos em processamento cheia
+            while len(pendentes) < workers * JANELA_POR_WORKER:
+                caminho = next(iterador, None)
+                if caminho is None:
+                    break
+                pendentes.append((caminho, _submeter(executor, caminho)))
+
+            if not pendentes:
+                break
+
+            caminho, futuro = pendentes.popleft()
+            try:
+                yield _resultado(futuro)
+            except BrokenProcessPool:
+                # Um processo morreu: refaz este documento isolado e recria o pool.
+                # O primeiro da fila não é necessariamente o que derrubou o pool;
+                # se o culpado estiver entre os pendentes, ele derruba o novo pool
+                # e é isolado quando chegar à frente da fila
+                executor.shutdown(wait=False)
+                yield _processar_isolado(caminho)
+                executor = _novo_executor(workers)
+                # Documentos já concluídos com sucesso não são extraídos de novo
+                pendentes = deque((c, f if _concluido(f) else _submeter(executor, c)) for c, f in pendentes)
+    finally:
+        for _, futuro in pendentes:
+            futuro.cancel()
+        executor.shutdown(wait=False)
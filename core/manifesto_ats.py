@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Manifesto ATS - Reanálise Incremental do Sistema Organizado
+===========================================================
+
+DESCRIÇÃO:
+Este módulo guarda, ao lado de log/resultados_ats_organizado.csv, um manifesto
+(.manifesto.jsonl) com a assinatura de cada arquivo analisado e o resultado
+obtido. Na execução seguinte, apenas os pares vaga/currículo novos ou
+alterados são recalculados.
+
+LÓGICA DE FUNCIONAMENTO:
+
+1. ASSINATURA DOS ARQUIVOS:
+   - (caminho, tamanho, data de modificação, hash SHA-256 do conteúdo)
+   - Se tamanho e data não mudaram, o hash anterior é reaproveitado sem ler o arquivo
+   - Se mudaram, o hash é recalculado: conteúdo idêntico continua válido
+
+2. DECISÃO POR PAR VAGA/CURRÍCULO:
+   - Vaga alterada: todos os seus currículos são recalculados
+   - Vaga inalterada: só currículos novos ou alterados são recalculados
+   - Currículos removidos saem do manifesto e dos resultados
+   - Duplicatas (core.deduplicacao) só são reaproveitadas com o representante
+
+3. RESULTADOS ARMAZENADOS:
+   - pontuação, primeiras palavras faltantes (core.resultados_compactos) e
+     contagens de tokens de cada currículo
+   - Recomendações são regeneradas a partir desses dados
+   - O manifesto é descartado se a versão do tokenizador mudar
+
+4. UMA VAGA POR VEZ (JSON Lines):
+   - Primeira linha com as versões; depois uma linha por vaga
+   - Ao abrir, só a posição de cada vaga no arquivo é lida; os currículos
+     de uma vaga são carregados quando ela é planejada
+   - Cada vaga registrada é gravada na hora em um arquivo temporário, que
+     substitui o manifesto ao salvar: a memória acompanha a maior vaga,
+     não o total de currículos
+
+DEPENDÊNCIAS:
+- core.cache_extracao: hash do conteúdo dos arquivos
+- core.ats_analyzer: versão do tokenizador
+- json, os: biblioteca padrão
+
+EXEMPLO DE USO:
+manifesto = ManifestoAnalise('log/resultados_ats_organizado.csv')
+assinatura = manifesto.assinatura_vaga('python', 'vagas/python/vaga.txt')
+if manifesto.vaga_inalterada('python', assinatura):
+    resultado = manifesto.resultado_curriculo('python', assinatura_cv)
+manifesto.registrar_vaga('python', assinatura, tokens_vaga, curriculos)
+manifesto.salvar()
+
+Autor: Cara Core Informática
+Data: 2025
+Licença: MIT
+"""
+
+import os
+import json
+from core import ats_analyzer
+from core import cache_extracao
+
+VERSAO_MANIFESTO = 2
+
+# Início de cada linha de vaga, gravado por registrar_vaga: permite ler o nome
+# sem decodificar a lista de currículos ao indexar o arquivo
+_PREFIXO_VAGA = '{"nome": '
+
+def caminho_manifesto(arquivo_resultados):
+    """Retorna o caminho do manifesto associado ao arquivo de resultados."""
+    return os.path.splitext(arquivo_resultados)[0] + '.manifesto.jsonl'
+
+def calcular_assinatura(caminho, anterior=None):
+    """Calcula a assinatura do arquivo, reaproveitando o hash se nada mudou."""
+    info = os.stat(caminho)
+    assinatura = {
+        'caminho': caminho,
+        'tamanho': info.st_size,
+        'mtime': info.st_mtime
+    }
+    if (anterior and anterior.get('tamanho') == info.st_size
+            and anterior.get('mtime') == info.st_mtime):
+        assinatura['hash'] = anterior.get('hash')
+    else:
+        assinatura['hash'] = cache_extracao.hash_arquivo(caminho)
+    return assinatura
+
+def mesma_assinatura(atual, anterior):
+    """Indica se duas assinaturas representam o mesmo conteúdo."""
+    return bool(anterior) and atual['caminho'] == anterior.get('caminho') and atual['hash'] == anterior.get('hash')
+
+class ManifestoAnalise:
+    """Manifesto de arquivos e resultados da última análise organizada."""
+
+    def __init__(self, arquivo_resultados='log/resultados_ats_organizado.csv'):
+        """Inicializa e indexa o manifesto associado ao arquivo de resultados."""
+        self.caminho = caminho_manifesto(arquivo_resultados)
+        self.posicoes = self.carregar()
+        self.vagas = 0
+        self.reaproveitados = 0
+        self.recalculados = 0
+        self._vaga_carregada = (None, {})
+        self._arquivo_novo = None
+
+    def carregar(self):
+        """Posição de cada vaga no manifesto anterior (vazio se inexistente ou incompatível)."""
+        if not os.path.exists(self.caminho):
+            return {}
+        posicoes = {}
+        try:
+            with open(self.caminho, 'rb') as f:
+                cabecalho = json.loads(f.readline() or b'{}')
+                if (cabecalho.get('versao') != VERSAO_MANIFESTO or
+                        cabecalho.get('versao_tokenizador') != ats_analyzer.VERSAO_TOKENIZADOR):
+                    return {}
+                posicao = f.tell()
+                for linha in f:
+                    posicoes[self._nome_vaga(linha.decode('utf-8'))] = posicao
+                    posicao += len(linha)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Manifesto ignorado ({e}), todas as vagas serão recalculadas")
+            return {}
+        return posicoes
+
+    @staticmethod
+    def _nome_vaga(linha):
+        """Nome da vaga de uma linha do manifesto."""
+        if linha.startswith(_PREFIXO_VAGA):
+            return json.JSONDecoder().raw_decode(linha, len(_PREFIXO_VAGA))[0]
+        return json.loads(linha)['nome']
+
+    def _anterior(self, nome_vaga):
+        """Registro da vaga no manifesto anterior, lido do disco uma vez por vaga."""
+        if self._vaga_carregada[0] != nome_vaga:
+            registro = {}
+            posicao = self.posicoes.get(nome_vaga)
+            if posicao is not None:
+                with open(self.caminho, 'rb') as f:
+                    f.seek(posicao)
+                    registro = json.loads(f.readline())
+            self._vaga_carregada = (nome_vaga, registro)
+        return self._vaga_carregada[1]
+
+    def assinatura_vaga(self, nome_vaga, arquivo_vaga):
+        """Calcula a assinatura do arquivo de vaga."""
+        anterior = self._anterior(nome_vaga).get('vaga')
+        return calcular_assinatura(arquivo_vaga, anterior)
+
+    def vaga_inalterada(self, nome_vaga, assinatura):
+        """Indica se o arquivo da vaga é o mesmo da análise anterior."""
+        return mesma_assinatura(assinatura, self._anterior(nome_vaga).get('vaga'))
+
+    def tokens_vaga(self, nome_vaga):
+        """Quantidade de tokens da vaga registrada na análise anterior."""
+        return self._anterior(nome_vaga).get('tokens_vaga')
+
+    def assinatura_curriculo(self, nome_vaga, caminho_curriculo):
+        """Calcula a assinatura de um currículo da vaga."""
+        arquivo = os.path.basename(caminho_curriculo)
+        anterior = self._anterior(nome_vaga).get('curriculos', {}).get(arquivo, {}).get('assinatura')
+        return calcular_assinatura(caminho_curriculo, anterior)
+
+    def resultado_curriculo(self, nome_vaga, assinatura):
+        """Retorna o resultado anterior do currículo se o arquivo não mudou."""
+        arquivo = os.path.basename(assinatura['caminho'])
+        registro = self._anterior(nome_vaga).get('curriculos', {}).get(arquivo)
+        if registro and mesma_assinatura(assinatura, registro.get('assinatura')):
+            return registro['resultado']
+        return None
+
+    def registrar_vaga(self, nome_vaga, assinatura, tokens_vaga, curriculos):
+        """Grava a vaga e seus currículos: lista de (assinatura, ResultadoCurriculo)."""
+        registro = {
+            'nome': nome_vaga,
+            'vaga': assinatura,
+            'tokens_vaga': tokens_vaga,
+            'curriculos': {
+                os.path.basename(assinatura_cv['caminho']): {
+                    'assinatura': assinatura_cv,
+                    'resultado': dict(resultado.como_dicionario(), caminho=assinatura_cv['caminho'])
+                }
+                for assinatura_cv, resultado in curriculos
+            }
+        }
+        self._abrir_novo().write(json.dumps(registro, ensure_ascii=False).encode('utf-8') + b'\n')
+        self.vagas += 1
+
+    def _abrir_novo(self):
+        """Arquivo temporário do novo manifesto, com a linha de versões."""
+        if self._arquivo_novo is None:
+            pasta = os.path.dirname(self.caminho)
+            if pasta:
+                os.makedirs(pasta, exist_ok=True)
+            self._arquivo_novo = open(f"{self.caminho}.tmp", 'wb')
+            cabecalho = {'versao': VERSAO_MANIFESTO, 'versao_tokenizador': ats_analyzer.VERSAO_TOKENIZADOR}
+            self._arquivo_novo.write(json.dumps(cabecalho).encode('utf-8') + b'\n')
+        return self._arquivo_novo
+
+    def salvar(self):
+        """Substitui o manifesto pelas vagas registradas nesta execução."""
+        arquivo = self._abrir_novo()
+        arquivo.close()
+        self._arquivo_novo = None
+        self._vaga_carregada = (None, {})
+        os.replace(arquivo.name, self.caminho)
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Painel de Envios - Dados Paginados e Agregados do Dashboard
+===========================================================
+
+DESCRIÇÃO:
+Este módulo prepara os dados exibidos pelo dashboard (core/dashboard.py) sem
+entregar o log inteiro ao navegador a cada interação. Os totais (envios por
+status, envios por dia, empresas já contatadas) são mantidos de forma
+incremental, e as tabelas são lidas página a página direto do registro de
+envios (core.registro_envios).
+
+LÓGICA DE FUNCIONAMENTO:
+
+1. AGREGADOS INCREMENTAIS:
+   - carregar lê apenas os registros com id maior que o último processado
+     (o registro é somente-acréscimo) e soma ao que já foi agregado
+   - Mudanças de Status feitas na planilha (tabela edicoes do registro) são
+     lidas da mesma forma, pelo id da edição, e movem o envio de um status
+     para outro nos agregados
+   - Envios e edições são lidos no mesmo instantâneo do banco, então uma
+     edição nunca é contada duas vezes
+   - Envios por status e por dia (Data_Envio "AAAA-MM-DD...") em Counter
+   - Conjunto de emails contatados para a lista de empresas pendentes
+   - Métricas e gráficos usam só os agregados (um ponto por status/dia)
+
+2. PAGINAÇÃO E FILTRO NO SERVIDOR:
+   - pagina_log consulta o SQLite com filtro de status, LIMIT e OFFSET
+     (mais recentes primeiro); só a página visível vira DataFrame
+   - A quantidade de linhas do filtro vem dos agregados, sem COUNT(*)
+
+3. EMPRESAS PENDENTES:
+   - Máscara numpy "ainda não contatada" sobre as linhas de empresas.xlsx
+   - Cada email novo no log desmarca apenas as linhas daquele email
+   - pagina_pendentes devolve só as linhas da página pedida
+
+4. ATUALIZAÇÃO AO VIVO:
+   - atualizar acompanha o final do registro: lê só os envios com id maior
+     que o último visto e os soma aos agregados (custo proporcional ao que
+     chegou, não ao tamanho do log)
+   - empresas.xlsx só é relida (core.cache_planilhas) se tamanho ou data
+     mudarem; a máscara de pendentes é refeita a partir dos emails contatados
+   - Uma trava protege os agregados, compartilhados entre as sessões do
+     dashboard (atualização automática em intervalos)
+
+DEPENDÊNCIAS:
+- sqlite3, collections: biblioteca padrão
+- pandas, numpy: páginas e máscara de pendentes
+- core.registro_envios: colunas e leitura somente leitura do registro
+- core.cache_planilhas: leitura de empresas.xlsx
+
+EXEMPLO DE USO:
+painel = PainelEnvios('log/registro_envios.db', arquivo_empresas='empresas.xlsx')
+painel.atualizar()
+painel.por_status['Enviado']
+df_pagina = painel.pagina_log(status='Enviado', pagina=2, tamanho=50)
+
+Autor: Cara Core Informática
+Data: 2025
+Licença: MIT
+"""
+
+import os
+import re
+import math
+import sqlite3
+import threading
+from collections import Counter
+import numpy as np
+import pandas as pd
+from core import cache_planilhas
+from core import registro_envios
+
+TAMANHO_PAGINA_PADRAO = 50
+
+# Status contados como resposta da empresa
+STATUS_RESPOSTA = ('Entrevista', 'Respondido')
+STATUS_FOLLOWUP = 'Sem Retorno'
+
+# Registros lidos por consulta ao atualizar os agregados
+LOTE_LEITURA = 10_000
+
+_DATA_ISO = re.compile(r'^\d{4}-\d{2}-\d{2}')
+
+def total_paginas(total, tamanho=TAMANHO_PAGINA_PADRAO):
+    """Quantidade de páginas para o total de linhas (mínimo 1)."""
+    return max(1, math.ceil(total / tamanho))
+
+class PainelEnvios:
+    """Agregados incrementais e páginas do registro de envios e das empresas."""
+
+    def __init__(self, arquivo_registro=registro_envios.ARQUIVO_REGISTRO_PADRAO, df_empresas=None,
+                 arquivo_empresas=None):
+        """Inicializa os agregados vazios e indexa as empresas (DataFrame ou planilha acompanhada)."""
+        self.arquivo_registro = arquivo_registro
+        self.arquivo_empresas = arquivo_empresas
+        self.assinatura_empresas = None
+        self.ultimo_id = 0
+        self.ultima_edicao = 0
+        self.total = 0
+        self.por_status = Counter()
+        self.por_dia = Counter()
+        self.emails_contatados = set()
+        self.atualizacoes = 0
+        self._trava = threading.Lock()
+        self.definir_empresas(df_empresas if df_empresas is not None else pd.DataFrame())
+
+    def _conectar(self):
+        """Conexão somente leitura com o registro (não bloqueia o modo envio)."""
+        return sqlite3.connect(f'file:{self.arquivo_registro}?mode=ro', uri=True)
+
+    def definir_empresas(self, df_empresas):
+        """Define a planilha de empresas e recalcula a máscara de pendentes."""
+        self.df_empresas = df_empresas.reset_index(drop=True)
+        self.pendente = np.ones(len(self.df_empresas), dtype=bool)
+        self.linhas_por_email = {}
+        if 'Email' in self.df_empresas.columns:
+            for i, email in enumerate(self.df_empresas['Email']):
+                self.linhas_por_email.setdefault(email, []).append(i)
+        for email in self.emails_contatados:
+            self._desmarcar(email)
+
+    def _desmarcar(self, email):
+        """Marca como contatadas as empresas do email."""
+        linhas = self.linhas_por_email.get(email)
+        if linhas:
+            self.pendente[linhas] = False
+
+    def _aplicar(self, linhas):
+        """Soma registros (id, status, data de envio, email) aos agregados."""
+        for id_registro, status, data_envio, email in linhas:
+            self.total += 1
+            self.por_status[status] += 1
+            if isinstance(data_envio, str) and _DATA_ISO.match(data_envio):
+                self.por_dia[data_envio[:10]] += 1
+            if email not in self.emails_contatados:
+                self.emails_contatados.add(email)
+                self._desmarcar(email)
+            self.ultimo_id = id_registro
+
+    def _aplicar_edicoes(self, conexao, ultimo_id_anterior):
+        """Move nos agregados os envios cujo Status foi editado desde a última leitura.
+
+        Envios lidos agora já vêm com o Status editado; só os agregados antes
+        (id até ultimo_id_anterior) são ajustados.
+        """
+        existe = conexao.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'edicoes'").fetchone()
+        if not existe:
+            return 0
+        edicoes = conexao.execute(
+            'SELECT id, envio, "Status_Anterior", "Status" FROM edicoes WHERE id > ? ORDER BY id',
+            (self.ultima_edicao,)
+        ).fetchall()
+        for id_edicao, envio, anterior, status in edicoes:
+            if envio <= ultimo_id_anterior:
+                self.por_status[anterior] -= 1
+                self.por_status[status] += 1
+                if not self.por_status[anterior]:
+                    del self.por_status[anterior]
+            self.ultima_edicao = id_edicao
+        return len(edicoes)
+
+    def carregar(self):
+        """Agrega os registros novos desde a última leitura; retorna quantos foram lidos."""
+        conexao = self._conectar()
+        try:
+            # Envios e edições lidos no mesmo instantâneo (transação de leitura)
+            conexao.execute('BEGIN')
+            ultimo_id_anterior = self.ultimo_id
+            lidos = 0
+            while True:
+                linhas = conexao.execute(
+                    'SELECT id, "Status", "Data_Envio", "Email" FROM envios WHERE id > ? ORDER BY id LIMIT ?',
+                    (self.ultimo_id, LOTE_LEITURA)
+                ).fetchall()
+                if not linhas:
+                    break
+                self._aplicar(linhas)
+                lidos += len(linhas)
+            self._aplicar_edicoes(conexao, ultimo_id_anterior)
+            return lidos
+        finally:
+            conexao.close()
+
+    def _assinatura_planilha(self):
+        """(tamanho, data de modificação) da planilha de empresas, ou None se ausente."""
+        try:
+            info = os.stat(self.arquivo_empresas)
+        except (OSError, TypeError):
+            return None
+        return (info.st_size, info.st_mtime_ns)
+
+    def atualizar(self):
+        """Acrescenta os envios novos e relê as empresas se a planilha mudou; retorna os envios lidos."""
+        with self._trava:
+            if self.arquivo_empresas is not None:
+                assinatura = self._assinatura_planilha()
+                if assinatura != self.assinatura_empresas:
+                    self.assinatura_empresas = assinatura
+                    self.definir_empresas(cache_planilhas.ler_excel(self.arquivo_empresas)
+                                          if assinatura else pd.DataFrame())
+            novos = self.carregar() if os.path.exists(self.arquivo_registro) else 0
+            self.atualizacoes += 1
+            return novos
+
+    @property
+    def total_respostas(self):
+        """Envios com resposta da empresa."""
+        return sum(self.por_status[status] for status in STATUS_RESPOSTA)
+
+    @property
+    def followups_pendentes(self):
+        """Envios aguardando follow-up."""
+        return self.por_status[STATUS_FOLLOWUP]
+
+    def total_log(self, status=None):
+        """Linhas do log com o filtro de status (None = todos), pelos agregados."""
+        return self.total if status is None else self.por_status[status]
+
+    def envios_por_dia(self):
+        """Série (dias, envios) em ordem cronológica."""
+        dias = sorted(self.por_dia)
+        return dias, [self.por_dia[dia] for dia in dias]
+
+    def pagina_log(self, status=None, pagina=1, tamanho=TAMANHO_PAGINA_PADRAO, colunas=registro_envios.COLUNAS):
+        """Página do log (mais recentes primeiro), filtrada por status no SQLite."""
+        lista = ', '.join(f'"{coluna}"' for coluna in colunas)
+        filtro, parametros = ('WHERE "Status" = ?', [status]) if status is not None else ('', [])
+        conexao = self._conectar()
+        try:
+            return pd.read_sql_query(
+                f'SELECT {lista} FROM envios {filtro} ORDER BY id DESC LIMIT ? OFFSET ?', conexao,
+                params=parametros + [tamanho, (max(1, pagina) - 1) * tamanho]
+            )
+        finally:
+            conexao.close()
+
+    @property
+    def total_pendentes(self):
+        """Empresas ainda não contatadas."""
+        return int(self.pendente.sum())
+
+    def pagina_pendentes(self, pagina=1, tamanho=TAMANHO_PAGINA_PADRAO):
+        """Página das empresas ainda não contatadas, na ordem da planilha."""
+        inicio = (max(1, pagina) - 1) * tamanho
+        indices = np.flatnonzero(self.pendente)[inicio:inicio + tamanho]
+        return self.df_empresas.iloc[indices]
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ranking de Vagas - Top K com Heap e Estatísticas em Uma Passada
+===============================================================
+
+DESCRIÇÃO:
+Este módulo monta o ranking dos currículos de uma vaga no sistema organizado
+(core.ats_organizer) à medida que as pontuações chegam. Com um limite K, só
+os K melhores ficam em memória (heap de tamanho K), em vez de ordenar todos
+os resultados da vaga; contagem, taxa de aprovação, média e percentis são
+calculados na mesma passada.
+
+LÓGICA DE FUNCIONAMENTO:
+
+1. TOP K COM HEAP:
+   - Heap mínimo de até K resultados, com o pior do ranking no topo
+   - Cada resultado novo só entra se for melhor que o pior do heap
+     (custo O(log K) por currículo, memória O(K))
+   - Ordem do ranking: maior pontuação primeiro; empates pelo nome do arquivo
+     (a mesma da ordenação completa)
+   - Sem K, todos os resultados são mantidos e ordenados ao final
+
+2. ESTATÍSTICAS EM UMA PASSADA:
+   - Total, aprovados (≥ PONTUACAO_APROVACAO), soma, mínimo e máximo
+   - Histograma das pontuações (Counter): as pontuações têm uma casa
+     decimal, então há no máximo 1001 valores distintos
+   - Percentis exatos pelo histograma (posto mais próximo), sem guardar
+     as pontuações individuais
+
+DEPENDÊNCIAS:
+- heapq, math, collections: biblioteca padrão
+
+EXEMPLO DE USO:
+ranking = RankingVaga(k=20)
+for resultado in resultados:
+    ranking.adicionar(resultado)
+melhores = ranking.ranking()
+resumo = ranking.resumo()   # total, aprovados, taxa_aprovacao, percentis...
+
+Autor: Cara Core Informática
+Data: 2025
+Licença: MIT
+"""
+
+import math
+import heapq
+from collections import Counter
+
+PONTUACAO_APROVACAO = 70
+
+# Percentis calculados para o resumo de cada vaga
+PERCENTIS = (25, 50, 75, 90)
+
+class _Entrada:
+    """Resultado no heap; a entrada "menor" é a pior colocada no ranking."""
+
+    __slots__ = ('pontuacao', 'arquivo', 'resultado')
+
+    def __init__(self, resultado):
+        """Guarda a chave de ordenação do resultado."""
+        self.pontuacao = resultado.pontuacao
+        self.arquivo = resultado.arquivo
+        self.resultado = resultado
+
+    def __lt__(self, outra):
+        """Pior colocada: menor pontuação ou, no empate, maior nome de arquivo."""
+        if self.pontuacao != outra.pontuacao:
+            return self.pontuacao < outra.pontuacao
+        return self.arquivo > outra.arquivo
+
+def percentil(histograma, total, p):
+    """Percentil p (posto mais próximo) a partir do histograma de pontuações."""
+    posto = max(1, math.ceil(p / 100 * total))
+    acumulado = 0
+    for pontuacao in sorted(histograma):
+        acumulado += histograma[pontuacao]
+        if acumulado >= posto:
+            return pontuacao
+    return None
+
+class RankingVaga:
+    """Ranking dos currículos de uma vaga (top K opcional) e estatísticas das pontuações."""
+
+    def __init__(self, k=None):
+        """Inicializa o ranking vazio (k None: mantém todos os resultados; senão k ≥ 1)."""
+        if k is not None and k < 1:
+            raise ValueError(f"k deve ser maior ou igual a 1: {k}")
+        self.k = k
+        self.total = 0
+        self.aprovados = 0
+        self.soma = 0.0
+        self.histograma = Counter()
+        self._heap = []
+        self._todos = []
+
+    def adicionar(self, resultado):
+        """Contabiliza o resultado e o mantém se estiver entre os K melhores."""
+        pontuacao = resultado.pontuacao
+        self.total += 1
+        self.soma += pontuacao
+        self.histograma[pontuacao] += 1
+        if pontuacao >= PONTUACAO_APROVACAO:
+            self.aprovados += 1
+
+        if self.k is None:
+            self._todos.append(resultado)
+        elif len(self._heap) < self.k:
+            heapq.heappush(self._heap, _Entrada(resultado))
+        elif self._heap[0] < _Entrada(resultado):
+            heapq.heapreplace(self._heap, _Entrada(resultado))
+
+    def ranking(self):
+        """Resultados mantidos, do melhor para o pior."""
+        if self.k is None:
+            return sorted(self._todos, key=lambda x: (-x.pontuacao, x.arquivo))
+        return [entrada.resultado for entrada in sorted(self._heap, reverse=True)]
+
+    def resumo(self):
+        """Estatísticas das pontuações de todos os currículos da vaga."""
+        if not self.total:
+            return {'total': 0, 'aprovados': 0, 'taxa_aprovacao': 0.0, 'media': None,
+                    'minimo': None, 'maximo': None, 'percentis': {}}
+        return {
+            'total': self.total,
+            'aprovados': self.aprovados,
+            'taxa_aprovacao': self.aprovados / self.total * 100,
+            'media': self.soma / self.total,
+            'minimo': min(self.histograma),
+            'maximo': max(self.histograma),
+            'percentis': {p: percentil(self.histograma, self.total, p) for p in PERCENTIS}
+        }
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Registro de Envios - Log de Envios Somente-Acréscimo em SQLite
+==============================================================
+
+DESCRIÇÃO:
+Este módulo mantém o registro oficial dos envios (antes log/log_respostas.xlsx)
+em um banco SQLite no modo WAL (log/registro_envios.db). Cada envio é uma
+inserção de uma linha, em vez de concatenar o DataFrame inteiro e regravar a
+planilha a cada email. A planilha Excel passa a ser uma exportação, gerada ao
+final da execução do modo envio ou sob demanda (python main.py exportar), e
+as edições feitas nela à mão (Status, follow-up) voltam para o registro.
+
+LÓGICA DE FUNCIONAMENTO:
+
+1. REGISTRO SOMENTE-ACRÉSCIMO:
+   - registrar insere uma linha e confirma a transação (custo constante)
+   - Mesmas colunas da planilha: Empresa, Vaga, Email, Data_Envio,
+     Data_Seguimento, Status, Observações, Numero_Followup, Pontuacao_ATS
+   - Datas guardadas como texto "AAAA-MM-DD HH:MM:SS"
+
+2. MIGRAÇÃO DA PLANILHA:
+   - Na primeira abertura (banco vazio), as linhas de log_respostas.xlsx são
+     importadas com openpyxl em modo somente leitura
+   - A partir daí o banco é a fonte dos dados; a planilha é sobrescrita
+     pelas exportações
+
+3. EDIÇÕES FEITAS NA PLANILHA:
+   - Ao abrir o registro e antes de cada exportação, a planilha é relida e
+     as linhas editadas à mão são aplicadas ao banco
+   - Linhas casadas pela chave (Email, Vaga, Data_Envio); só as colunas
+     COLUNAS_EDITAVEIS (Data_Seguimento, Status, Observações,
+     Numero_Followup) são atualizadas
+   - Cada mudança de Status também é acrescentada à tabela edicoes, que o
+     dashboard acompanha como acompanha os envios novos
+
+4. LEITURA CONCORRENTE:
+   - Modo WAL: o dashboard lê (ler_dataframe, conexão somente leitura)
+     enquanto o modo envio grava, sem bloqueios nem arquivos pela metade
+   - ja_enviado consulta o índice em memória de pares (Email, Vaga)
+     (core.indice_enviados), carregado uma vez e atualizado a cada envio
+
+5. EXPORTAÇÃO PARA EXCEL:
+   - exportar_excel grava a planilha em modo write-only do openpyxl, em um
+     arquivo temporário que substitui o anterior ao final
+   - Data_Envio e Data_Seguimento voltam a ser datas do Excel
+
+DEPENDÊNCIAS:
+- sqlite3, threading: biblioteca padrão
+- core.indice_enviados: consulta de pares já enviados
+- openpyxl: importação, edições e exportação da planilha
+- yaml: leitura da configuração em exportar_registro (importado sob demanda)
+- pandas: apenas em dataframe/ler_dataframe (importado sob demanda)
+
+EXEMPLO DE USO:
+registro = RegistroEnvios('log/registro_envios.db', 'log/log_respostas.xlsx')
+if not registro.ja_enviado('rh@empresa.com', 'Dev Python'):
+    registro.registrar({'Empresa': 'Empresa', 'Vaga': 'Dev Python', 'Email': 'rh@empresa.com', ...})
+registro.exportar_excel('log/log_respostas.xlsx')
+
+python main.py exportar   # planilha gerada sob demanda
+
+Autor: Cara Core Informática
+Data: 2025
+Licença: MIT
+"""
+
+import os
+import math
+import sqlite3
+import threading
+from collections import deque
+from datetime import datetime, date
+from core import indice_enviados
+
+ARQUIVO_REGISTRO_PADRAO = 'log/registro_envios.db'
+ARQUIVO_EXCEL_PADRAO = 'log/log_respostas.xlsx'
+
+# Colunas da planilha log_respostas.xlsx, na ordem de exportação
+COLUNAS = ('Empresa', 'Vaga', 'Email', 'Data_Envio', 'Data_Seguimento', 'Status',
+           'Observações', 'Numero_Followup', 'Pontuacao_ATS')
+
+# Colunas de data (texto no banco, datas do Excel na planilha)
+COLUNAS_DATA = ('Data_Envio', 'Data_Seguimento')
+
+# Colunas editadas à mão na planilha e reaplicadas ao registro
+COLUNAS_EDITAVEIS = ('Data_Seguimento', 'Status', 'Observações', 'Numero_Followup')
+
+# Identificação de um envio na planilha
+COLUNAS_CHAVE = ('Email', 'Vaga', 'Data_Envio')
+
+def _lista(colunas):
+    """Colunas entre aspas, separadas por vírgula, para as consultas."""
+    return ', '.join(f'"{coluna}"' for coluna in colunas)
+
+_LISTA_COLUNAS = _lista(COLUNAS)
+
+ESQUEMA = f"""
+CREATE TABLE IF NOT EXISTS envios (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    "Empresa" TEXT,
+    "Vaga" TEXT,
+    "Email" TEXT,
+    "Data_Envio" TEXT,
+    "Data_Seguimento" TEXT,
+    "Status" TEXT,
+    "Observações" TEXT,
+    "Numero_Followup" INTEGER,
+    "Pontuacao_ATS" REAL
+);
+CREATE INDEX IF NOT EXISTS envios_email_vaga ON envios ("Email", "Vaga");
+CREATE TABLE IF NOT EXISTS edicoes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    envio INTEGER,
+    "Status_Anterior" TEXT,
+    "Status" TEXT
+);
+"""
+
+def _valor(valor):
+    """Normaliza um valor para gravação (datas em texto, NaN/NaT em NULL)."""
+    if valor is None:
+        return None
+    if isinstance(valor, float) and math.isnan(valor):
+        return None
+    if type(valor).__name__ == 'NaTType':
+        return None
+    if isinstance(valor, datetime):
+        return valor.isoformat(sep=' ', timespec='seconds')
+    if isinstance(valor, date):
+        return valor.isoformat()
+    if hasattr(valor, 'item'):
+        # Escalares numpy (int64, float64) lidos pelo pandas
+        return _valor(valor.item())
+    return valor
+
+def _valor_excel(valor):
+    """Data em texto do registro como datetime para a planilha (outros textos sem mudança)."""
+    if isinstance(valor, str):
+        try:
+            return datetime.fromisoformat(valor)
+        except ValueError:
+            return valor
+    return valor
+
+def _comparavel(coluna, valor):
+    """Valor normalizado para comparar banco e planilha ('2025-07-10' e a data do Excel casam)."""
+    valor = _valor(valor)
+    if coluna in COLUNAS_DATA:
+        return _valor(_valor_excel(valor))
+    return valor
+
+def ler_planilha(arquivo_excel):
+    """Linhas não vazias de uma planilha no formato de log_respostas.xlsx, como dicionários."""
+    from openpyxl import load_workbook
+    livro = load_workbook(arquivo_excel, read_only=True)
+    try:
+        linhas = livro.active.iter_rows(values_only=True)
+        cabecalho = next(linhas, None) or ()
+        return [dict(zip(cabecalho, linha)) for linha in linhas if any(v is not None for v in linha)]
+    finally:
+        livro.close()
+
+def ler_dataframe(arquivo=ARQUIVO_REGISTRO_PADRAO):
+    """Lê o registro em um DataFrame por uma conexão somente leitura (usado pelo dashboard)."""
+    import pandas as pd
+    if not os.path.exists(arquivo):
+        return pd.DataFrame(columns=list(COLUNAS))
+    conexao = sqlite3.connect(f'file:{arquivo}?mode=ro', uri=True)
+    try:
+        return pd.read_sql_query(f'SELECT {_LISTA_COLUNAS} FROM envios ORDER BY id', conexao)
+    finally:
+        conexao.close()
+
+class RegistroEnvios:
+    """Log de envios em SQLite (WAL), com inserção por envio e exportação para Excel."""
+
+    def __init__(self, arquivo=ARQUIVO_REGISTRO_PADRAO, arquivo_excel=ARQUIVO_EXCEL_PADRAO, filtro_bloom=None):
+        """Abre (ou cria) o registro; na primeira abertura importa a planilha existente."""
+        pasta = os.path.dirname(arquivo)
+        if pasta:
+            os.makedirs(pasta, exist_ok=True)
+        self.arquivo = arquivo
+        self.novos = 0
+        self.filtro_bloom = filtro_bloom
+        self._indice = None
+        # Registros também chegam pela thread da caixa de saída
+        self._trava = threading.RLock()
+        self._conexao = sqlite3.connect(arquivo, check_same_thread=False)
+        self._conexao.execute('PRAGMA journal_mode=WAL')
+        self._conexao.execute('PRAGMA synchronous=NORMAL')
+        with self._conexao:
+            self._conexao.executescript(ESQUEMA)
+
+        if arquivo_excel and os.path.exists(arquivo_excel):
+            if len(self) == 0:
+                importados = self.importar_excel(arquivo_excel)
+                if importados:
+                    print(f"📥 {importados} registro(s) importado(s) de {arquivo_excel} para {arquivo}")
+            else:
+                self.importar_edicoes(arquivo_excel)
+
+    def __len__(self):
+        """Quantidade de registros."""
+        with self._trava:
+            return self._conexao.execute('SELECT COUNT(*) FROM envios').fetchone()[0]
+
+    def fechar(self):
+        """Fecha a conexão com o banco."""
+        self._conexao.close()
+
+    def _inserir(self, registros):
+        """Insere registros (dicionários com as colunas da planilha) em uma transação."""
+        linhas = [tuple(_valor(registro.get(coluna)) for coluna in COLUNAS) for registro in registros]
+        with self._trava, self._conexao:
+            self._conexao.executemany(
+                f'INSERT INTO envios ({_LISTA_COLUNAS}) VALUES ({", ".join("?" * len(COLUNAS))})', linhas
+            )
+        return len(linhas)
+
+    def registrar(self, registro):
+        """Acrescenta um envio ao registro (e ao índice de enviados, se já carregado)."""
+        with self._trava:
+            self.novos += self._inserir([registro])
+            if self._indice is not None:
+                self._indice.adicionar(registro.get('Email'), registro.get('Vaga'))
+
+    def importar_excel(self, arquivo_excel):
+        """Importa as linhas de uma planilha no formato de log_respostas.xlsx."""
+        return self._inserir(ler_planilha(arquivo_excel))
+
+    def importar_edicoes(self, arquivo_excel):
+        """Aplica ao registro as edições feitas à mão na planilha exportada; retorna as linhas alteradas."""
+        registros = ler_planilha(arquivo_excel)
+        with self._trava:
+            # Envios por chave; chaves repetidas casam na ordem das linhas
+            atuais = {}
+            consulta = f'SELECT id, {_lista(COLUNAS_CHAVE)}, {_lista(COLUNAS_EDITAVEIS)} FROM envios ORDER BY id'
+            for linha in self._conexao.execute(consulta):
+                chave = tuple(map(_comparavel, COLUNAS_CHAVE, linha[1:1 + len(COLUNAS_CHAVE)]))
+                atuais.setdefault(chave, deque()).append(linha)
+
+            alteracoes = []
+            for registro in registros:
+                envios = atuais.get(tuple(_comparavel(coluna, registro.get(coluna)) for coluna in COLUNAS_CHAVE))
+                if not envios:
+                    continue
+                linha = envios.popleft()
+                anteriores = list(linha[1 + len(COLUNAS_CHAVE):])
+                novos = [_valor(registro.get(coluna)) for coluna in COLUNAS_EDITAVEIS]
+                if any(_comparavel(coluna, novo) != _comparavel(coluna, anterior)
+                       for coluna, novo, anterior in zip(COLUNAS_EDITAVEIS, novos, anteriores)):
+                    alteracoes.append((linha[0], anteriores, novos))
+
+            status = COLUNAS_EDITAVEIS.index('Status')
+            atribuicoes = ', '.join(f'"{coluna}" = ?' for coluna in COLUNAS_EDITAVEIS)
+            with self._conexao:
+                for id_envio, anteriores, novos in alteracoes:
+                    self._conexao.execute(f'UPDATE envios SET {atribuicoes} WHERE id = ?', novos + [id_envio])
+                    if novos[status] != anteriores[status]:
+                        self._conexao.execute(
+                            'INSERT INTO edicoes (envio, "Status_Anterior", "Status") VALUES (?, ?, ?)',
+                            (id_envio, anteriores[status], novos[status])
+                        )
+
+        if alteracoes:
+            print(f"✏️  {len(alteracoes)} registro(s) editado(s) em {arquivo_excel} aplicado(s) ao registro")
+        return len(alteracoes)
+
+    @property
+    def indice(self):
+        """Índice em memória dos pares (Email, Vaga), carregado na primeira consulta."""
+        with self._trava:
+            if self._indice is None:
+                self._indice = indice_enviados.IndiceEnviados(
+                    self.pares_enviados(), confirmar=self.consultar_par, filtro_bloom=self.filtro_bloom
+                )
+            return self._indice
+
+    def ja_enviado(self, email, vaga):
+        """Indica se já existe registro para o par (email, vaga) (consulta O(1) no índice)."""
+        with self._trava:
+            return (email, vaga) in self.indice
+
+    def pares_enviados(self):
+        """Pares (Email, Vaga) de todos os registros."""
+        with self._trava:
+            return self._conexao.execute('SELECT "Email", "Vaga" FROM envios').fetchall()
+
+    def consultar_par(self, email, vaga):
+        """Consulta exata do par (email, vaga) no índice do banco."""
+        with self._trava:
+            linha = self._conexao.execute(
+                'SELECT 1 FROM envios WHERE "Email" = ? AND "Vaga" = ? LIMIT 1', (email, vaga)
+            ).fetchone()
+        return linha is not None
+
+    def registros(self):
+        """Todos os registros, na ordem de inserção, como dicionários."""
+        with self._trava:
+            linhas = self._conexao.execute(f'SELECT {_LISTA_COLUNAS} FROM envios ORDER BY id').fetchall()
+        return [dict(zip(COLUNAS, linha)) for linha in linhas]
+
+    def dataframe(self):
+        """Registros em um DataFrame com as colunas da planilha."""
+        import pandas as pd
+        with self._trava:
+            return pd.read_sql_query(f'SELECT {_LISTA_COLUNAS} FROM envios ORDER BY id', self._conexao)
+
+    def exportar_excel(self, arquivo_excel=ARQUIVO_EXCEL_PADRAO):
+        """Gera a planilha Excel a partir do registro; retorna a quantidade de linhas.
+
+        Edições feitas à mão na planilha existente são aplicadas ao registro
+        antes de ela ser sobrescrita.
+        """
+        from openpyxl import Workbook
+        if os.path.exists(arquivo_excel):
+            self.importar_edicoes(arquivo_excel)
+
+        livro = Workbook(write_only=True)
+        planilha = livro.create_sheet()
+        planilha.append(COLUNAS)
+
+        datas = [COLUNAS.index(coluna) for coluna in COLUNAS_DATA]
+        total = 0
+        with self._trava:
+            for linha in self._conexao.execute(f'SELECT {_LISTA_COLUNAS} FROM envios ORDER BY id'):
+                linha = list(linha)
+                for i in datas:
+                    linha[i] = _valor_excel(linha[i])
+                planilha.append(linha)
+                total += 1
+
+        pasta = os.path.dirname(arquivo_excel)
+        if pasta:
+            os.makedirs(pasta, exist_ok=True)
+        temporario = arquivo_excel + '.tmp'
+        livro.save(temporario)
+        os.replace(temporario, arquivo_excel)
+        return total
+
+def exportar_registro(arquivo_config='config.yaml'):
+    """Exporta a planilha de log a partir do registro configurado em config.yaml."""
+    arquivos = {}
+    if os.path.exists(arquivo_config):
+        import yaml
+        with open(arquivo_config, 'r', encoding='utf-8') as f:
+            arquivos = (yaml.safe_load(f) or {}).get('arquivos') or {}
+
+    arquivo_excel = arquivos.get('log_respostas', ARQUIVO_EXCEL_PADRAO)
+    registro = RegistroEnvios(arquivos.get('registro_envios', ARQUIVO_REGISTRO_PADRAO), arquivo_excel)
+    try:
+        total = registro.exportar_excel(arquivo_excel)
+    finally:
+        registro.fechar()
+    print(f"📄 Log exportado: {arquivo_excel} ({total} registros)")
+    return total
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Resultados Compactos - Registro Enxuto por Currículo e Detalhes em Disco
+========================================================================
+
+DESCRIÇÃO:
+Este módulo define o resultado de um currículo no sistema organizado
+(core.ats_organizer). Em vez de um dicionário com a lista completa de
+palavras faltantes e as recomendações já montadas, cada currículo ocupa um
+objeto com __slots__ que guarda apenas identificação, pontuação, contagens e
+as primeiras palavras faltantes. Em execuções grandes, a lista completa de
+palavras faltantes de cada currículo é gravada em um arquivo em disco, para
+consulta fora do programa.
+
+LÓGICA DE FUNCIONAMENTO:
+
+1. RESULTADO COMPACTO (ResultadoCurriculo):
+   - __slots__: arquivo, pontuação, TOP_FALTANTES primeiras palavras
+     faltantes (tupla), total de faltantes, tokens do currículo e da vaga
+     e duplicata_de
+   - Nome do currículo derivado do arquivo; recomendações geradas na hora
+     do relatório (usam no máximo as TOP_FALTANTES primeiras palavras)
+   - como_dicionario/de_dicionario: formato gravado no manifesto incremental
+
+2. DETALHES EM DISCO (DetalhesEmDisco):
+   - Arquivo JSON Lines ao lado dos resultados (.detalhes.jsonl), com vaga,
+     arquivo, a lista completa de palavras faltantes e total_faltantes de
+     cada currículo
+   - Arquivo apenas de saída: relatórios, recomendações e exportações usam
+     as TOP_FALTANTES primeiras palavras guardadas em memória
+   - Usado automaticamente acima de LIMITE_CURRICULOS_MEMORIA currículos
+   - Gravado em um temporário que substitui o arquivo anterior ao fechar
+   - Análise incremental: as linhas dos currículos reaproveitados são
+     copiadas do arquivo anterior (indexado por trechos de cada vaga); sem
+     linha anterior, o currículo sai só com as primeiras palavras faltantes
+     (menos palavras que total_faltantes)
+
+DEPENDÊNCIAS:
+- json, os: biblioteca padrão
+
+EXEMPLO DE USO:
+detalhes = DetalhesEmDisco(caminho_detalhes('log/resultados_ats_organizado.csv'))
+detalhes.gravar('dev_python', 'joao.pdf', palavras_faltantes)
+detalhes.reaproveitar('dev_python', resultados_reaproveitados)
+resultado = ResultadoCurriculo('joao.pdf', 82.5, palavras_faltantes, 340, 45)
+detalhes.fechar()
+
+Autor: Cara Core Informática
+Data: 2025
+Licença: MIT
+"""
+
+import os
+import json
+
+# Palavras faltantes mantidas em memória (as recomendações mostram até 10)
+TOP_FALTANTES = 10
+
+# Currículos por execução acima dos quais o detalhe completo vai para disco
+LIMITE_CURRICULOS_MEMORIA = 20_000
+
+# Início de cada linha gravada por DetalhesEmDisco.gravar
+_PREFIXO_VAGA = '{"vaga": '
+
+def caminho_detalhes(arquivo_resultados):
+    """Arquivo de detalhes associado ao arquivo de resultados."""
+    return os.path.splitext(arquivo_resultados)[0] + '.detalhes.jsonl'
+
+def _vaga_da_linha(linha):
+    """Vaga de uma linha do arquivo de detalhes (sem decodificar a lista de palavras)."""
+    linha = linha.decode('utf-8')
+    if linha.startswith(_PREFIXO_VAGA):
+        return json.JSONDecoder().raw_decode(linha, len(_PREFIXO_VAGA))[0]
+    return json.loads(linha)['vaga']
+
+class ResultadoCurriculo:
+    """Resultado de um currículo contra a sua vaga, com as primeiras palavras faltantes."""
+
+    __slots__ = ('arquivo', 'pontuacao', 'palavras_faltantes', 'total_faltantes',
+                 'tokens_curriculo', 'tokens_vaga', 'duplicata_de')
+
+    def __init__(self, arquivo, pontuacao, palavras_faltantes, tokens_curriculo, tokens_vaga,
+                 duplicata_de=None, total_faltantes=None):
+        """Guarda o resultado; das palavras faltantes, só as TOP_FALTANTES primeiras."""
+        self.arquivo = arquivo
+        self.pontuacao = pontuacao
+        self.palavras_faltantes = tuple(palavras_faltantes[:TOP_FALTANTES])
+        self.total_faltantes = len(palavras_faltantes) if total_faltantes is None else total_faltantes
+        self.tokens_curriculo = tokens_curriculo
+        self.tokens_vaga = tokens_vaga
+        self.duplicata_de = duplicata_de
+
+    @property
+    def curriculo(self):
+        """Nome do currículo (arquivo sem extensão)."""
+        return os.path.splitext(self.arquivo)[0]
+
+    def como_dicionario(self):
+        """Campos gravados no manifesto da análise incremental."""
+        return {
+            'curriculo': self.curriculo,
+            'arquivo': self.arquivo,
+            'pontuacao': self.pontuacao,
+            'palavras_faltantes': list(self.palavras_faltantes),
+            'total_faltantes': self.total_faltantes,
+            'tokens_curriculo': self.tokens_curriculo,
+            'tokens_vaga': self.tokens_vaga,
+            'duplicata_de': self.duplicata_de
+        }
+
+    @classmethod
+    def de_dicionario(cls, dados):
+        """Reconstrói o resultado a partir do manifesto (aceita listas completas antigas)."""
+        return cls(dados['arquivo'], dados['pontuacao'], dados.get('palavras_faltantes') or [],
+                   dados.get('tokens_curriculo'), dados.get('tokens_vaga'), dados.get('duplicata_de'),
+                   dados.get('total_faltantes'))
+
+class DetalhesEmDisco:
+    """Listas completas de palavras faltantes em JSON Lines (arquivo apenas de saída)."""
+
+    def __init__(self, arquivo, reaproveitar_anterior=False):
+        """Cria o arquivo de detalhes, que substitui o anterior ao fechar.
+
+        reaproveitar_anterior: indexa o arquivo anterior por vaga, para copiar as
+        linhas dos currículos reaproveitados (análise incremental).
+        """
+        pasta = os.path.dirname(arquivo)
+        if pasta:
+            os.makedirs(pasta, exist_ok=True)
+        self.arquivo = arquivo
+        self.registros = 0
+        self.copiados = 0
+        self.trechos_anteriores = self._indexar_anterior() if reaproveitar_anterior else {}
+        self._arquivo = open(f"{arquivo}.tmp", 'wb')
+
+    def _indexar_anterior(self):
+        """Trechos [início, fim) de cada vaga no arquivo anterior."""
+        trechos = {}
+        if not os.path.exists(self.arquivo):
+            return trechos
+        with open(self.arquivo, 'rb') as f:
+            posicao = 0
+            for linha in f:
+                inicio, posicao = posicao, posicao + len(linha)
+                try:
+                    vaga = _vaga_da_linha(linha)
+                except (ValueError, KeyError):
+                    continue
+                lista = trechos.setdefault(vaga, [])
+                # Linhas seguidas da mesma vaga formam um único trecho
+                if lista and lista[-1][1] == inicio:
+                    lista[-1][1] = posicao
+                else:
+                    lista.append([inicio, posicao])
+        return trechos
+
+    def gravar(self, vaga, arquivo, palavras_faltantes, total_faltantes=None):
+        """Acrescenta a lista completa de palavras faltantes de um currículo."""
+        palavras_faltantes = list(palavras_faltantes)
+        if total_faltantes is None:
+            total_faltantes = len(palavras_faltantes)
+        linha = json.dumps({'vaga': vaga, 'arquivo': arquivo, 'palavras_faltantes': palavras_faltantes,
+                            'total_faltantes': total_faltantes}, ensure_ascii=False)
+        self._arquivo.write(linha.encode('utf-8') + b'\n')
+        self.registros += 1
+
+    def reaproveitar(self, vaga, resultados):
+        """Copia do arquivo anterior as linhas dos currículos reaproveitados da vaga.
+
+        Currículos sem linha anterior são gravados com as primeiras palavras
+        faltantes do ResultadoCurriculo.
+        """
+        pendentes = {resultado.arquivo: resultado for resultado in resultados}
+        trechos = self.trechos_anteriores.get(vaga)
+        if trechos and pendentes:
+            with open(self.arquivo, 'rb') as f:
+                for inicio, fim in trechos:
+                    f.seek(inicio)
+                    while f.tell() < fim:
+                        linha = f.readline()
+                        try:
+                            arquivo = json.loads(linha).get('arquivo')
+                        except ValueError:
+                            continue
+                        if pendentes.pop(arquivo, None) is not None:
+                            self._arquivo.write(linha.rstrip(b'\n') + b'\n')
+                            self.registros += 1
+                            self.copiados += 1
+
+        for resultado in pendentes.values():
+            self.gravar(vaga, resultado.arquivo, resultado.palavras_faltantes, resultado.total_faltantes)
+
+    def fechar(self):
+        """Fecha o arquivo e substitui o arquivo de detalhes anterior."""
+        self._arquivo.close()
+        os.replace(self._arquivo.name, self.arquivo)
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tempo de Importação - Partida a Frio de Cada Modo do main.py
+============================================================
+
+DESCRIÇÃO:
+Este módulo mede quanto tempo o interpretador leva para importar main.py e os
+módulos de cada modo (analise, organizado, envio, watch, bench), usando
+python -X importtime em um processo novo. Serve para acompanhar o custo de
+partida das execuções agendadas pelo cron e detectar dependências pesadas
+(pandas, pdfplumber, python-docx, nltk, yagmail) importadas sem necessidade.
+
+LÓGICA DE FUNCIONAMENTO:
+
+1. MEDIÇÃO POR MODO:
+   - Executa python -X importtime -c "import main; main.importar_modulos(modo)"
+     em um processo separado (cache de módulos sempre frio)
+   - Cada modo é medido algumas vezes e a execução mais rápida é mantida
+
+2. INTERPRETAÇÃO DA SAÍDA:
+   - Cada linha "import time: próprio | acumulado | módulo" informa o tempo
+     do módulo e de tudo o que ele importou (em microssegundos)
+   - O tempo total do modo é a soma dos acumulados dos módulos de nível superior
+   - Lista as dependências pesadas carregadas e os módulos mais lentos
+
+3. COMPARAÇÃO COM BASELINE:
+   - Com um JSON anterior, aponta modos com tempo total maior que a tolerância
+   - Retorna as regressões (main.py usa código de saída 1)
+
+DEPENDÊNCIAS:
+- subprocess, sys, json: biblioteca padrão
+
+EXEMPLO DE USO:
+python main.py importtime
+python main.py importtime --baseline log/importtime_anterior.json
+
+regressoes = executar_relatorio('.', 'log/importtime.json')
+
+Autor: Cara Core Informática
+Data: 2025
+Licença: MIT
+"""
+
+import os
+import re
+import sys
+import json
+import subprocess
+from datetime import datetime
+
+VERSAO_RELATORIO = 1
+
+ARQUIVO_SAIDA_PADRAO = 'log/importtime.json'
+
+MODOS = ('analise', 'organizado', 'envio', 'watch', 'bench')
+
+# Pacotes cujo carregamento custa dezenas de milissegundos
+DEPENDENCIAS_PESADAS = ('pandas', 'numpy', 'pdfplumber', 'docx', 'nltk', 'yagmail', 'openpyxl')
+
+# Execuções por modo (mantém a mais rápida)
+REPETICOES = 3
+
+# Aumento tolerado em relação ao baseline
+TOLERANCIA = 0.25
+
+TOP_MODULOS = 8
+
+_LINHA_IMPORTTIME = re.compile(r'^import time:\s*(\d+)\s*\|\s*(\d+)\s*\|( *)(\S+)')
+
+def interpretar_saida(saida):
+    """Converte a saída de -X importtime em (módulo, próprio µs, acumulado µs, nível)."""
+    modulos = []
+    for linha in saida.splitlines():
+        encontrado = _LINHA_IMPORTTIME.match(linha)
+        if encontrado:
+            proprio, acumulado, recuo, nome = encontrado.groups()
+            modulos.append((nome, int(proprio), int(acumulado), (len(recuo) - 1) // 2))
+    return modulos
+
+def medir_modo(pasta_projeto, modo):
+    """Importa main.py e os módulos do modo em um processo novo e resume os tempos."""
+    comando = [sys.executable, '-X', 'importtime', '-c',
+               f"import main; main.importar_modulos({modo!r})"]
+    processo = subprocess.run(comando, cwd=pasta_projeto, capture_output=True, text=True)
+    if processo.returncode != 0:
+        raise RuntimeError(processo.stderr.strip().splitlines()[-1] if processo.stderr.strip() else
+                           f"falha ao importar o modo {modo}")
+
+    modulos = interpretar_saida(processo.stderr)
+    carregados = {nome.split('.')[0] for nome, _, _, _ in modulos}
+    mais_lentos = sorted(modulos, key=lambda m: -m[1])[:TOP_MODULOS]
+    return {
+        'total_ms': round(sum(acumulado for _, _, acumulado, nivel in modulos if nivel == 0) / 1000, 2),
+        'modulos': len(modulos),
+        'dependencias_pesadas': [nome for nome in DEPENDENCIAS_PESADAS if nome in carregados],
+        'mais_lentos': [{'modulo': nome, 'proprio_ms': round(proprio / 1000, 2)}
+                        for nome, proprio, _, _ in mais_lentos]
+    }
+
+def medir(pasta_projeto, modos=MODOS, repeticoes=REPETICOES):
+    """Mede todos os modos, mantendo a execução mais rápida de cada um."""
+    resultados = {}
+    for modo in modos:
+        medicoes = [medir_modo(pasta_projeto, modo) for _ in range(repeticoes)]
+        resultados[modo] = min(medicoes, key=lambda m: m['total_ms'])
+    return resultados
+
+def comparar_baseline(resultados, baseline, tolerancia=TOLERANCIA):
+    """Retorna os modos cujo tempo de importação piorou além da tolerância."""
+    regressoes = []
+    for modo, atual in resultados.items():
+        anterior = baseline.get('modos', {}).get(modo)
+        if not anterior or not anterior.get('total_ms'):
+            continue
+        variacao = atual['total_ms'] / anterior['total_ms'] - 1
+        if variacao > tolerancia:
+            regressoes.append({'modo': modo, 'anterior_ms': anterior['total_ms'],
+                               'atual_ms': atual['total_ms'], 'variacao': round(variacao, 4)})
+    return regressoes
+
+def imprimir_resultados(resultados):
+    """Exibe o tempo de importação e as dependências pesadas de cada modo."""
+    print(f"{'Modo':<14}{'Total ms':>10}{'Modulos':>9}  Dependencias pesadas")
+    for modo, dados in resultados.items():
+        pesadas = ', '.join(dados['dependencias_pesadas']) or '-'
+        print(f"{modo:<14}{dados['total_ms']:>10.1f}{dados['modulos']:>9}  {pesadas}")
+
+def executar_relatorio(pasta_projeto, arquivo_saida=ARQUIVO_SAIDA_PADRAO, arquivo_baseline=None):
+    """Mede os modos, grava o JSON e compara com o baseline; retorna as regressões."""
+    resultados = medir(pasta_projeto)
+    imprimir_resultados(resultados)
+
+    relatorio = {
+        'versao': VERSAO_RELATORIO,
+        'data': datetime.now().isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'modos': resultados
+    }
+
+    regressoes = []
+    if arquivo_baseline:
+        with open(arquivo_baseline, 'r', encoding='utf-8') as f:
+            regressoes = comparar_baseline(resultados, json.load(f))
+        relatorio['regressoes'] = regressoes
+        if regressoes:
+            print(f"\nRegressoes (tolerancia {TOLERANCIA:.0%}):")
+            for r in regressoes:
+                print(f"   {r['modo']}: {r['anterior_ms']:.1f} -> {r['atual_ms']:.1f} ms ({r['variacao']:+.0%})")
+        else:
+            print("\nSem regressoes em relacao ao baseline")
+
+    pasta = os.path.dirname(arquivo_saida)
+    if pasta:
+        os.makedirs(pasta, exist_ok=True)
+    with open(arquivo_saida, 'w', encoding='utf-8') as f:
+        json.dump(relatorio, f, ensure_ascii=False, indent=2)
+    print(f"Relatorio gravado em {arquivo_saida}")
+    return regressoes
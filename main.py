@@ -82,6 +82,26 @@ python main.py              # Análise básica
 python main.py analise      # Análise completa
 python main.py organizado   # Sistema organizado por vaga
 python main.py envio        # Análise + envio integrado
+python main.py watch        # Monitora vagas/*/curriculos e pontua o que chegar
+python main.py bench        # Benchmarks do pipeline (10/1k/100k documentos)
+python main.py importtime   # Tempo de importação (partida a frio) de cada modo
+python main.py exportar     # Gera log/log_respostas.xlsx a partir do registro de envios
+
+OPÇÕES:
+--no-cache                  # Ignora o cache de extração de PDF/DOCX
+--workers N                 # Converte e tokeniza documentos em N processos
+--incremental               # Organizado: recalcula só pares novos ou alterados
+--sem-deduplicacao          # Pontua também currículos/vagas quase idênticos
+--pasta-vagas DIR           # Organizado/watch: pasta base das vagas (padrão vagas)
+--formato csv|parquet|xlsx  # Organizado: formato dos resultados exportados (padrão csv)
+--top K                     # Organizado: exibe e exporta só os K melhores de cada vaga
+--trace arquivo.json        # Grava tempos por etapa e por documento em JSON
+--intervalo S               # Watch: segundos entre verificações (padrão 2)
+--tamanhos 10,1000          # Bench: quantidades de documentos medidas
+--etapas tokenizar,...      # Bench: etapas medidas
+--saida arquivo.json        # Bench/importtime: JSON de resultados (padrão em log/)
+--baseline arquivo.json     # Bench/importtime: compara com uma execução salva
+--sem-limite                # Bench: mede conversões PDF/DOCX acima de 1000
 
 Autor: Cara Core Informática
 Data: 2025
@@ -89,53 +109,203 @@ Licença: MIT
 """
 
 from core import ats_analyzer
-from core import ats_email_integration
-from core import ats_organizer
+from core import ats_trace
+from core import corpus as corpus_ats
+import argparse
+import importlib
+import os
 import sys
 
+# Módulos de cada modo, importados sob demanda: pandas, numpy, pdfplumber e
+# python-docx só são carregados pelos modos (e tipos de arquivo) que os usam
+MODULOS_POR_MODO = {
+    'analise': ['core.ats_analyzer', 'core.ats_matriz', 'core.deduplicacao'],
+    'organizado': ['core.ats_organizer', 'core.deduplicacao'],
+    'envio': ['core.ats_email_integration'],
+    'watch': ['core.ats_watch', 'core.deduplicacao'],
+    'bench': ['core.ats_benchmark'],
+    'importtime': ['core.tempo_importacao'],
+    'exportar': ['core.registro_envios']
+}
+
+def importar_modulos(modo):
+    """Importa os módulos usados pelo modo e os retorna em um dicionário."""
+    nomes = MODULOS_POR_MODO.get(modo or 'analise', [])
+    return {nome.rsplit('.', 1)[1]: importlib.import_module(nome) for nome in nomes}
+
+def inteiro_positivo(valor):
+    """Converte o argumento em inteiro maior ou igual a 1 (ex.: --top K)."""
+    try:
+        numero = int(valor)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"inteiro esperado: {valor}")
+    if numero < 1:
+        raise argparse.ArgumentTypeError(f"deve ser maior ou igual a 1: {valor}")
+    return numero
+
+def criar_parser():
+    """Cria o parser de argumentos da linha de comando."""
+    parser = argparse.ArgumentParser(
+        description="Sistema ATS - Cara Core Informatica"
+    )
+    parser.add_argument('modo', nargs='?', default=None,
+                        help="analise, organizado, envio, watch, bench, importtime ou exportar")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="ignora o cache de extracao de PDF/DOCX")
+    parser.add_argument('--workers', type=int, default=1, metavar='N',
+                        help="processos para converter e tokenizar documentos")
+    parser.add_argument('--incremental', action='store_true',
+                        help="organizado: recalcula apenas vagas/curriculos novos ou alterados")
+    parser.add_argument('--sem-deduplicacao', action='store_true',
+                        help="pontua cada curriculo/vaga, mesmo quase identico a outro")
+    parser.add_argument('--formato', default='csv', choices=['csv', 'parquet', 'xlsx'],
+                        help="organizado: formato do arquivo de resultados (xlsx: uma aba por vaga)")
+    parser.add_argument('--top', type=inteiro_positivo, default=None, metavar='K',
+                        help="organizado: mantem, exibe e exporta so os K melhores curriculos por vaga")
+    parser.add_argument('--trace', default=None, metavar='ARQUIVO',
+                        help="grava um trace JSON com tempos por etapa e por documento")
+    parser.add_argument('--pasta-vagas', default='vagas', metavar='DIR',
+                        help="organizado/watch: pasta base das vagas organizadas")
+    parser.add_argument('--intervalo', type=float, default=None, metavar='S',
+                        help="watch: segundos entre verificacoes das pastas (padrao 2)")
+    parser.add_argument('--tamanhos', default=None,
+                        help="bench: quantidades de documentos, ex.: 10,1000,100000")
+    parser.add_argument('--etapas', default=None,
+                        help="bench: etapas medidas, ex.: tokenizar,organizado")
+    parser.add_argument('--saida', default=None,
+                        help="bench/importtime: arquivo JSON de resultados")
+    parser.add_argument('--baseline', default=None,
+                        help="bench/importtime: JSON de uma execucao anterior para comparacao")
+    parser.add_argument('--sem-limite', action='store_true',
+                        help="bench: mede conversoes PDF/DOCX acima de 1000 documentos")
+    return parser
+
+def ler_opcoes_bench(parser, args, ats_benchmark):
+    """Converte --tamanhos e --etapas do bench; valores inválidos viram erro de uso."""
+    try:
+        args.tamanhos = (ats_benchmark.ler_tamanhos(args.tamanhos) if args.tamanhos
+                         else ats_benchmark.TAMANHOS_PADRAO)
+        args.etapas = ats_benchmark.ler_etapas(args.etapas) if args.etapas else ats_benchmark.ETAPAS
+    except (argparse.ArgumentTypeError, ValueError) as e:
+        parser.error(f"bench: {e}")
+
 def main():
+    parser = criar_parser()
+    args = parser.parse_args()
+
     print("Sistema ATS - Cara Core Informatica")
     print("=" * 50)
 
-    if len(sys.argv) > 1:
-        modo = sys.argv[1].lower()
+    ats_analyzer.configurar_cache(habilitado=not args.no_cache)
+    if args.no_cache:
+        print("Cache de extracao desativado (--no-cache)")
+
+    # Cada documento é carregado uma única vez durante a execução
+    corpus = corpus_ats.Corpus(workers=args.workers)
+
+    # Importa antes de ativar o trace, para que as funções do modo sejam medidas
+    modulos = importar_modulos(args.modo.lower() if args.modo else None)
+    if 'ats_benchmark' in modulos:
+        ler_opcoes_bench(parser, args, modulos['ats_benchmark'])
+
+    if args.trace:
+        ats_trace.ativar(args.trace)
+    try:
+        return executar_modo(args, corpus, modulos)
+    finally:
+        # Grava o trace mesmo se a execução for interrompida
+        ats_trace.finalizar()
+
+def criar_deduplicador(args):
+    """Deduplicador configurado em config.yaml (None com --sem-deduplicacao)."""
+    if args.sem_deduplicacao:
+        return None
+    from core import deduplicacao
+    return deduplicacao.carregar_deduplicador()
+
+def executar_modo(args, corpus, modulos):
+    """Executa o modo escolhido na linha de comando."""
+    if args.modo:
+        modo = args.modo.lower()
 
         if modo == "analise":
             print("MODO: Analise ATS apenas")
             print("Analisando curriculos e vagas...\n")
-            ats_analyzer.main()
+            ats_analyzer.main(args.workers, corpus, criar_deduplicador(args))
 
         elif modo == "organizado":
             print("MODO: Sistema Organizado por Vaga")
             print("Analisando estrutura organizada de vagas...\n")
-            organizer = ats_organizer.ATSOrganizer()
-            organizer.executar_analise_organizada()
+            ats_organizer = modulos['ats_organizer']
+            organizer = ats_organizer.ATSOrganizer(
+                args.pasta_vagas, workers=args.workers, corpus=corpus, deduplicador=criar_deduplicador(args),
+                arquivo_resultados=ats_organizer.caminho_resultados(args.formato), top=args.top)
+            # Resultados gravados em streaming, ao fim de cada vaga
+            organizer.executar_analise_organizada(incremental=args.incremental, exportar=True)
             organizer.gerar_relatorios_por_vaga()
-            organizer.exportar_resultados_csv()
 
         elif modo == "envio":
             print("MODO: Analise ATS + Envio de Emails")
             print("Executando analise e envio integrado...\n")
-            integracao = ats_email_integration.ATSEmailIntegration()
+            integracao = modulos['ats_email_integration'].ATSEmailIntegration(corpus=corpus)
             integracao.executar_fluxo_completo()
 
+        elif modo == "watch":
+            print("MODO: Monitoramento Continuo por Vaga")
+            print("Pontuando curriculos assim que chegam...\n")
+            ats_watch = modulos['ats_watch']
+            intervalo = ats_watch.INTERVALO_PADRAO if args.intervalo is None else args.intervalo
+            organizer = ats_watch.ats_organizer.ATSOrganizer(
+                args.pasta_vagas, workers=args.workers, corpus=corpus, deduplicador=criar_deduplicador(args))
+            ats_watch.MonitorVagas(organizer, intervalo=intervalo).executar()
+
+        elif modo == "bench":
+            print("MODO: Benchmark do Pipeline ATS\n")
+            ats_benchmark = modulos['ats_benchmark']
+            regressoes = ats_benchmark.executar_benchmark(
+                args.tamanhos, args.etapas, args.saida or ats_benchmark.ARQUIVO_SAIDA_PADRAO, args.baseline,
+                args.sem_limite, args.workers
+            )
+            # Código de saída 1 em caso de regressão (útil em CI)
+            return 1 if regressoes else 0
+
+        elif modo == "importtime":
+            print("MODO: Tempo de Importacao por Modo\n")
+            tempo_importacao = modulos['tempo_importacao']
+            regressoes = tempo_importacao.executar_relatorio(
+                os.path.dirname(os.path.abspath(__file__)),
+                args.saida or tempo_importacao.ARQUIVO_SAIDA_PADRAO, args.baseline
+            )
+            return 1 if regressoes else 0
+
+        elif modo == "exportar":
+            print("MODO: Exportacao do Log de Envios\n")
+            modulos['registro_envios'].exportar_registro()
+            return 0
+
         else:
             print("❌ Modo não reconhecido. Use:")
             print("   python main.py analise      # Analise basica")
             print("   python main.py organizado   # Sistema organizado por vaga")
             print("   python main.py envio        # Analise + envio integrado")
+            print("   python main.py watch        # Monitoramento continuo por vaga")
+            print("   python main.py bench        # Benchmarks do pipeline")
+            print("   python main.py importtime   # Tempo de importacao por modo")
+            print("   python main.py exportar     # Gera log/log_respostas.xlsx do registro de envios")
             return
     else:
         print("🔍 MODO PADRÃO: Análise ATS apenas")
         print("Analisando currículos e vagas...")
         print("Arquivos .docx e .pdf serão automaticamente convertidos para .txt\n")
 
-        ats_analyzer.main()
+        ats_analyzer.main(args.workers, corpus, criar_deduplicador(args))
 
     print("\n" + "=" * 50)
+    corpus.imprimir_estatisticas()
+    corpus.imprimir_memoria()
     print("Processo concluido!")
     print("Verifique se a pontuacao ATS atingiu 70% ou mais.")
     print("Siga as recomendacoes para otimizar seu curriculo.")
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
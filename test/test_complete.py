@@ -57,6 +57,8 @@ from pathlib import Path
 # Adicionar diretório pai ao path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from core import cache_planilhas
+
 class SendingCVTester:
     """Classe para testar todas as funcionalidades do Sending_CV."""
 
@@ -252,6 +254,1511 @@ class SendingCVTester:
         else:
             self.log_result("Conversão DOCX", "WARN", "nenhum arquivo DOCX encontrado")
 
+    def test_extraction_cache(self):
+        """Testa o cache de extração de documentos convertidos."""
+        print("\n[CACHE] Testando Cache de Extracao")
+        print("=" * 40)
+
+        try:
+            import tempfile
+            from core import ats_analyzer
+
+            pdf_files = [f for f in os.listdir('curriculos') if f.endswith('.pdf')] if os.path.exists('curriculos') else []
+            if not pdf_files:
+                self.log_result("Cache de extração", "WARN", "nenhum arquivo PDF encontrado em curriculos/")
+                return
+
+            with tempfile.TemporaryDirectory() as pasta_temp:
+                caminho_pdf = os.path.join(pasta_temp, 'curriculo_cache.pdf')
+                with open(os.path.join('curriculos', pdf_files[0]), 'rb') as origem, open(caminho_pdf, 'wb') as destino:
+                    destino.write(origem.read())
+
+                ats_analyzer.configurar_cache(pasta=os.path.join(pasta_temp, 'cache'))
+                cache = ats_analyzer.obter_cache()
+
+                texto_1, tokens_1 = ats_analyzer.carregar_documento(caminho_pdf)
+                texto_2, tokens_2 = ats_analyzer.carregar_documento(caminho_pdf)
+
+                ats_analyzer.configurar_cache()
+
+                # Dois processos (--workers 2) gravando no mesmo cache: o limite vale para o total
+                from core import cache_extracao
+                pasta_limite = os.path.join(pasta_temp, 'cache_limite')
+                caches = [cache_extracao.CacheExtracao(pasta_limite, tamanho_maximo_mb=0.1) for _ in range(2)]
+                for i in range(180):
+                    caches[i % 2].salvar(f"{i:064x}", 'x' * 1000, [], ats_analyzer.VERSAO_TOKENIZADOR)
+                tamanho_real = sum(tamanho for _, tamanho, _ in caches[0]._listar_entradas())
+                limite = caches[0].tamanho_maximo
+                limite_ok = tamanho_real <= limite * (1 + 2 / cache_extracao.FRACAO_RELEITURA)
+
+                if cache.acertos == 1 and texto_1 == texto_2 and tokens_1 == tokens_2 and limite_ok:
+                    self.log_result("Cache de extração", "PASS", f"{pdf_files[0]}: segunda leitura servida pelo cache; "
+                                    f"2 processos somam {tamanho_real} de {limite} bytes")
+                else:
+                    self.log_result("Cache de extração", "FAIL", f"acertos={cache.acertos}, falhas={cache.falhas}, "
+                                    f"tamanho com 2 processos={tamanho_real} de {limite}")
+
+        except Exception as e:
+            self.log_result("Cache de extração", "FAIL", f"erro: {e}")
+
+    def test_tokenizer(self):
+        """Testa se o tokenizador compilado reproduz o pipeline original."""
+        print("\n[TOKENIZADOR] Testando Tokenizador Compilado")
+        print("=" * 40)
+
+        try:
+            from core import ats_analyzer
+
+            amostras = [
+                "Desenvolvedor Python Sênior: experiência com APIs REST, Django e AWS (5+ anos).",
+                "ÁREA DE ATUAÇÃO — Gestão de Projetos; São Paulo/SP; inglês avançado",
+                "ΟΔΥΣΣΕΥΣ café naïve coöperate İstanbul straße 2025_v2",
+                "texto ascii puro com numeros 123 e_sublinhado"
+            ]
+            for pasta in ['curriculos', 'vagas']:
+                if os.path.exists(pasta):
+                    for arquivo in sorted(os.listdir(pasta)):
+                        if arquivo.endswith('.txt'):
+                            with open(os.path.join(pasta, arquivo), 'r', encoding='utf-8') as f:
+                                amostras.append(f.read())
+
+            divergentes = [a for a in amostras
+                           if ats_analyzer.tokenizar(a) != ats_analyzer.tokenizar_legado(a)
+                           or list(ats_analyzer.iterar_tokens(a)) != ats_analyzer.tokenizar_legado(a)]
+
+            if not divergentes:
+                self.log_result("Tokenizador compilado", "PASS", f"{len(amostras)} textos com tokens idênticos ao original")
+            else:
+                self.log_result("Tokenizador compilado", "FAIL", f"{len(divergentes)}/{len(amostras)} textos divergentes")
+
+        except Exception as e:
+            self.log_result("Tokenizador compilado", "FAIL", f"erro: {e}")
+
+    def test_score_matrix(self):
+        """Testa se a pontuação em lote coincide com o cálculo par a par."""
+        print("\n[MATRIZ] Testando Pontuacao em Lote")
+        print("=" * 40)
+
+        try:
+            from core import ats_analyzer, ats_matriz
+
+            documentos = []
+            for pasta in ['curriculos', 'vagas']:
+                if os.path.exists(pasta):
+                    for arquivo in sorted(os.listdir(pasta)):
+                        if arquivo.endswith('.txt'):
+                            with open(os.path.join(pasta, arquivo), 'r', encoding='utf-8') as f:
+                                documentos.append(ats_analyzer.tokenizar(f.read()))
+
+            if not documentos:
+                self.log_result("Pontuação em lote", "WARN", "nenhum documento .txt encontrado")
+                return
+
+            matriz = ats_matriz.score_matrix(documentos, documentos)
+            divergencias = 0
+            for i, tokens_curriculo in enumerate(documentos):
+                for j, tokens_vaga in enumerate(documentos):
+                    pontuacao, faltantes = ats_analyzer.analisar_compatibilidade(tokens_curriculo, tokens_vaga)
+                    if pontuacao != matriz.pontuacao(i, j) or faltantes != matriz.palavras_faltantes(i, j):
+                        divergencias += 1
+
+            total_pares = len(documentos) ** 2
+            if divergencias == 0:
+                self.log_result("Pontuação em lote", "PASS", f"{total_pares} pares idênticos ao cálculo par a par")
+            else:
+                self.log_result("Pontuação em lote", "FAIL", f"{divergencias}/{total_pares} pares divergentes")
+
+        except Exception as e:
+            self.log_result("Pontuação em lote", "FAIL", f"erro: {e}")
+
+    def test_inverted_index(self):
+        """Testa o índice invertido de vagas contra o cálculo por força bruta."""
+        print("\n[INDICE] Testando Indice Invertido de Vagas")
+        print("=" * 40)
+
+        try:
+            import shutil
+            import tempfile
+            from core import ats_analyzer, indice_vagas
+
+            arquivos_vaga = sorted(f for f in os.listdir('vagas') if f.endswith('.txt')) if os.path.exists('vagas') else []
+            arquivos_curriculo = sorted(f for f in os.listdir('curriculos') if f.endswith('.txt')) if os.path.exists('curriculos') else []
+            if not arquivos_vaga or not arquivos_curriculo:
+                self.log_result("Índice de vagas", "WARN", "vagas/ ou curriculos/ sem arquivos .txt")
+                return
+
+            curriculos = []
+            for arquivo in arquivos_curriculo:
+                with open(os.path.join('curriculos', arquivo), 'r', encoding='utf-8') as f:
+                    curriculos.append(ats_analyzer.tokenizar(f.read()))
+
+            def forca_bruta(pasta):
+                """Pontuação de cada currículo contra cada vaga da pasta, por analisar_compatibilidade."""
+                vagas = {}
+                for arquivo in sorted(os.listdir(pasta)):
+                    _, tokens = ats_analyzer.carregar_documento(os.path.join(pasta, arquivo))
+                    vagas[os.path.splitext(arquivo)[0]] = tokens
+                return [{nome: ats_analyzer.analisar_compatibilidade(tokens_cv, tokens)[0]
+                         for nome, tokens in vagas.items()} for tokens_cv in curriculos]
+
+            def ranking_indice(indice, k):
+                """Pontuações das k melhores vagas de cada currículo pelo índice."""
+                return [{nome: pontuacao for _, nome, pontuacao in indice.buscar(tokens_cv, k)}
+                        for tokens_cv in curriculos]
+
+            with tempfile.TemporaryDirectory() as pasta_temp:
+                pasta_vagas = os.path.join(pasta_temp, 'vagas')
+                os.makedirs(pasta_vagas)
+                for arquivo in arquivos_vaga:
+                    shutil.copy(os.path.join('vagas', arquivo), pasta_vagas)
+                arquivo_indice = os.path.join(pasta_temp, 'indice_vagas.json')
+
+                indice = indice_vagas.IndiceInvertido(arquivo_indice)
+                indice.atualizar(pasta_vagas)
+                k = min(2, len(arquivos_vaga))
+                esperado = [dict(sorted(pontuacoes.items(), key=lambda x: (-x[1], x[0]))[:k])
+                            for pontuacoes in forca_bruta(pasta_vagas)]
+                topk_ok = ranking_indice(indice, k) == esperado
+
+                # Vaga nova, vaga alterada e vaga removida
+                with open(os.path.join(pasta_vagas, 'vaga_nova_indice.txt'), 'w', encoding='utf-8') as f:
+                    f.write("Desenvolvedor Python com experiência em Django, APIs REST, SQL e Docker")
+                alterada = os.path.join(pasta_vagas, arquivos_vaga[0])
+                with open(alterada, 'a', encoding='utf-8') as f:
+                    f.write("\nKubernetes Terraform observabilidade")
+                os.utime(alterada, (os.path.getatime(alterada), os.path.getmtime(alterada) + 10))
+                removida = arquivos_vaga[-1] if len(arquivos_vaga) > 1 else None
+                if removida:
+                    os.remove(os.path.join(pasta_vagas, removida))
+
+                mudancas = indice_vagas.IndiceInvertido(arquivo_indice).atualizar(pasta_vagas)
+                indice = indice_vagas.IndiceInvertido(arquivo_indice)
+                total = indice.total_vagas
+                atualizado_ok = ranking_indice(indice, total) == forca_bruta(pasta_vagas)
+                removida_ok = removida is None or all(os.path.splitext(removida)[0] not in r
+                                                      for r in ranking_indice(indice, total))
+
+                # Currículo sem nenhum termo em comum: primeiras vagas do índice, pontuação zero
+                ids_indice = list(indice.ids_por_caminho.values())
+                sem_termos = indice.buscar(['termoinexistenteindice'], k=2)
+                sem_termos_ok = (ids_indice == sorted(ids_indice)
+                                 and [(i, p) for i, _, p in sem_termos] == [(i, 0.0) for i in ids_indice[:2]]
+                                 and len(indice.buscar([], k=total + 5)) == total)
+
+            if (topk_ok and atualizado_ok and removida_ok and sem_termos_ok
+                    and mudancas == (3 if removida else 2)):
+                self.log_result("Índice de vagas", "PASS",
+                                f"top {k} igual à força bruta para {len(curriculos)} currículo(s); "
+                                f"vaga nova, alterada e removida sincronizadas")
+            else:
+                self.log_result("Índice de vagas", "FAIL",
+                                f"top_k={topk_ok}, atualizado={atualizado_ok}, removida={removida_ok}, "
+                                f"sem termos em comum={sem_termos_ok}, mudancas={mudancas}")
+
+        except Exception as e:
+            self.log_result("Índice de vagas", "FAIL", f"erro: {e}")
+
+    def test_parallel_ingestion(self):
+        """Testa a ingestão com --workers: mesma saída e ordem da serial, falhas isoladas."""
+        print("\n[INGESTAO] Testando Ingestao Paralela")
+        print("=" * 40)
+
+        try:
+            import shutil
+            import tempfile
+            import contextlib
+            import time
+            import multiprocessing
+            from core import ats_analyzer, ingestao
+
+            def falhar(caminho):
+                raise RuntimeError("extrator com defeito")
+
+            def encerrar(caminho):
+                os._exit(1)
+
+            def encerrar_depois(caminho):
+                time.sleep(0.5)
+                os._exit(1)
+
+            def contar(caminho):
+                with open(contador, 'a', encoding='utf-8') as f:
+                    f.write(caminho + '\n')
+                return "python sql"
+
+            with tempfile.TemporaryDirectory() as pasta_temp:
+                # Cópia das amostras: a conversão grava .txt ao lado de PDF/DOCX
+                caminhos = []
+                for pasta in ['vagas', 'curriculos']:
+                    for raiz, _, arquivos in sorted(os.walk(pasta)) if os.path.exists(pasta) else []:
+                        for arquivo in sorted(arquivos):
+                            if arquivo.lower().endswith(('.txt', '.docx', '.pdf')):
+                                destino = os.path.join(pasta_temp, raiz, arquivo)
+                                os.makedirs(os.path.dirname(destino), exist_ok=True)
+                                shutil.copy(os.path.join(raiz, arquivo), destino)
+                                caminhos.append(destino)
+
+                corrompido = os.path.join(pasta_temp, 'corrompido.pdf')
+                with open(corrompido, 'wb') as f:
+                    f.write(b'%PDF-1.4\n' + os.urandom(2048))
+                com_defeito = os.path.join(pasta_temp, 'com_defeito.falha')
+                open(com_defeito, 'w').close()
+                caminhos[len(caminhos) // 2:len(caminhos) // 2] = [corrompido, com_defeito]
+
+                ats_analyzer.configurar_cache(habilitado=False)
+                ats_analyzer.EXTRATORES['.falha'] = ('teste', falhar)
+                ats_analyzer.EXTRATORES['.encerra'] = ('teste', encerrar)
+                ats_analyzer.EXTRATORES['.lento'] = ('teste', encerrar_depois)
+                ats_analyzer.EXTRATORES['.conta'] = ('teste', contar)
+                contador = os.path.join(pasta_temp, 'extracoes.log')
+                try:
+                    with open(os.devnull, 'w') as nulo, contextlib.redirect_stdout(nulo):
+                        serial = list(ingestao.carregar_documentos(caminhos, workers=1))
+                        paralelo = list(ingestao.carregar_documentos(caminhos, workers=2))
+
+                        # Processo que morre no meio do lote (extratores só chegam ao filho via fork)
+                        isolado_ok = None
+                        if multiprocessing.get_start_method() == 'fork':
+                            encerra = os.path.join(pasta_temp, 'encerra.encerra')
+                            open(encerra, 'w').close()
+                            com_queda = caminhos[:3] + [encerra] + caminhos[3:]
+                            # Janela mínima: documentos ainda são enviados ao pool depois da queda
+                            janela = ingestao.JANELA_POR_WORKER
+                            ingestao.JANELA_POR_WORKER = 1
+                            try:
+                                resultado_queda = list(ingestao.carregar_documentos(com_queda, workers=2))
+                            finally:
+                                ingestao.JANELA_POR_WORKER = janela
+                            isolado_ok = ([r[0] for r in resultado_queda] == com_queda
+                                          and resultado_queda[3][3] is not None
+                                          and resultado_queda[:3] + resultado_queda[4:] == serial)
+
+                            # Queda depois que os demais terminaram: eles não são extraídos de novo
+                            lento = os.path.join(pasta_temp, 'lento.lento')
+                            contados = [os.path.join(pasta_temp, f'cv{i}.conta') for i in range(6)]
+                            for caminho in [lento] + contados:
+                                open(caminho, 'w').close()
+                            resultado_lento = list(ingestao.carregar_documentos([lento] + contados, workers=2))
+                            with open(contador, 'r', encoding='utf-8') as f:
+                                extracoes = f.read().split()
+                            isolado_ok = (isolado_ok and resultado_lento[0][3] is not None
+                                          and all(r[2] for r in resultado_lento[1:])
+                                          and sorted(extracoes) == contados)
+                finally:
+                    for extensao in ('.falha', '.encerra', '.lento', '.conta'):
+                        del ats_analyzer.EXTRATORES[extensao]
+                    ats_analyzer.configurar_cache()
+
+            por_caminho = {r[0]: r for r in paralelo}
+            ordem_ok = [r[0] for r in paralelo] == caminhos and paralelo == serial
+            corrompido_ok = por_caminho[corrompido][1:] == ("", [], None)
+            erro_ok = (por_caminho[com_defeito][3] or '').startswith('RuntimeError')
+            validos = sum(1 for r in paralelo if r[2])
+
+            if ordem_ok and corrompido_ok and erro_ok and isolado_ok is not False:
+                detalhe = "processo encerrado refeito isolado" if isolado_ok else "queda de processo não testada (sem fork)"
+                self.log_result("Ingestão paralela", "PASS",
+                                f"{len(caminhos)} documentos ({validos} válidos) na mesma ordem da serial; "
+                                f"PDF corrompido e extrator com erro isolados; {detalhe}")
+            else:
+                self.log_result("Ingestão paralela", "FAIL",
+                                f"ordem={ordem_ok}, corrompido={corrompido_ok}, erro={erro_ok}, isolado={isolado_ok}")
+
+        except Exception as e:
+            self.log_result("Ingestão paralela", "FAIL", f"erro: {e}")
+
+    def test_corpus_load_once(self):
+        """Testa se o Corpus carrega cada documento uma única vez por execução."""
+        print("\n[CORPUS] Testando Carregamento Unico do Corpus")
+        print("=" * 40)
+
+        try:
+            import io
+            import tempfile
+            import contextlib
+            from core import ats_analyzer, corpus as corpus_ats
+
+            n_vagas, n_curriculos = 3, 4
+            with tempfile.TemporaryDirectory() as pasta_temp:
+                pasta_vagas = os.path.join(pasta_temp, 'vagas')
+                pasta_curriculos = os.path.join(pasta_temp, 'curriculos')
+                os.makedirs(pasta_vagas)
+                os.makedirs(pasta_curriculos)
+                for i in range(n_vagas):
+                    with open(os.path.join(pasta_vagas, f'vaga_{i}.txt'), 'w', encoding='utf-8') as f:
+                        f.write(f"Vaga {i}: desenvolvedor python django docker nivel{i}")
+                for i in range(n_curriculos):
+                    with open(os.path.join(pasta_curriculos, f'cv_{i}.txt'), 'w', encoding='utf-8') as f:
+                        f.write(f"Currículo {i}: python django experiência projeto{i}")
+
+                # Conta as leituras de disco feitas pelo carregamento
+                carregar_original = ats_analyzer.carregar_documento
+                leituras = []
+                def carregar_contando(caminho):
+                    leituras.append(caminho)
+                    return carregar_original(caminho)
+
+                corpus = corpus_ats.Corpus()
+                saida = io.StringIO()
+                ats_analyzer.carregar_documento = carregar_contando
+                try:
+                    with contextlib.redirect_stdout(saida):
+                        ats_analyzer.processar_arquivos(pasta_curriculos, pasta_vagas, corpus=corpus)
+                        primeira = corpus.estatisticas()
+                        # Segundo consumidor da mesma execução (ex.: organizador) reaproveita os documentos
+                        ats_analyzer.processar_arquivos(pasta_curriculos, pasta_vagas, corpus=corpus)
+                        corpus.imprimir_estatisticas()
+                finally:
+                    ats_analyzer.carregar_documento = carregar_original
+
+            total = n_vagas + n_curriculos
+            pares = saida.getvalue().count("Pontuacao ATS:")
+            if (len(leituras) == total and len(set(leituras)) == total
+                    and primeira == {'documentos': total, 'carregamentos': total, 'reutilizacoes': 0, 'erros': 0}
+                    and corpus.reutilizacoes == total and pares == 2 * n_vagas * n_curriculos
+                    and f"{total} documento(s) carregado(s), {total} carregamento(s) evitado(s)" in saida.getvalue()):
+                self.log_result("Corpus", "PASS",
+                                f"{n_vagas} vagas x {n_curriculos} currículos: {total} leituras para {pares} pares, "
+                                f"{corpus.reutilizacoes} carregamentos evitados")
+            else:
+                self.log_result("Corpus", "FAIL",
+                                f"leituras={len(leituras)}, primeira={primeira}, estatisticas={corpus.estatisticas()}, pares={pares}")
+
+        except Exception as e:
+            self.log_result("Corpus", "FAIL", f"erro: {e}")
+
+    def test_incremental_analysis(self):
+        """Testa a análise incremental do modo organizado contra uma análise completa."""
+        print("\n[INCREMENTAL] Testando Analise Incremental")
+        print("=" * 40)
+
+        try:
+            import io
+            import re
+            import shutil
+            import tempfile
+            import contextlib
+            from core import ats_organizer
+
+            if not os.path.exists('vagas'):
+                self.log_result("Análise incremental", "WARN", "pasta vagas/ não encontrada")
+                return
+
+            def executar(pasta_vagas, arquivo, incremental):
+                """Executa o organizador; retorna (reaproveitados, recalculados) e as linhas exportadas."""
+                saida = io.StringIO()
+                organizer = ats_organizer.ATSOrganizer(pasta_vagas, arquivo_resultados=arquivo)
+                with contextlib.redirect_stdout(saida):
+                    organizer.executar_analise_organizada(incremental=incremental, exportar=True)
+                contagem = re.search(r"(\d+) par\(es\) reaproveitado\(s\), (\d+) recalculado", saida.getvalue())
+                linhas = (pd.read_csv(arquivo).drop(columns=['data_analise'])
+                          .sort_values(['vaga', 'arquivo']).reset_index(drop=True))
+                return (tuple(map(int, contagem.groups())) if contagem else None), linhas
+
+            with tempfile.TemporaryDirectory() as pasta_temp:
+                pasta_vagas = os.path.join(pasta_temp, 'vagas')
+                shutil.copytree('vagas', pasta_vagas)
+                arquivo = os.path.join(pasta_temp, 'incremental.csv')
+                arquivo_completo = os.path.join(pasta_temp, 'completo.csv')
+
+                inicial, _ = executar(pasta_vagas, arquivo, True)
+                total = inicial[1] if inicial else 0
+
+                # Um currículo novo: só ele é calculado
+                pasta_python = os.path.join(pasta_vagas, 'desenvolvedor_python', 'curriculos')
+                with open(os.path.join(pasta_python, 'maria_incremental.txt'), 'w', encoding='utf-8') as f:
+                    f.write("Desenvolvedora Python com Django, Flask, APIs REST, PostgreSQL e Docker")
+                novo_cv, linhas_incremental = executar(pasta_vagas, arquivo, True)
+                _, linhas_completo = executar(pasta_vagas, arquivo_completo, False)
+
+                # Vaga alterada: todos os currículos dela são recalculados
+                vaga_python = os.path.join(pasta_vagas, 'desenvolvedor_python', 'vaga.txt')
+                with open(vaga_python, 'a', encoding='utf-8') as f:
+                    f.write("\nDesejável: Kubernetes e mensageria")
+                curriculos_python = len(os.listdir(pasta_python))
+                vaga_alterada, linhas_vaga = executar(pasta_vagas, arquivo, True)
+                _, linhas_vaga_completo = executar(pasta_vagas, arquivo_completo, False)
+
+            if (total > 0 and novo_cv == (total, 1) and linhas_incremental.equals(linhas_completo)
+                    and vaga_alterada == (total + 1 - curriculos_python, curriculos_python)
+                    and linhas_vaga.equals(linhas_vaga_completo)):
+                self.log_result("Análise incremental", "PASS",
+                                f"currículo novo: {novo_cv[0]} reaproveitados/{novo_cv[1]} recalculado; "
+                                f"vaga alterada: {vaga_alterada[1]} recalculados; CSV igual à análise completa")
+            else:
+                self.log_result("Análise incremental", "FAIL",
+                                f"inicial={inicial}, novo_cv={novo_cv}, vaga_alterada={vaga_alterada}, "
+                                f"csv_igual={linhas_incremental.equals(linhas_completo)}/{linhas_vaga.equals(linhas_vaga_completo)}")
+
+        except Exception as e:
+            self.log_result("Análise incremental", "FAIL", f"erro: {e}")
+
+    def test_compact_vocabulary(self):
+        """Testa os documentos em ids do vocabulário compartilhado."""
+        print("\n[VOCABULARIO] Testando Representacao Compacta em Ids")
+        print("=" * 40)
+
+        try:
+            from core import ats_analyzer, ats_matriz
+            from core import corpus as corpus_ats
+            from core import vocabulario
+
+            caminhos = [os.path.join(pasta, arquivo)
+                        for pasta in ['curriculos', 'vagas'] if os.path.exists(pasta)
+                        for arquivo in sorted(os.listdir(pasta)) if arquivo.endswith('.txt')]
+            if not caminhos:
+                self.log_result("Vocabulário compacto", "WARN", "nenhum documento .txt encontrado")
+                return
+
+            corpus = corpus_ats.Corpus(vocabulario=vocabulario.Vocabulario())
+            documentos = corpus.documentos(caminhos)
+            listas = [ats_analyzer.carregar_documento(caminho)[1] for caminho in caminhos]
+
+            tokens_iguais = all(documento.tokens == tokens for documento, tokens in zip(documentos, listas))
+            matriz_ids = ats_matriz.score_matrix(documentos, documentos)
+            matriz_tokens = ats_matriz.score_matrix(listas, listas)
+            pares_iguais = all(
+                matriz_ids.pontuacao(i, j) == matriz_tokens.pontuacao(i, j)
+                and matriz_ids.palavras_faltantes(i, j) == matriz_tokens.palavras_faltantes(i, j)
+                for i in range(len(documentos)) for j in range(len(documentos))
+            )
+            memoria = corpus.memoria()
+
+            if tokens_iguais and pares_iguais and memoria['bytes_por_documento'] < memoria['bytes_por_documento_lista_tokens']:
+                self.log_result("Vocabulário compacto", "PASS",
+                                f"{memoria['bytes_por_documento']:.0f} bytes/documento "
+                                f"(lista de tokens: {memoria['bytes_por_documento_lista_tokens']:.0f})")
+            else:
+                self.log_result("Vocabulário compacto", "FAIL",
+                                f"tokens iguais={tokens_iguais}, pontuações iguais={pares_iguais}, memória={memoria}")
+
+        except Exception as e:
+            self.log_result("Vocabulário compacto", "FAIL", f"erro: {e}")
+
+    def test_near_duplicates(self):
+        """Testa o agrupamento de currículos quase idênticos (MinHash/LSH)."""
+        print("\n[DUPLICATAS] Testando Deteccao de Quase Duplicatas")
+        print("=" * 40)
+
+        try:
+            import tempfile
+            from core import corpus as corpus_ats
+            from core import deduplicacao, vocabulario
+
+            arquivo_base = os.path.join('curriculos', 'joao_silva_ats.txt')
+            arquivo_outro = os.path.join('curriculos', 'exemplo_curriculo.txt')
+            if not (os.path.exists(arquivo_base) and os.path.exists(arquivo_outro)):
+                self.log_result("Quase duplicatas", "WARN", "currículos de exemplo não encontrados")
+                return
+
+            with open(arquivo_base, 'r', encoding='utf-8') as f:
+                texto = f.read()
+            with open(arquivo_outro, 'r', encoding='utf-8') as f:
+                texto_outro = f.read()
+
+            with tempfile.TemporaryDirectory() as pasta:
+                textos = {'a_original.txt': texto, 'b_copia.txt': texto,
+                          'c_editado.txt': texto + "\nDisponibilidade imediata", 'd_outro.txt': texto_outro}
+                caminhos = []
+                for nome, conteudo in textos.items():
+                    caminhos.append(os.path.join(pasta, nome))
+                    with open(caminhos[-1], 'w', encoding='utf-8') as f:
+                        f.write(conteudo)
+
+                corpus = corpus_ats.Corpus(vocabulario=vocabulario.Vocabulario())
+                documentos = corpus.documentos(caminhos)
+                agrupamento = deduplicacao.Deduplicador(0.9).agrupar(documentos)
+
+            esperado = [0, 0, 0, 3]
+            if agrupamento.representante == esperado and agrupamento.duplicatas == 2:
+                self.log_result("Quase duplicatas", "PASS",
+                                f"2 de 4 currículos agrupados (similaridade {agrupamento.similaridade[2]:.0%})")
+            else:
+                self.log_result("Quase duplicatas", "FAIL", f"representantes: {agrupamento.representante}")
+
+        except Exception as e:
+            self.log_result("Quase duplicatas", "FAIL", f"erro: {e}")
+
+    def test_watch_mode(self):
+        """Testa se o modo watch pontua apenas currículos novos."""
+        print("\n[WATCH] Testando Monitoramento de Vagas")
+        print("=" * 40)
+
+        try:
+            import tempfile
+            from core import ats_organizer, ats_watch
+
+            with tempfile.TemporaryDirectory() as pasta_temp:
+                pasta_curriculos = os.path.join(pasta_temp, 'vagas', 'teste', 'curriculos')
+                os.makedirs(pasta_curriculos)
+                with open(os.path.join(pasta_temp, 'vagas', 'teste', 'vaga.txt'), 'w', encoding='utf-8') as f:
+                    f.write("Desenvolvedor Python com experiência em Django e PostgreSQL")
+                with open(os.path.join(pasta_curriculos, 'antigo.txt'), 'w', encoding='utf-8') as f:
+                    f.write("Analista com experiência em Excel")
+
+                organizer = ats_organizer.ATSOrganizer(
+                    pasta_base=os.path.join(pasta_temp, 'vagas'),
+                    arquivo_resultados=os.path.join(pasta_temp, 'resultados.csv')
+                )
+                monitor = ats_watch.MonitorVagas(organizer, intervalo=0)
+                monitor.registrar_estado_atual()
+
+                with open(os.path.join(pasta_curriculos, 'novo.txt'), 'w', encoding='utf-8') as f:
+                    f.write("Desenvolvedor Python, Django e PostgreSQL")
+
+                # O arquivo novo é processado quando fica estável por uma verificação
+                pontuados = monitor.verificar() + monitor.verificar() + monitor.verificar()
+                resultados = pd.read_csv(organizer.arquivo_resultados)
+
+                if pontuados == 1 and list(resultados['arquivo']) == ['novo.txt']:
+                    self.log_result("Modo watch", "PASS", f"novo.txt pontuado com {resultados['pontuacao_ats'][0]}%")
+                else:
+                    self.log_result("Modo watch", "FAIL", f"{pontuados} currículo(s) pontuado(s)")
+
+        except Exception as e:
+            self.log_result("Modo watch", "FAIL", f"erro: {e}")
+
+    def test_benchmark_suite(self):
+        """Testa a suíte de benchmarks com poucos documentos."""
+        print("\n[BENCH] Testando Suite de Benchmarks")
+        print("=" * 40)
+
+        try:
+            import json
+            import tempfile
+            from core import ats_benchmark
+
+            with tempfile.TemporaryDirectory() as pasta_temp:
+                arquivo_saida = os.path.join(pasta_temp, 'benchmark.json')
+                regressoes = ats_benchmark.executar_benchmark(
+                    tamanhos=(10,), etapas=('tokenizar', 'converter_pdf_para_txt'),
+                    arquivo_saida=arquivo_saida, arquivo_baseline=None
+                )
+                with open(arquivo_saida, 'r', encoding='utf-8') as f:
+                    relatorio = json.load(f)
+
+            etapas = [r['etapa'] for r in relatorio['resultados']]
+            campos = {'throughput_docs_s', 'latencia_p50_ms', 'latencia_p95_ms', 'memoria_pico_mb'}
+
+            # Etapa ou tamanho inválido na linha de comando: erro de uso, sem traceback
+            uso_ok = True
+            for opcao, valor in (('--etapas', 'foo'), ('--tamanhos', '1x')):
+                processo = subprocess.run([sys.executable, 'main.py', 'bench', opcao, valor],
+                                          capture_output=True, text=True, timeout=60)
+                uso_ok = (uso_ok and processo.returncode == 2 and 'usage:' in processo.stderr
+                          and 'Traceback' not in processo.stderr)
+
+            if (not regressoes and etapas == ['tokenizar', 'converter_pdf_para_txt']
+                    and all(campos <= set(r) for r in relatorio['resultados']) and uso_ok):
+                self.log_result("Benchmark", "PASS", f"{len(etapas)} etapa(s) medida(s) e gravada(s) em JSON")
+            else:
+                self.log_result("Benchmark", "FAIL", f"etapas medidas: {etapas}, erro de uso={uso_ok}")
+
+        except Exception as e:
+            self.log_result("Benchmark", "FAIL", f"erro: {e}")
+
+    def test_corpus_generator(self):
+        """Testa se o gerador de corpus é reproduzível e controla a sobreposição."""
+        print("\n[CORPUS] Testando Gerador de Corpus Sintetico")
+        print("=" * 40)
+
+        try:
+            import tempfile
+            from core import ats_analyzer, gerador_corpus
+
+            formatos = {'txt': 1, 'docx': 1, 'pdf': 1}
+            with tempfile.TemporaryDirectory() as pasta_temp:
+                conteudos = []
+                for destino in ('a', 'b'):
+                    gerador_corpus.gerar_corpus(os.path.join(pasta_temp, destino), 2, 9, pesos_formatos=formatos)
+                    arquivos = {}
+                    for raiz, _, nomes in os.walk(os.path.join(pasta_temp, destino)):
+                        for nome in nomes:
+                            with open(os.path.join(raiz, nome), 'rb') as f:
+                                arquivos[os.path.relpath(os.path.join(raiz, nome), os.path.join(pasta_temp, destino))] = f.read()
+                    conteudos.append(arquivos)
+
+            extensoes = {os.path.splitext(nome)[1] for nome in conteudos[0]}
+            if conteudos[0] != conteudos[1] or not {'.txt', '.docx', '.pdf'} <= extensoes:
+                self.log_result("Gerador de corpus", "FAIL", "mesma semente gerou arquivos diferentes")
+                return
+
+            medias = []
+            for sobreposicao in (0.2, 0.9):
+                gerador = gerador_corpus.GeradorCorpus(sobreposicao=sobreposicao, variacao=0.05)
+                pontuacoes = []
+                for i in range(30):
+                    vaga, curriculo = gerador.curriculo_da_vaga(i, 3)
+                    pontuacao, _ = ats_analyzer.analisar_compatibilidade(
+                        ats_analyzer.tokenizar(curriculo['texto']), ats_analyzer.tokenizar(vaga['texto']))
+                    pontuacoes.append(pontuacao)
+                medias.append(sum(pontuacoes) / len(pontuacoes))
+
+            if medias[1] > medias[0]:
+                self.log_result("Gerador de corpus", "PASS",
+                                f"{len(conteudos[0])} arquivos reproduzíveis; média ATS {medias[0]:.1f}% → {medias[1]:.1f}%")
+            else:
+                self.log_result("Gerador de corpus", "FAIL", f"sobreposição sem efeito: {medias}")
+
+        except Exception as e:
+            self.log_result("Gerador de corpus", "FAIL", f"erro: {e}")
+
+    def test_run_trace(self):
+        """Testa o trace de tempos por etapa e por documento."""
+        print("\n[TRACE] Testando Trace de Execucao")
+        print("=" * 40)
+
+        try:
+            from core import ats_analyzer, ats_trace
+
+            arquivos = [os.path.join('curriculos', f) for f in sorted(os.listdir('curriculos'))
+                        if f.endswith('.txt')] if os.path.exists('curriculos') else []
+            if not arquivos:
+                self.log_result("Trace de execução", "WARN", "nenhum arquivo .txt encontrado em curriculos/")
+                return
+
+            ats_trace.ativar()
+            try:
+                for arquivo in arquivos:
+                    ats_analyzer.carregar_documento(arquivo)
+            finally:
+                relatorio = ats_trace.finalizar()
+
+            etapas = relatorio['etapas']
+            restaurado = not hasattr(ats_analyzer.tokenizar, 'etapa_trace')
+            if (etapas.get('carregar_documento', {}).get('chamadas') == len(arquivos)
+                    and 'tokenizar' in etapas and len(relatorio['documentos']) == len(arquivos) and restaurado):
+                self.log_result("Trace de execução", "PASS",
+                                f"{len(arquivos)} documento(s) medidos; mais lento: {relatorio['mais_lentos'][0]['documento']}")
+            else:
+                self.log_result("Trace de execução", "FAIL", f"etapas: {list(etapas)}, restaurado={restaurado}")
+
+        except Exception as e:
+            self.log_result("Trace de execução", "FAIL", f"erro: {e}")
+
+    def test_lazy_imports(self):
+        """Testa que main.py não importa dependências pesadas na partida."""
+        print("\n[IMPORTACAO] Testando Importacoes Sob Demanda")
+        print("=" * 40)
+
+        try:
+            pesadas = ['pandas', 'numpy', 'nltk', 'pdfplumber', 'docx', 'yagmail']
+            codigo = ("import sys, main; "
+                      f"print(','.join(m for m in {pesadas!r} if m in sys.modules))")
+            processo = subprocess.run([sys.executable, '-c', codigo], capture_output=True, text=True, timeout=60)
+            carregadas = processo.stdout.strip()
+
+            if processo.returncode != 0:
+                self.log_result("Importações sob demanda", "FAIL", processo.stderr.strip()[-200:])
+            elif carregadas:
+                self.log_result("Importações sob demanda", "FAIL", f"importadas na partida: {carregadas}")
+            else:
+                self.log_result("Importações sob demanda", "PASS", "pandas, numpy, nltk, pdfplumber, docx e yagmail não carregados")
+
+        except Exception as e:
+            self.log_result("Importações sob demanda", "FAIL", f"erro: {e}")
+
+    def test_async_outbox(self):
+        """Testa a caixa de saída assíncrona contra um servidor SMTP local (aiosmtpd)."""
+        print("\n[CAIXA DE SAIDA] Testando Envio Assincrono")
+        print("=" * 40)
+
+        try:
+            import time
+            import socket
+            from core import envio_assincrono
+
+            try:
+                from aiosmtpd.controller import Controller
+            except ImportError:
+                self.log_result("Caixa de saída assíncrona", "WARN", "aiosmtpd não instalado")
+                return
+
+            class Coletor:
+                def __init__(self):
+                    self.mensagens = []
+                    self.conexoes = set()
+
+                async def handle_DATA(self, server, session, envelope):
+                    self.mensagens.append(envelope.rcpt_tos[0])
+                    self.conexoes.add(session.peer)
+                    return '250 OK'
+
+            with socket.socket() as s:
+                s.bind(('127.0.0.1', 0))
+                porta = s.getsockname()[1]
+
+            coletor = Coletor()
+            controlador = Controller(coletor, hostname='127.0.0.1', port=porta)
+            controlador.start()
+            try:
+                conta = {'usuario': 'teste@localhost', 'senha_app': '',
+                         'servidor_smtp': '127.0.0.1', 'porta': porta}
+                resultados = []
+                caixa = envio_assincrono.CaixaSaida([conta], delay=0.2,
+                                                    ao_enviar=lambda contexto, erro: resultados.append(erro))
+                caixa.iniciar()
+
+                inicio = time.perf_counter()
+                for i in range(3):
+                    caixa.enfileirar(envio_assincrono.montar_mensagem(
+                        f"empresa{i}@localhost", "Candidatura", "Prezados,", ['curriculos/joao_silva.txt']))
+                tempo_enfileirar = time.perf_counter() - inicio
+                estatisticas = caixa.concluir()
+            finally:
+                controlador.stop()
+
+            if (len(coletor.mensagens) == 3 and len(coletor.conexoes) == 1 and estatisticas['conexoes'] == 1
+                    and resultados == [None] * 3 and estatisticas['duracao_s'] >= 0.4 and tempo_enfileirar < 0.2):
+                self.log_result("Caixa de saída assíncrona", "PASS",
+                                f"3 emails em 1 conexão, {estatisticas['duracao_s']:.2f}s com intervalo de 0.2s")
+            else:
+                self.log_result("Caixa de saída assíncrona", "FAIL",
+                                f"recebidos={len(coletor.mensagens)}, conexões={len(coletor.conexoes)}, {estatisticas}")
+
+        except Exception as e:
+            self.log_result("Caixa de saída assíncrona", "FAIL", f"erro: {e}")
+
+    def test_send_queue(self):
+        """Testa a fila de envio persistente (cota diária, horário e ordem por pontuação)."""
+        print("\n[FILA DE ENVIO] Testando Fila Persistente")
+        print("=" * 40)
+
+        try:
+            import tempfile
+            from datetime import datetime
+            from core import fila_envio
+
+            config = {'envio': {'max_envios_por_dia': 3, 'rajada_maxima': 2,
+                                'horario_funcionamento': {'inicio': '09:00', 'fim': '17:00'}}}
+            with tempfile.TemporaryDirectory() as pasta:
+                arquivo = os.path.join(pasta, 'fila.db')
+                fila = fila_envio.FilaEnvio(arquivo, config)
+                for email, pontuacao in [('a@x.com', 75), ('b@x.com', 90), ('c@x.com', 80), ('d@x.com', 95)]:
+                    fila.enfileirar(email, 'Dev', 'Empresa', pontuacao, 'Assunto', 'Corpo', None)
+                repetido = fila.enfileirar('a@x.com', 'Dev', 'Empresa', 75, 'Assunto', 'Corpo', None)
+
+                antes_expediente = fila.reservar(datetime(2025, 3, 10, 8, 0))
+                proximo_abertura = fila.proximo_envio(datetime(2025, 3, 10, 8, 0))
+                primeiros = fila.reservar(datetime(2025, 3, 10, 9, 0))
+                for item in primeiros:
+                    fila.registrar_envio(item['id'], agora=datetime(2025, 3, 10, 9, 0))
+                fila.fechar()
+
+                # Reinício: tokens e cota continuam valendo
+                fila = fila_envio.FilaEnvio(arquivo, config)
+                sem_token = fila.reservar(datetime(2025, 3, 10, 9, 30))
+                proximo_token = fila.proximo_envio(datetime(2025, 3, 10, 9, 30))
+                terceiro = fila.reservar(proximo_token)
+                for item in terceiro:
+                    fila.registrar_envio(item['id'], agora=proximo_token)
+                cota_esgotada = fila.reservar(datetime(2025, 3, 10, 16, 0))
+                proximo_dia = fila.proximo_envio(datetime(2025, 3, 10, 16, 0))
+                ultimo = fila.reservar(proximo_dia)
+                fila.fechar()
+
+            ordem = [item['email'] for item in primeiros + terceiro + ultimo]
+            if (not repetido and not antes_expediente and proximo_abertura == datetime(2025, 3, 10, 9, 0)
+                    and ordem == ['d@x.com', 'b@x.com', 'c@x.com', 'a@x.com']
+                    and not sem_token and proximo_token == datetime(2025, 3, 10, 11, 40)
+                    and not cota_esgotada and proximo_dia == datetime(2025, 3, 11, 9, 0)):
+                self.log_result("Fila de envio", "PASS", "cota, horário, ritmo e ordem por pontuação respeitados")
+            else:
+                self.log_result("Fila de envio", "FAIL",
+                                f"ordem={ordem}, próximo token={proximo_token}, próximo dia={proximo_dia}")
+
+        except Exception as e:
+            self.log_result("Fila de envio", "FAIL", f"erro: {e}")
+
+    def test_send_log(self):
+        """Testa o registro de envios em SQLite (importação, acréscimo, leitura concorrente e exportação)."""
+        print("\n[REGISTRO] Testando Registro de Envios")
+        print("=" * 40)
+
+        try:
+            import tempfile
+            from core import registro_envios
+
+            with tempfile.TemporaryDirectory() as pasta:
+                arquivo_excel = os.path.join(pasta, 'log_respostas.xlsx')
+                arquivo_registro = os.path.join(pasta, 'registro.db')
+                pd.DataFrame([
+                    {'Empresa': 'A', 'Vaga': 'Dev', 'Email': 'a@x.com', 'Data_Envio': '2025-07-10', 'Status': 'Enviado'},
+                    {'Empresa': 'B', 'Vaga': 'QA', 'Email': 'b@x.com', 'Data_Envio': '2025-07-11', 'Status': 'Sem Retorno'}
+                ]).to_excel(arquivo_excel, index=False)
+
+                registro = registro_envios.RegistroEnvios(arquivo_registro, arquivo_excel)
+                importados = len(registro)
+                registro.registrar({'Empresa': 'C', 'Vaga': 'Dev', 'Email': 'c@x.com',
+                                    'Data_Envio': datetime(2025, 7, 12, 9, 30), 'Status': 'Enviado',
+                                    'Numero_Followup': 0, 'Pontuacao_ATS': 82.5})
+
+                # Leitura por outra conexão com o registro ainda aberto para escrita
+                leitura = registro_envios.ler_dataframe(arquivo_registro)
+                ja_enviado = registro.ja_enviado('c@x.com', 'Dev') and not registro.ja_enviado('c@x.com', 'QA')
+                registro.exportar_excel(arquivo_excel)
+                registro.fechar()
+
+                exportado = pd.read_excel(arquivo_excel)
+                # Linha importada com data em texto, editada na planilha exportada
+                from openpyxl import load_workbook
+                livro = load_workbook(arquivo_excel)
+                livro.active.cell(row=2, column=registro_envios.COLUNAS.index('Status') + 1, value='Respondido')
+                livro.save(arquivo_excel)
+                reaberto = registro_envios.RegistroEnvios(arquivo_registro, arquivo_excel)
+                total_reaberto = len(reaberto)
+                status_reaberto = reaberto.registros()[0]['Status']
+                reaberto.fechar()
+
+                # Modo exportar: termina após a planilha, sem o resumo do corpus de análise
+                processo = subprocess.run([sys.executable, os.path.abspath('main.py'), 'exportar'], cwd=pasta,
+                                          capture_output=True, text=True, timeout=60)
+                cli_ok = (processo.returncode == 0 and 'Log exportado' in processo.stdout
+                          and 'Verifique se a pontuacao' not in processo.stdout)
+
+            if (importados == 2 and len(leitura) == 3 and ja_enviado and total_reaberto == 3
+                    and status_reaberto == 'Respondido' and cli_ok
+                    and list(exportado.columns) == list(registro_envios.COLUNAS)
+                    and exportado['Data_Envio'].iloc[2] == pd.Timestamp(2025, 7, 12, 9, 30)):
+                self.log_result("Registro de envios", "PASS", "planilha importada, 1 acréscimo e exportação com 3 linhas")
+            else:
+                self.log_result("Registro de envios", "FAIL",
+                                f"importados={importados}, lidos={len(leitura)}, reaberto={total_reaberto}, "
+                                f"modo exportar={cli_ok}")
+
+        except Exception as e:
+            self.log_result("Registro de envios", "FAIL", f"erro: {e}")
+
+    def test_send_log_edits(self):
+        """Testa as edições feitas à mão na planilha exportada do registro de envios."""
+        print("\n[REGISTRO] Testando Edicoes na Planilha de Log")
+        print("=" * 40)
+
+        try:
+            import tempfile
+            from openpyxl import load_workbook
+            from core import painel_envios
+            from core import registro_envios
+
+            with tempfile.TemporaryDirectory() as pasta:
+                arquivo_excel = os.path.join(pasta, 'log_respostas.xlsx')
+                arquivo_registro = os.path.join(pasta, 'registro.db')
+                registro = registro_envios.RegistroEnvios(arquivo_registro, None)
+                for i in range(4):
+                    registro.registrar({'Empresa': f"E{i}", 'Vaga': 'Dev', 'Email': f"rh{i}@x.com",
+                                        'Data_Envio': datetime(2025, 7, 10 + i, 9, 30), 'Status': 'Enviado',
+                                        'Numero_Followup': 0, 'Pontuacao_ATS': 80.0})
+                registro.exportar_excel(arquivo_excel)
+                registro.fechar()
+
+                painel = painel_envios.PainelEnvios(arquivo_registro)
+                painel.atualizar()
+
+                # Edição à mão: Status e follow-up de duas linhas
+                livro = load_workbook(arquivo_excel)
+                planilha = livro.active
+                datas_excel = all(isinstance(planilha.cell(row=i, column=4).value, datetime) for i in range(2, 6))
+                colunas = {celula.value: celula.column for celula in planilha[1]}
+                planilha.cell(row=2, column=colunas['Status'], value='Entrevista')
+                planilha.cell(row=4, column=colunas['Status'], value='Sem Retorno')
+                planilha.cell(row=4, column=colunas['Numero_Followup'], value=1)
+                livro.save(arquivo_excel)
+
+                # Reabrir o registro aplica as edições; um envio novo e a exportação as preservam
+                registro = registro_envios.RegistroEnvios(arquivo_registro, arquivo_excel)
+                registro.registrar({'Empresa': 'E9', 'Vaga': 'QA', 'Email': 'rh9@x.com',
+                                    'Data_Envio': datetime(2025, 7, 20, 8, 0), 'Status': 'Enviado'})
+                registro.exportar_excel(arquivo_excel)
+                status = [r['Status'] for r in registro.registros()]
+                followup = registro.registros()[2]['Numero_Followup']
+                registro.fechar()
+                exportado = pd.read_excel(arquivo_excel)
+
+                painel.atualizar()
+                novo_painel = painel_envios.PainelEnvios(arquivo_registro)
+                novo_painel.atualizar()
+
+            esperado = {'Enviado': 3, 'Entrevista': 1, 'Sem Retorno': 1}
+            if (datas_excel and status == ['Entrevista', 'Enviado', 'Sem Retorno', 'Enviado', 'Enviado']
+                    and followup == 1 and list(exportado['Status']) == status
+                    and dict(painel.por_status) == esperado and dict(novo_painel.por_status) == esperado
+                    and painel.total == 5):
+                self.log_result("Edições na planilha de log", "PASS",
+                                "datas exportadas como datas; 2 edições aplicadas ao registro e ao painel")
+            else:
+                self.log_result("Edições na planilha de log", "FAIL",
+                                f"datas={datas_excel}, status={status}, painel={dict(painel.por_status)}, "
+                                f"novo_painel={dict(novo_painel.por_status)}")
+
+        except Exception as e:
+            self.log_result("Edições na planilha de log", "FAIL", f"erro: {e}")
+
+    def test_sent_index(self):
+        """Testa o índice de pares já enviados (conjunto exato e filtro de Bloom)."""
+        print("\n[ENVIADOS] Testando Indice de Enviados")
+        print("=" * 40)
+
+        try:
+            import tempfile
+            from core import indice_enviados
+            from core import registro_envios
+
+            enviados = [(f"rh{i}@empresa{i % 97}.com", f"Vaga {i % 13}") for i in range(5000)]
+            ausentes = [(f"rh{i}@outra.com", "Vaga 0") for i in range(5000)]
+            exato = indice_enviados.IndiceEnviados(enviados)
+            exato.adicionar('novo@empresa.com', 'Vaga 1')
+            bloom = indice_enviados.IndiceEnviados(enviados, confirmar=lambda email, vaga: (email, vaga) in exato,
+                                                   filtro_bloom=True)
+            bloom.adicionar('novo@empresa.com', 'Vaga 1')
+
+            sem_falsos_negativos = all(par in bloom for par in enviados) and ('novo@empresa.com', 'Vaga 1') in bloom
+            falsos_positivos = sum(1 for par in ausentes if indice_enviados._chave(*par) in bloom.filtro)
+            respostas_ausentes = any(par in bloom or par in exato for par in ausentes)
+
+            # Registro: índice carregado na primeira consulta e atualizado a cada envio
+            with tempfile.TemporaryDirectory() as pasta:
+                registro = registro_envios.RegistroEnvios(os.path.join(pasta, 'registro.db'), None)
+                antes = registro.ja_enviado('c@x.com', 'Dev')
+                registro.registrar({'Empresa': 'C', 'Vaga': 'Dev', 'Email': 'c@x.com'})
+                depois = registro.ja_enviado('c@x.com', 'Dev')
+                registro.fechar()
+
+                # Conjunto exato: registro e consultas sem carregar o numpy
+                codigo = ("import sys; from core import registro_envios; "
+                          f"r = registro_envios.RegistroEnvios({os.path.join(pasta, 'registro.db')!r}, None); "
+                          "r.ja_enviado('c@x.com', 'Dev'); r.fechar(); print('numpy' in sys.modules)")
+                processo = subprocess.run([sys.executable, '-c', codigo], capture_output=True, text=True, timeout=60)
+                sem_numpy = processo.stdout.strip() == 'False'
+
+            if (sem_falsos_negativos and not respostas_ausentes and falsos_positivos < len(ausentes) * 0.03
+                    and bloom.usa_filtro_bloom and not antes and depois and sem_numpy):
+                self.log_result("Índice de enviados", "PASS",
+                                f"Bloom com {bloom.filtro.bytes} bytes para 5000 pares, "
+                                f"{falsos_positivos} falso(s) positivo(s) em {len(ausentes)} descartado(s) pela confirmação")
+            else:
+                self.log_result("Índice de enviados", "FAIL",
+                                f"falsos positivos={falsos_positivos}, antes={antes}, depois={depois}, "
+                                f"sem numpy={sem_numpy}")
+
+        except Exception as e:
+            self.log_result("Índice de enviados", "FAIL", f"erro: {e}")
+
+    def test_company_matcher(self):
+        """Testa o casador de vagas × empresas (Aho-Corasick) contra str.contains."""
+        print("\n[EMPRESAS] Testando Casador de Empresas")
+        print("=" * 40)
+
+        try:
+            import random
+            from core import casador_empresas
+
+            gerador = random.Random(7)
+            cargos = ['Python Developer', 'Desenvolvedor Python Pleno', 'Dev Fullstack', 'Engenheiro C++',
+                      'Analista de Dados', 'Cientista de Dados Sênior', 'DevOps', 'QA']
+            df = pd.DataFrame({
+                'Empresa': [f"Empresa {i}" for i in range(3000)],
+                'Vaga': [gerador.choice(cargos) if i % 50 else None for i in range(3000)],
+                'Email': [f"rh{i}@empresa.com" for i in range(3000)]
+            })
+            nomes = ['python', 'Python Developer', 'dev', 'DADOS', 'c++', 'Sênior', 'inexistente']
+
+            correspondencias = casador_empresas.CasadorEmpresas.de_dataframe(df).casar(nomes)
+            esperado = {nome: df.index[df['Vaga'].str.contains(nome, case=False, regex=False, na=False)].tolist()
+                        for nome in nomes}
+
+            if correspondencias == esperado:
+                self.log_result("Casador de empresas", "PASS",
+                                f"{len(nomes)} vagas casadas com 3000 empresas em uma passada (igual a str.contains)")
+            else:
+                diferentes = [nome for nome in nomes if correspondencias.get(nome) != esperado[nome]]
+                self.log_result("Casador de empresas", "FAIL", f"resultado diferente para: {diferentes}")
+
+        except Exception as e:
+            self.log_result("Casador de empresas", "FAIL", f"erro: {e}")
+
+    def test_spreadsheet_snapshot(self):
+        """Testa o snapshot das planilhas Excel (igual ao read_excel, reaproveitado e reconstruído)."""
+        print("\n[PLANILHAS] Testando Snapshot das Planilhas")
+        print("=" * 40)
+
+        try:
+            import time
+            import shutil
+            import tempfile
+
+            with tempfile.TemporaryDirectory() as pasta:
+                planilha = os.path.join(pasta, 'empresas.xlsx')
+                shutil.copy('empresas.xlsx', planilha)
+
+                primeira = cache_planilhas.ler_excel(planilha)
+                arquivo_snapshot, arquivo_metadados = cache_planilhas.caminhos_snapshot(
+                    planilha, cache_planilhas.formato_disponivel()[1])
+                gravado = os.path.getmtime(arquivo_snapshot)
+
+                # Data alterada sem mudança de conteúdo: snapshot reaproveitado
+                time.sleep(0.01)
+                os.utime(planilha)
+                reaproveitada = cache_planilhas.ler_excel(planilha)
+                reaproveitado = os.path.getmtime(arquivo_snapshot) == gravado
+
+                # Conteúdo alterado: snapshot reconstruído
+                pd.concat([primeira, primeira.head(1)]).to_excel(planilha, index=False)
+                alterada = cache_planilhas.ler_excel(planilha)
+
+                # Cabeçalhos repetidos e vazios: mesmos nomes do read_excel
+                from openpyxl import Workbook
+                repetidos = os.path.join(pasta, 'repetidos.xlsx')
+                livro = Workbook()
+                livro.active.append(['Email', 'Email', 'Email.1', None, 'Email'])
+                livro.active.append(['a@x.com', 'b@x.com', 'c@x.com', 1, 'd@x.com'])
+                livro.save(repetidos)
+                pd.testing.assert_frame_equal(cache_planilhas.ler_excel(repetidos), pd.read_excel(repetidos))
+                arquivos_temp = sorted(os.listdir(pasta))
+
+            pd.testing.assert_frame_equal(primeira, pd.read_excel('empresas.xlsx'))
+            pd.testing.assert_frame_equal(reaproveitada, primeira)
+            # Snapshots só ao lado das cópias temporárias, nunca na raiz do projeto
+            na_raiz = [f for f in os.listdir('.') if f.startswith('.empresas.xlsx.snapshot')]
+            if reaproveitado and len(alterada) == len(primeira) + 1 and not na_raiz and len(arquivos_temp) == 6:
+                self.log_result("Snapshot de planilhas", "PASS",
+                                f"snapshot {cache_planilhas.formato_disponivel()[0]} igual ao read_excel "
+                                f"(inclusive cabeçalhos repetidos) e reconstruído após alteração")
+            else:
+                self.log_result("Snapshot de planilhas", "FAIL",
+                                f"reaproveitado={reaproveitado}, linhas após alteração={len(alterada)}, "
+                                f"snapshots na raiz={na_raiz}")
+
+        except Exception as e:
+            self.log_result("Snapshot de planilhas", "FAIL", f"erro: {e}")
+
+    def test_dashboard_rollups(self):
+        """Testa os agregados incrementais e a paginação do painel do dashboard."""
+        print("\n[PAINEL] Testando Agregados e Paginacao do Dashboard")
+        print("=" * 40)
+
+        try:
+            import tempfile
+            from core import painel_envios
+            from core import registro_envios
+
+            status = ['Enviado', 'Sem Retorno', 'Respondido', 'Entrevista']
+            df_empresas = pd.DataFrame({'Empresa': [f"E{i}" for i in range(300)],
+                                        'Email': [f"rh{i}@x.com" for i in range(300)]})
+
+            with tempfile.TemporaryDirectory() as pasta:
+                arquivo = os.path.join(pasta, 'registro.db')
+                registro = registro_envios.RegistroEnvios(arquivo, None)
+                for i in range(500):
+                    registro.registrar({'Empresa': f"E{i % 250}", 'Email': f"rh{i % 250}@x.com", 'Vaga': 'Dev',
+                                        'Status': status[i % 4], 'Data_Envio': f"2025-07-{1 + i % 20:02d} 10:00:00"})
+
+                painel = painel_envios.PainelEnvios(arquivo, df_empresas)
+                lidos = painel.carregar()
+
+                # Novos envios: só o delta é lido
+                for i in range(500, 520):
+                    registro.registrar({'Empresa': f"E{i % 290}", 'Email': f"rh{i % 290}@x.com", 'Vaga': 'Dev',
+                                        'Status': 'Enviado', 'Data_Envio': '2025-08-01 09:00:00'})
+                delta = painel.carregar()
+
+                df_log = registro.dataframe()
+                pagina = painel.pagina_log('Respondido', pagina=2, tamanho=10)
+                pendentes = painel.pagina_pendentes(pagina=1, tamanho=1000)
+                registro.fechar()
+
+            esperado_pagina = df_log[df_log['Status'] == 'Respondido'].iloc[::-1].iloc[10:20].reset_index(drop=True)
+            esperado_pendentes = df_empresas[~df_empresas['Email'].isin(df_log['Email'])]
+            dias, envios = painel.envios_por_dia()
+            por_dia = df_log['Data_Envio'].str[:10].value_counts().sort_index()
+
+            if (lidos == 500 and delta == 20 and painel.total == len(df_log)
+                    and dict(painel.por_status) == df_log['Status'].value_counts().to_dict()
+                    and dias == por_dia.index.tolist() and envios == por_dia.tolist()
+                    and pagina.equals(esperado_pagina) and pendentes.equals(esperado_pendentes)):
+                self.log_result("Agregados do dashboard", "PASS",
+                                f"500 + {delta} registros agregados, páginas e {len(pendentes)} pendentes conferem")
+            else:
+                self.log_result("Agregados do dashboard", "FAIL",
+                                f"lidos={lidos}, delta={delta}, pendentes={len(pendentes)}/{len(esperado_pendentes)}")
+
+        except Exception as e:
+            self.log_result("Agregados do dashboard", "FAIL", f"erro: {e}")
+
+    def test_dashboard_live_refresh(self):
+        """Testa a atualização ao vivo do painel durante um envio em andamento."""
+        print("\n[PAINEL] Testando Atualizacao ao Vivo do Dashboard")
+        print("=" * 40)
+
+        try:
+            import tempfile
+            import threading
+            from core import painel_envios
+            from core import registro_envios
+
+            with tempfile.TemporaryDirectory() as pasta:
+                arquivo = os.path.join(pasta, 'registro.db')
+                arquivo_empresas = os.path.join(pasta, 'empresas.xlsx')
+                pd.DataFrame({'Empresa': [f"E{i}" for i in range(100)],
+                              'Email': [f"rh{i}@x.com" for i in range(100)]}).to_excel(arquivo_empresas, index=False)
+
+                registro = registro_envios.RegistroEnvios(arquivo, None)
+                painel = painel_envios.PainelEnvios(arquivo, arquivo_empresas=arquivo_empresas)
+                painel.atualizar()
+                df_inicial = painel.df_empresas
+
+                # Modo envio gravando enquanto o dashboard acompanha o registro
+                def enviar():
+                    for i in range(300):
+                        registro.registrar({'Empresa': f"E{i % 120}", 'Email': f"rh{i % 120}@x.com", 'Vaga': 'Dev',
+                                            'Status': 'Enviado', 'Data_Envio': '2025-08-01 09:00:00'})
+
+                envio = threading.Thread(target=enviar)
+                envio.start()
+                lidos = []
+                while envio.is_alive():
+                    lidos.append(painel.atualizar())
+                envio.join()
+                lidos.append(painel.atualizar())
+                sem_mudanca = painel.df_empresas is df_inicial
+
+                # Planilha de empresas alterada: relida e pendentes recalculados
+                pd.DataFrame({'Empresa': [f"E{i}" for i in range(150)],
+                              'Email': [f"rh{i}@x.com" for i in range(150)]}).to_excel(arquivo_empresas, index=False)
+                painel.atualizar()
+                registro.fechar()
+
+            if (sum(lidos) == 300 and painel.total == 300 and painel.por_status['Enviado'] == 300
+                    and sem_mudanca and len(painel.df_empresas) == 150 and painel.total_pendentes == 30):
+                self.log_result("Atualização ao vivo do dashboard", "PASS",
+                                f"300 envios acompanhados em {len(lidos)} atualizações, empresas relidas só após mudança")
+            else:
+                self.log_result("Atualização ao vivo do dashboard", "FAIL",
+                                f"lidos={sum(lidos)}, total={painel.total}, empresas={len(painel.df_empresas)}, "
+                                f"pendentes={painel.total_pendentes}")
+
+        except Exception as e:
+            self.log_result("Atualização ao vivo do dashboard", "FAIL", f"erro: {e}")
+
+    def test_streaming_export(self):
+        """Testa a exportação em streaming dos resultados (CSV, Parquet e XLSX)."""
+        print("\n[EXPORTACAO] Testando Exportacao em Streaming")
+        print("=" * 40)
+
+        try:
+            import tempfile
+            import contextlib
+            import tracemalloc
+            from core import ats_organizer, exportacao_resultados
+
+            vagas = {'dev[python]': "Desenvolvedor Python com Django e PostgreSQL",
+                     'analista_de_dados_senior_com_power_bi': "Analista de dados com SQL, Python e Power BI"}
+            with tempfile.TemporaryDirectory() as pasta_temp:
+                for nome, descricao in vagas.items():
+                    pasta_curriculos = os.path.join(pasta_temp, 'vagas', nome, 'curriculos')
+                    os.makedirs(pasta_curriculos)
+                    with open(os.path.join(pasta_temp, 'vagas', nome, 'vaga.txt'), 'w', encoding='utf-8') as f:
+                        f.write(descricao)
+                    for i in range(3):
+                        with open(os.path.join(pasta_curriculos, f"cv{i}.txt"), 'w', encoding='utf-8') as f:
+                            f.write(f"Profissional {i} com Python, SQL e {'Django' if i else 'Excel'}")
+
+                arquivo_xlsx = os.path.join(pasta_temp, 'resultados.xlsx')
+                organizer = ats_organizer.ATSOrganizer(
+                    pasta_base=os.path.join(pasta_temp, 'vagas'), arquivo_resultados=arquivo_xlsx
+                )
+                with open(os.devnull, 'w', encoding='utf-8') as nulo, contextlib.redirect_stdout(nulo):
+                    organizer.executar_analise_organizada(exportar=True)
+                    organizer.exportar_resultados(os.path.join(pasta_temp, 'resultados.csv'))
+                    # Nome anterior do método, mantido para chamadas externas
+                    organizer.exportar_resultados_csv(os.path.join(pasta_temp, 'compatibilidade.csv'))
+                    # Sem pyarrow, o Parquet é exportado em CSV com o mesmo nome
+                    organizer.exportar_resultados(os.path.join(pasta_temp, 'parquet.parquet'))
+
+                abas = pd.read_excel(arquivo_xlsx, sheet_name=None)
+                df_csv = pd.read_csv(os.path.join(pasta_temp, 'resultados.csv'))
+                df_compatibilidade = pd.read_csv(os.path.join(pasta_temp, 'compatibilidade.csv'))
+                parquet = {f for f in os.listdir(pasta_temp) if f.startswith('parquet.')}
+                temporarios = [f for f in os.listdir(pasta_temp) if f.endswith('.tmp')]
+
+                # Memória da exportação independente da quantidade de linhas
+                linha = df_csv.iloc[0].to_dict()
+                tracemalloc.start()
+                with exportacao_resultados.EscritorCSV(os.path.join(pasta_temp, 'grande.csv')) as escritor:
+                    escritor.escrever_vaga('grande', (dict(linha, curriculo=f"cv{i}") for i in range(200_000)))
+                pico = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+
+            colunas = ['vaga', 'arquivo', 'pontuacao_ats', 'aprovado']
+            df_xlsx = pd.concat(abas.values(), ignore_index=True)
+            # O Excel guarda pontuações inteiras (50.0) como inteiros
+            df_xlsx['pontuacao_ats'] = df_xlsx['pontuacao_ats'].astype(float)
+            if (sorted(abas) == ['analista_de_dados_senior_com_po', 'dev_python_']
+                    and df_xlsx.sort_values(colunas)[colunas].reset_index(drop=True)
+                    .equals(df_csv.sort_values(colunas)[colunas].reset_index(drop=True))
+                    and len(df_csv) == 6 and df_compatibilidade.equals(df_csv)
+                    and len(parquet) == 1 and not temporarios
+                    and escritor.linhas == 200_000 and pico < 1_000_000):
+                self.log_result("Exportação em streaming", "PASS",
+                                f"XLSX com {len(abas)} abas = CSV; 200.000 linhas com pico de {pico / 1024:.0f} KB")
+            else:
+                self.log_result("Exportação em streaming", "FAIL",
+                                f"abas={sorted(abas)}, linhas={len(df_csv)}, pico={pico}, temporarios={temporarios}")
+
+        except Exception as e:
+            self.log_result("Exportação em streaming", "FAIL", f"erro: {e}")
+
+    def test_compact_results(self):
+        """Testa os resultados compactos do sistema organizado e os detalhes em disco."""
+        print("\n[COMPACTO] Testando Resultados Compactos")
+        print("=" * 40)
+
+        try:
+            import json
+            import tempfile
+            import contextlib
+            from core import ats_organizer, resultados_compactos
+
+            termos = ("python django flask postgresql docker kubernetes aws terraform redis kafka "
+                      "graphql celery pytest linux nginx rabbitmq elasticsearch grafana").split()
+            with tempfile.TemporaryDirectory() as pasta_temp:
+                for v in range(2):
+                    pasta_curriculos = os.path.join(pasta_temp, 'vagas', f"vaga{v}", 'curriculos')
+                    os.makedirs(pasta_curriculos)
+                    with open(os.path.join(pasta_temp, 'vagas', f"vaga{v}", 'vaga.txt'), 'w', encoding='utf-8') as f:
+                        f.write("Desenvolvedor backend com " + ", ".join(termos[v:]))
+                    for i in range(4):
+                        with open(os.path.join(pasta_curriculos, f"cv{i}.txt"), 'w', encoding='utf-8') as f:
+                            f.write("Experiência com " + ", ".join(termos[i * 3:i * 3 + 4]))
+
+                execucoes = {}
+                for em_disco in (False, True):
+                    organizer = ats_organizer.ATSOrganizer(
+                        pasta_base=os.path.join(pasta_temp, 'vagas'), detalhes_em_disco=em_disco,
+                        arquivo_resultados=os.path.join(pasta_temp, f"resultados_{em_disco}.csv")
+                    )
+                    with open(os.devnull, 'w', encoding='utf-8') as nulo, contextlib.redirect_stdout(nulo):
+                        organizer.executar_analise_organizada(exportar=True)
+                        organizer.gerar_relatorios_por_vaga()
+                    execucoes[em_disco] = organizer
+
+                compacto, em_disco = execucoes[False], execucoes[True]
+                resultados = [c for r in em_disco.resultados_por_vaga.values() for c in r['curriculos']]
+                chaves = [(vaga, c.arquivo) for vaga, r in em_disco.resultados_por_vaga.items() for c in r['curriculos']]
+                arquivo_detalhes = resultados_compactos.caminho_detalhes(os.path.join(pasta_temp, 'resultados_True.csv'))
+                with open(arquivo_detalhes, 'r', encoding='utf-8') as f:
+                    por_chave = {(d['vaga'], d['arquivo']): d for d in map(json.loads, f)}
+                detalhes = [por_chave[chave] for chave in chaves]
+                df_memoria = pd.read_csv(os.path.join(pasta_temp, 'resultados_False.csv'))
+                df_disco = pd.read_csv(os.path.join(pasta_temp, 'resultados_True.csv'))
+                curriculos_em_memoria = len(em_disco.corpus)
+
+                # Incremental: currículos reaproveitados continuam no arquivo de detalhes
+                def incremental(nome, detalhes_em_disco):
+                    """Executa o organizador incremental e lê o arquivo de detalhes por (vaga, arquivo)."""
+                    arquivo = os.path.join(pasta_temp, f"{nome}.csv")
+                    organizer = ats_organizer.ATSOrganizer(pasta_base=os.path.join(pasta_temp, 'vagas'),
+                                                           detalhes_em_disco=detalhes_em_disco,
+                                                           arquivo_resultados=arquivo)
+                    with open(os.devnull, 'w', encoding='utf-8') as nulo, contextlib.redirect_stdout(nulo):
+                        organizer.executar_analise_organizada(incremental=True, exportar=True)
+                    if not detalhes_em_disco:
+                        return None
+                    with open(resultados_compactos.caminho_detalhes(arquivo), 'r', encoding='utf-8') as f:
+                        return {(d['vaga'], d['arquivo']): d for d in map(json.loads, f)}
+
+                inicial = incremental('incremental', True)
+                # Execução anterior sem detalhes: os reaproveitados saem só com as primeiras palavras
+                incremental('sem_detalhes', False)
+                parciais = incremental('sem_detalhes', True)
+                with open(os.path.join(pasta_temp, 'vagas', 'vaga0', 'curriculos', 'cv_novo.txt'), 'w',
+                          encoding='utf-8') as f:
+                    f.write("Experiência com python django redis kafka")
+                completos = incremental('incremental', True)
+
+            detalhes_incremental_ok = (
+                len(inicial) == 8 and len(completos) == 9 and ('vaga0', 'cv_novo.txt') in completos
+                and all(completos[chave] == d for chave, d in inicial.items())
+                and all(len(d['palavras_faltantes']) == d['total_faltantes'] for d in completos.values())
+                and parciais.keys() == inicial.keys()
+                and all(parciais[chave]['total_faltantes'] == d['total_faltantes']
+                        and parciais[chave]['palavras_faltantes'] ==
+                        d['palavras_faltantes'][:resultados_compactos.TOP_FALTANTES]
+                        for chave, d in inicial.items())
+            )
+
+            sem_dict = all(not hasattr(c, '__dict__') for c in resultados)
+            truncado = any(c.total_faltantes > resultados_compactos.TOP_FALTANTES for c in resultados)
+            detalhes_ok = all(
+                len(d['palavras_faltantes']) == c.total_faltantes
+                and tuple(d['palavras_faltantes'][:resultados_compactos.TOP_FALTANTES]) == c.palavras_faltantes
+                for c, d in zip(resultados, detalhes)
+            )
+            mesmos = [(c.arquivo, c.pontuacao, c.palavras_faltantes) for r in compacto.resultados_por_vaga.values()
+                      for c in r['curriculos']] == [(c.arquivo, c.pontuacao, c.palavras_faltantes) for c in resultados]
+
+            if (sem_dict and truncado and detalhes_ok and mesmos and len(resultados) == 8
+                    and df_memoria.drop(columns='data_analise').equals(df_disco.drop(columns='data_analise'))
+                    and curriculos_em_memoria == 2 and compacto.detalhes is None and detalhes_incremental_ok):
+                self.log_result("Resultados compactos", "PASS",
+                                f"{len(resultados)} resultados com até {resultados_compactos.TOP_FALTANTES} "
+                                f"palavras faltantes; listas completas gravadas em disco, também na execução incremental")
+            else:
+                self.log_result("Resultados compactos", "FAIL",
+                                f"sem_dict={sem_dict}, truncado={truncado}, detalhes={detalhes_ok}, "
+                                f"mesmos={mesmos}, curriculos em memória={curriculos_em_memoria}, "
+                                f"detalhes incrementais={detalhes_incremental_ok}")
+
+        except Exception as e:
+            self.log_result("Resultados compactos", "FAIL", f"erro: {e}")
+
+    def test_bounded_memory(self):
+        """Testa se o pico de memória do organizador não cresce com o total de currículos."""
+        print("\n[MEMORIA] Testando Memoria do Organizador em Execucoes Grandes")
+        print("=" * 40)
+
+        try:
+            import random
+            import tempfile
+            import contextlib
+            import tracemalloc
+            from core import ats_organizer
+
+            termos = ("python django flask postgresql docker kubernetes aws terraform redis kafka "
+                      "graphql celery pytest linux nginx rabbitmq elasticsearch grafana").split()
+            curriculos_por_vaga = 150
+
+            def executar(n_vagas):
+                """Duas execuções incrementais (a segunda reaproveita tudo); retorna o pico da segunda."""
+                gerador = random.Random(n_vagas)
+                with tempfile.TemporaryDirectory() as pasta_temp:
+                    pasta_vagas = os.path.join(pasta_temp, 'vagas')
+                    for v in range(n_vagas):
+                        pasta_curriculos = os.path.join(pasta_vagas, f"vaga{v}", 'curriculos')
+                        os.makedirs(pasta_curriculos)
+                        with open(os.path.join(pasta_vagas, f"vaga{v}", 'vaga.txt'), 'w', encoding='utf-8') as f:
+                            f.write("Vaga com " + " ".join(gerador.sample(termos, 10)))
+                        for i in range(curriculos_por_vaga):
+                            with open(os.path.join(pasta_curriculos, f"cv{i}.txt"), 'w', encoding='utf-8') as f:
+                                f.write("Experiência com " + " ".join(gerador.sample(termos, 6)))
+
+                    arquivo = os.path.join(pasta_temp, 'resultados.csv')
+                    for execucao in range(2):
+                        organizer = ats_organizer.ATSOrganizer(pasta_vagas, arquivo_resultados=arquivo,
+                                                               detalhes_em_disco=True)
+                        tracemalloc.start()
+                        with open(os.devnull, 'w', encoding='utf-8') as nulo, contextlib.redirect_stdout(nulo):
+                            organizer.executar_analise_organizada(incremental=True, exportar=True)
+                        pico = tracemalloc.get_traced_memory()[1]
+                        tracemalloc.stop()
+
+                    linhas = len(pd.read_csv(arquivo))
+                    mantidos = max(len(r['curriculos']) for r in organizer.resultados_por_vaga.values())
+                    totais = {r['total_curriculos'] for r in organizer.resultados_por_vaga.values()}
+                return pico, linhas == n_vagas * curriculos_por_vaga and totais == {curriculos_por_vaga}, mantidos
+
+            # Aquece imports e caches antes de medir
+            executar(1)
+            pico_pequeno, completo_pequeno, _ = executar(3)
+            pico_grande, completo_grande, mantidos = executar(12)
+
+            if (completo_pequeno and completo_grande and pico_grande < pico_pequeno * 1.5
+                    and mantidos == ats_organizer.TOP_RELATORIO_EXECUCAO_GRANDE):
+                self.log_result("Memória do organizador", "PASS",
+                                f"pico {pico_pequeno / 1024:.0f} KB com {3 * curriculos_por_vaga} currículos, "
+                                f"{pico_grande / 1024:.0f} KB com {12 * curriculos_por_vaga}")
+            else:
+                self.log_result("Memória do organizador", "FAIL",
+                                f"picos={pico_pequeno}/{pico_grande}, exportação completa={completo_pequeno}/"
+                                f"{completo_grande}, mantidos por vaga={mantidos}")
+
+        except Exception as e:
+            self.log_result("Memória do organizador", "FAIL", f"erro: {e}")
+
+    def test_top_k_ranking(self):
+        """Testa o ranking top K por heap e as estatísticas de uma passada."""
+        print("\n[TOP K] Testando Ranking Top K por Vaga")
+        print("=" * 40)
+
+        try:
+            import io
+            import json
+            import random
+            import tempfile
+            import contextlib
+            import numpy as np
+            from core import ats_organizer, manifesto_ats, ranking_vagas, resultados_compactos
+
+            # Heap contra a ordenação completa (com empates de pontuação)
+            gerador = random.Random(42)
+            resultados = [resultados_compactos.ResultadoCurriculo(f"cv{i:05d}.txt", round(gerador.uniform(0, 100), 1),
+                                                                  [], 100, 40)
+                          for i in range(20_000)]
+            ranking = ranking_vagas.RankingVaga(k=50)
+            for resultado in resultados:
+                ranking.adicionar(resultado)
+            resumo = ranking.resumo()
+            pontuacoes = np.array([r.pontuacao for r in resultados])
+            esperado = sorted(resultados, key=lambda x: (-x.pontuacao, x.arquivo))[:50]
+            percentis_ok = all(resumo['percentis'][p] == np.percentile(pontuacoes, p, method='inverted_cdf')
+                               for p in ranking_vagas.PERCENTIS)
+            heap_ok = (ranking.ranking() == esperado and len(ranking._heap) == 50
+                       and resumo['aprovados'] == int((pontuacoes >= 70).sum()) and percentis_ok)
+
+            # Organizador com --top: só K exportados, manifesto com todos os currículos
+            with tempfile.TemporaryDirectory() as pasta_temp:
+                pasta_curriculos = os.path.join(pasta_temp, 'vagas', 'python', 'curriculos')
+                os.makedirs(pasta_curriculos)
+                with open(os.path.join(pasta_temp, 'vagas', 'python', 'vaga.txt'), 'w', encoding='utf-8') as f:
+                    f.write("Desenvolvedor Python com Django, PostgreSQL, Docker e AWS")
+                termos = ['Python', 'Django', 'PostgreSQL', 'Docker', 'AWS']
+                for i in range(5):
+                    with open(os.path.join(pasta_curriculos, f"cv{i}.txt"), 'w', encoding='utf-8') as f:
+                        f.write("Experiência com " + ", ".join(termos[:i + 1]))
+
+                arquivo = os.path.join(pasta_temp, 'resultados.csv')
+                saidas = []
+                for _ in range(2):
+                    organizer = ats_organizer.ATSOrganizer(os.path.join(pasta_temp, 'vagas'),
+                                                           arquivo_resultados=arquivo, top=2)
+                    saida = io.StringIO()
+                    with contextlib.redirect_stdout(saida):
+                        organizer.executar_analise_organizada(incremental=True, exportar=True)
+                        organizer.gerar_relatorios_por_vaga()
+                    saidas.append(saida.getvalue())
+                df_resultados = pd.read_csv(arquivo)
+                df_resumo = pd.read_csv(ats_organizer.caminho_resumo(arquivo))
+                with open(manifesto_ats.caminho_manifesto(arquivo), 'r', encoding='utf-8') as f:
+                    no_manifesto = len([json.loads(linha) for linha in f][1]['curriculos'])
+
+            organizer_ok = (list(df_resultados['arquivo']) == ['cv4.txt', 'cv3.txt'] and no_manifesto == 5
+                            and "Reaproveitados da análise anterior: 5" in saidas[1]
+                            and "top 2 de 5" in saidas[1] and "cv0.txt" not in saidas[0]
+                            and df_resumo['total'].tolist() == [5] and df_resumo['aprovados'].tolist() == [1])
+
+            # K inválido: recusado pelo ranking, pelo organizador e pela linha de comando
+            invalidos_ok = True
+            for k in (0, -1):
+                for criar in (lambda: ranking_vagas.RankingVaga(k=k), lambda: ats_organizer.ATSOrganizer(top=k)):
+                    try:
+                        criar()
+                        invalidos_ok = False
+                    except ValueError:
+                        pass
+                processo = subprocess.run([sys.executable, 'main.py', 'organizado', '--top', str(k)],
+                                          capture_output=True, text=True, timeout=60)
+                invalidos_ok = invalidos_ok and processo.returncode == 2 and '--top' in processo.stderr
+
+            if heap_ok and organizer_ok and invalidos_ok:
+                self.log_result("Ranking top K", "PASS",
+                                f"top 50 de 20.000 igual à ordenação completa; P50 {resumo['percentis'][50]}%")
+            else:
+                self.log_result("Ranking top K", "FAIL",
+                                f"heap={heap_ok}, percentis={percentis_ok}, arquivos={list(df_resultados['arquivo'])}, "
+                                f"resumo={df_resumo.to_dict('records')}, k inválido recusado={invalidos_ok}")
+
+        except Exception as e:
+            self.log_result("Ranking top K", "FAIL", f"erro: {e}")
+
     def test_dependencies(self):
         """Testa dependências Python."""
         print("\n[DEPENDENCIAS] Testando Dependencias Python")
@@ -661,6 +2168,33 @@ def main():
     tester.test_configurations()
     tester.test_data_files()
     tester.test_document_conversion()
+    tester.test_extraction_cache()
+    tester.test_tokenizer()
+    tester.test_score_matrix()
+    tester.test_inverted_index()
+    tester.test_parallel_ingestion()
+    tester.test_corpus_load_once()
+    tester.test_incremental_analysis()
+    tester.test_compact_vocabulary()
+    tester.test_near_duplicates()
+    tester.test_watch_mode()
+    tester.test_benchmark_suite()
+    tester.test_corpus_generator()
+    tester.test_run_trace()
+    tester.test_lazy_imports()
+    tester.test_async_outbox()
+    tester.test_send_queue()
+    tester.test_send_log()
+    tester.test_send_log_edits()
+    tester.test_sent_index()
+    tester.test_company_matcher()
+    tester.test_spreadsheet_snapshot()
+    tester.test_dashboard_rollups()
+    tester.test_dashboard_live_refresh()
+    tester.test_streaming_export()
+    tester.test_compact_results()
+    tester.test_bounded_memory()
+    tester.test_top_k_ranking()
     tester.test_dependencies()
     tester.test_core_modules()
     tester.test_main_execution()